@@ -8,6 +8,8 @@ import shutil
 import json
 import csv
 import sys
+import threading
+from contextlib import contextmanager
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -68,9 +70,29 @@ def get_persistent_path(relative_path):
         # Fallback to current directory
         return os.path.join(os.getcwd(), relative_path)
 
+class PersistentConnection(sqlite3.Connection):
+    """SQLite connection kept open for the lifetime of a Database instance.
+    
+    Callers keep using ``with db.get_connection() as conn:`` - the context manager
+    still commits or rolls back - but close() is ignored so the shared connection
+    survives. Use release() (via Database.close) to really close it.
+    """
+    
+    def close(self):
+        pass
+    
+    def release(self):
+        super().close()
+
 class Database:
     _instance = None
     _initialized = False
+    _connection = None
+    _thread_connections = threading.local()  # One connection per worker thread
+    _open_thread_connections = set()  # Every live worker connection, released by close()
+    _thread_connections_lock = threading.Lock()
+    _shops_cache = None  # get_all_shops() rows, dropped by invalidate_shop_cache()
+    _shop_ids_cache = None  # shop name -> id over _shops_cache
     
     def __new__(cls, db_path=None):
         """Singleton pattern - ensure only one Database instance exists"""
@@ -115,6 +137,8 @@ class Database:
     @classmethod
     def reset_singleton(cls):
         """Reset singleton instance - useful for testing or after factory reset"""
+        if cls._instance is not None:
+            cls._instance.close()
         cls._instance = None
         cls._initialized = False
     
@@ -131,11 +155,31 @@ class Database:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - perform cleanup"""
-        pass  # No persistent connections to close
+        self.close()
     
     def close(self):
-        """Close database (for compatibility - no persistent connections)"""
-        pass
+        """Close the shared and worker connections - the next get_connection() reopens them"""
+        self.invalidate_shop_cache()
+        if self._connection is not None:
+            self._connection.release()
+            self._connection = None
+        with self._thread_connections_lock:
+            connections = list(self._open_thread_connections)
+            self._open_thread_connections.clear()
+        for conn in connections:
+            conn.release()
+
+    def release_thread_connection(self):
+        """Close the calling worker thread's connection, if it opened one"""
+        conn = getattr(self._thread_connections, 'connection', None)
+        if conn is None:
+            return
+        self._thread_connections.connection = None
+        with self._thread_connections_lock:
+            if conn not in self._open_thread_connections:
+                return  # Already released by close()
+            self._open_thread_connections.discard(conn)
+        conn.release()
 
     def setup_logging(self):
         """Setup logging for database operations"""
@@ -147,8 +191,45 @@ class Database:
         self.logger.addHandler(handler)
 
     def get_connection(self):
-        """Get database connection with foreign key enforcement and WAL mode enabled"""
-        conn = sqlite3.connect(self.db_path, timeout=30.0)  # 30 second timeout
+        """Get the calling thread's persistent connection, opening it on first use"""
+        if threading.current_thread() is threading.main_thread():
+            if self._connection is None:
+                self._connection = self._open_connection()
+            return self._connection
+        # Worker threads get their own connection; it is only ever used by that thread, but
+        # check_same_thread is off so close() can release it from the main thread
+        conn = getattr(self._thread_connections, 'connection', None)
+        if conn is None:
+            conn = self._open_connection(check_same_thread=False)
+            self._thread_connections.connection = conn
+            with self._thread_connections_lock:
+                self._open_thread_connections.add(conn)
+        return conn
+
+    @contextmanager
+    def foreign_keys_disabled(self, conn):
+        """Run a bulk rewrite on conn with foreign key enforcement turned off
+        
+        SQLite ignores PRAGMA foreign_keys inside an open transaction, so the work is
+        committed (or rolled back on error) before enforcement is switched back on -
+        otherwise the connection would stay unenforced for the rest of the session.
+        The pragma only affects conn: worker threads use their own connections and keep
+        enforcement on. Nested get_connection() blocks on the same thread share conn and
+        its transaction, so the commit here also covers any work they left pending.
+        """
+        conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            yield
+            conn.commit()
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.execute("PRAGMA foreign_keys = ON")
+
+    def _open_connection(self, check_same_thread=True):
+        """Open a connection with foreign key enforcement and WAL mode enabled"""
+        conn = sqlite3.connect(self.db_path, timeout=30.0, factory=PersistentConnection,
+                               check_same_thread=check_same_thread)  # 30 second timeout
         conn.execute('PRAGMA foreign_keys = ON')  # CRITICAL: Enable foreign key enforcement
         conn.execute('PRAGMA journal_mode = WAL')  # Enable WAL mode for better concurrency
         conn.execute('PRAGMA synchronous = NORMAL')  # Balanced performance/safety
@@ -222,8 +303,21 @@ class Database:
             self.logger.error(f"Failed to ensure audit tables: {str(e)}")
             raise
 
+    def ensure_indexes(self):
+        """Ensure the indexes behind the inventory filter lookups exist"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_items_category ON items(category)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_items_metal_type ON items(metal_type)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_items_stone_type ON items(stone_type)')
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"Failed to ensure indexes: {str(e)}")
+
     def initialize_database(self):
         """Initialize database tables only if they don't exist"""
+        self.invalidate_shop_cache()
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
@@ -243,6 +337,8 @@ class Database:
                     self.ensure_barcode_sequence_table()
                     # Still ensure audit tables exist (lightweight check)
                     self.ensure_audit_tables()
+                    # Still ensure lookup indexes exist (lightweight check)
+                    self.ensure_indexes()
                     # Still ensure default user exists (lightweight check)
                     self.ensure_default_user()
                     return
@@ -384,6 +480,9 @@ class Database:
                 # Create barcode_sequence table (moved to ensure_barcode_sequence_table)
                 self.ensure_barcode_sequence_table()
 
+                # Create lookup indexes (moved to ensure_indexes)
+                self.ensure_indexes()
+
                 conn.commit()
                 self.logger.info("Database tables created successfully")
                 
@@ -447,6 +546,77 @@ class Database:
             self.logger.error(f"Failed to get items: {str(e)}")
             return []
 
+    def get_inventory_rows(self):
+        """Get all items in get_all_items column order with numeric columns typed and never NULL"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT id, barcode, name, description, category,
+                           CAST(COALESCE(price, 0) AS REAL), CAST(COALESCE(cost, 0) AS REAL),
+                           CAST(COALESCE(weight, 0) AS REAL),
+                           metal_type, stone_type, CAST(COALESCE(stock_quantity, 0) AS INTEGER),
+                           created_at, updated_at
+                    FROM items ORDER BY updated_at DESC, name
+                ''')
+                return cursor.fetchall()
+        except Exception as e:
+            self.logger.error(f"Failed to get inventory rows: {str(e)}")
+            return []
+
+    def get_distinct_filter_values(self):
+        """Get sorted, non-empty distinct categories, metals and stones in one query"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT 0, category FROM items WHERE category <> ''
+                    UNION SELECT 1, metal_type FROM items WHERE metal_type <> ''
+                    UNION SELECT 2, stone_type FROM items WHERE stone_type <> ''
+                    ORDER BY 1, 2
+                ''')
+                values = ([], [], [])
+                for kind, value in cursor.fetchall():
+                    values[kind].append(value)
+                return values
+        except Exception as e:
+            self.logger.error(f"Failed to get filter values: {str(e)}")
+            return [], [], []
+
+    def get_item_ids_by_barcodes(self, barcodes, chunk_size=500):
+        """Map each existing barcode to its item id with one IN query per chunk"""
+        try:
+            id_by_barcode = {}
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                for start in range(0, len(barcodes), chunk_size):
+                    chunk = barcodes[start:start + chunk_size]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(f"SELECT id, barcode FROM items WHERE barcode IN ({placeholders})", chunk)
+                    id_by_barcode.update((barcode, item_id) for item_id, barcode in cursor.fetchall())
+            return id_by_barcode
+        except Exception as e:
+            self.logger.error(f"Failed to get item IDs by barcode: {str(e)}")
+            return {}
+
+    def get_min_stock(self, barcodes, chunk_size=500):
+        """Return the lowest stock_quantity among the given barcodes, or None if none exist"""
+        try:
+            min_stock = None
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                for start in range(0, len(barcodes), chunk_size):
+                    chunk = barcodes[start:start + chunk_size]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(f"SELECT MIN(stock_quantity) FROM items WHERE barcode IN ({placeholders})", chunk)
+                    chunk_min = cursor.fetchone()[0]
+                    if chunk_min is not None and (min_stock is None or chunk_min < min_stock):
+                        min_stock = chunk_min
+            return min_stock
+        except Exception as e:
+            self.logger.error(f"Failed to get minimum stock: {str(e)}")
+            raise
+
     def update_item(self, item_id, **kwargs):
         """Update item details"""
         try:
@@ -540,25 +710,40 @@ class Database:
                 cursor.execute('INSERT INTO shops (name) VALUES (?)', (name,))
                 shop_id = cursor.lastrowid
                 conn.commit()
+                self.invalidate_shop_cache()
                 self.logger.info(f"Added shop: {name} with ID: {shop_id}")
                 return shop_id  # Return shop ID instead of True
         except Exception as e:
             self.logger.error(f"Failed to add shop: {str(e)}")
             return False
 
+    def invalidate_shop_cache(self):
+        """Drop the cached shop list after shops are added, renamed, deleted or replaced"""
+        self._shops_cache = None
+        self._shop_ids_cache = None
+
     def get_all_shops(self):
-        """Get all shops"""
+        """Get all shops, cached until the shops table changes"""
+        if self._shops_cache is not None:
+            return list(self._shops_cache)
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('SELECT * FROM shops ORDER BY name')
-                return cursor.fetchall()
+                self._shops_cache = cursor.fetchall()
+                return list(self._shops_cache)
         except Exception as e:
             self.logger.error(f"Failed to get shops: {str(e)}")
             return []
 
     def get_shop_id(self, shop_name):
         """Get shop ID by name"""
+        if self._shops_cache is not None:
+            if self._shop_ids_cache is None:
+                self._shop_ids_cache = {shop[1]: shop[0] for shop in self._shops_cache}
+            shop_id = self._shop_ids_cache.get(shop_name)
+            if shop_id is not None:
+                return shop_id
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
@@ -607,6 +792,36 @@ class Database:
             self.logger.error(f"Failed to move item to shop: {str(e)}")
             return False
 
+    def move_items_to_shop_bulk(self, shop_id, item_ids, quantity):
+        """Move the same quantity of several items to a shop in a single transaction"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # Add or update shop_items with timestamps
+                cursor.executemany('''
+                    INSERT INTO shop_items (shop_id, item_id, quantity, created_at, updated_at)
+                    VALUES (?, ?, ?, datetime('now', 'localtime'), datetime('now', 'localtime'))
+                    ON CONFLICT(shop_id, item_id) DO UPDATE SET
+                    quantity = quantity + ?,
+                    updated_at = datetime('now', 'localtime')
+                ''', [(shop_id, item_id, quantity, quantity) for item_id in item_ids])
+                
+                # Update main inventory with timestamps
+                cursor.executemany('''
+                    UPDATE items 
+                    SET stock_quantity = stock_quantity - ?,
+                        updated_at = datetime('now', 'localtime')
+                    WHERE id = ?
+                ''', [(quantity, item_id) for item_id in item_ids])
+                
+                conn.commit()
+                self.logger.info(f"Moved {quantity} of each of {len(item_ids)} items to shop {shop_id} in one transaction")
+                return True
+        except Exception as e:
+            self.logger.error(f"Failed to bulk move items to shop: {str(e)}")
+            return False
+
     def remove_item_from_shop(self, barcode, shop_id):
         """Remove item from shop"""
         try:
@@ -983,6 +1198,11 @@ class Database:
             backup_path = Path(backup_dir) / backup_filename
             backup_path.parent.mkdir(parents=True, exist_ok=True)
             
+            # The shared connection keeps recent commits in the WAL file - fold them
+            # into the main database file so the copy is complete
+            with self.get_connection() as conn:
+                conn.execute('PRAGMA wal_checkpoint(FULL)')
+            
             # Create backup
             shutil.copy2(self.db_path, backup_path)
             
@@ -995,9 +1215,8 @@ class Database:
     def restore_backup(self, backup_path):
         """Restore database from backup"""
         try:
-            # Close any existing connections
-            if hasattr(self, '_connection') and self._connection:
-                self._connection.close()
+            # Close the shared connection so the file can be replaced safely
+            self.close()
             
             # Restore backup
             shutil.copy2(backup_path, self.db_path)
@@ -1096,65 +1315,62 @@ class Database:
 
     def import_data(self, import_path, format_type):
         """Import data from file"""
+        self.invalidate_shop_cache()
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Disable foreign key enforcement temporarily during import
-                cursor.execute("PRAGMA foreign_keys = OFF")
-                
-                if format_type == "json":
-                    with open(import_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                with self.foreign_keys_disabled(conn):
+                    if format_type == "json":
+                        with open(import_path, 'r', encoding='utf-8') as f:
+                            data = json.load(f)
                     
-                    # Skip metadata and system tables
-                    tables_to_import = []
-                    for table_name, table_data in data.items():
-                        if table_name.startswith('sqlite_') or table_name == '_metadata':
-                            continue
-                        if 'columns' in table_data and 'data' in table_data:
-                            # New format: table_data has 'data' key
-                            tables_to_import.append((table_name, table_data['columns'], table_data['data']))
-                        elif 'columns' in table_data and 'rows' in table_data:
-                            # Old format: table_data has 'rows' key
-                            tables_to_import.append((table_name, table_data['columns'], table_data['rows']))
+                        # Skip metadata and system tables
+                        tables_to_import = []
+                        for table_name, table_data in data.items():
+                            if table_name.startswith('sqlite_') or table_name == '_metadata':
+                                continue
+                            if 'columns' in table_data and 'data' in table_data:
+                                # New format: table_data has 'data' key
+                                tables_to_import.append((table_name, table_data['columns'], table_data['data']))
+                            elif 'columns' in table_data and 'rows' in table_data:
+                                # Old format: table_data has 'rows' key
+                                tables_to_import.append((table_name, table_data['columns'], table_data['rows']))
                     
-                    # Import tables in order to handle dependencies
-                    table_order = ['users', 'shops', 'items', 'shop_items', 'sales', 'custom_values']
+                        # Import tables in order to handle dependencies
+                        table_order = ['users', 'shops', 'items', 'shop_items', 'sales', 'custom_values']
                     
-                    # Import known tables first
-                    for table_name in table_order:
-                        for import_table_name, columns, rows in tables_to_import:
-                            if import_table_name == table_name:
-                                self._import_table_data(cursor, table_name, columns, rows)
-                                break
+                        # Import known tables first
+                        for table_name in table_order:
+                            for import_table_name, columns, rows in tables_to_import:
+                                if import_table_name == table_name:
+                                    self._import_table_data(cursor, table_name, columns, rows)
+                                    break
                     
-                    # Import remaining tables
-                    imported_tables = set(table_order)
-                    for table_name, columns, rows in tables_to_import:
-                        if table_name not in imported_tables:
-                            self._import_table_data(cursor, table_name, columns, rows)
+                        # Import remaining tables
+                        imported_tables = set(table_order)
+                        for table_name, columns, rows in tables_to_import:
+                            if table_name not in imported_tables:
+                                self._import_table_data(cursor, table_name, columns, rows)
                 
-                elif format_type == "csv":
-                    # Handle CSV import for each table
-                    for csv_file in Path(import_path).parent.glob(f"*_{Path(import_path).name}"):
-                        table_name = csv_file.stem.split('_')[0]
+                    elif format_type == "csv":
+                        # Handle CSV import for each table
+                        for csv_file in Path(import_path).parent.glob(f"*_{Path(import_path).name}"):
+                            table_name = csv_file.stem.split('_')[0]
                         
-                        # Skip system tables
-                        if table_name.startswith('sqlite_'):
-                            continue
+                            # Skip system tables
+                            if table_name.startswith('sqlite_'):
+                                continue
                             
-                        with open(csv_file, 'r', encoding='utf-8') as f:
-                            reader = csv.DictReader(f)
-                            columns = reader.fieldnames
+                            with open(csv_file, 'r', encoding='utf-8') as f:
+                                reader = csv.DictReader(f)
+                                columns = reader.fieldnames
                             
-                            if columns:
-                                rows = list(reader)
-                                self._import_table_data(cursor, table_name, columns, rows)
-                
-                # Re-enable foreign key enforcement
-                cursor.execute("PRAGMA foreign_keys = ON")
-                conn.commit()
+                                if columns:
+                                    rows = list(reader)
+                                    self._import_table_data(cursor, table_name, columns, rows)
+
                 self.logger.info(f"Data imported from: {import_path}")
                 return True
                 
@@ -1222,6 +1438,7 @@ class Database:
                     return False
                 
                 conn.commit()
+                self.invalidate_shop_cache()
                 self.logger.info(f"Renamed shop from '{old_name}' to '{new_name}'")
                 return True
         except Exception as e:
@@ -1249,6 +1466,7 @@ class Database:
                 cursor.execute('DELETE FROM shops WHERE id = ?', (shop_id,))
                 
                 conn.commit()
+                self.invalidate_shop_cache()
                 self.logger.info(f"Deleted shop: {shop_name}")
                 return True
         except Exception as e:
@@ -1340,7 +1558,6 @@ class Database:
     def __del__(self):
         """Cleanup database connections"""
         try:
-            if hasattr(self, '_connection') and self._connection:
-                self._connection.close()
+            self.close()
         except Exception as e:
             self.logger.error(f"Error closing database connection: {e}")
\ No newline at end of file
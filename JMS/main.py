@@ -10,9 +10,16 @@ import logging
 import traceback
 import shutil
 import hashlib
+import html
 import base64
 import io
 import ctypes
+import functools
+import bisect
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from abc import ABC, abstractmethod
@@ -44,7 +51,7 @@ from PyQt6.QtWidgets import (
     QStyledItemDelegate, QStackedWidget, QDateEdit, QListWidget,
     QProgressBar
 )
-from PyQt6.QtCore import Qt, QSize, QRect, QPoint, QRegularExpression, QByteArray, QBuffer, QIODevice, pyqtSignal, QTimer, QDate, QObject, QFileSystemWatcher
+from PyQt6.QtCore import Qt, QSize, QRect, QPoint, QRegularExpression, QByteArray, QBuffer, QIODevice, pyqtSignal, pyqtSlot, QSignalBlocker, QTimer, QThread, QEvent, QDate, QObject, QFileSystemWatcher, QStringListModel
 from PyQt6.QtGui import (
     QPixmap, QImage, QFont, QIcon, QColor, QPalette, QRegularExpressionValidator,
     QPainter, QPen, QBrush, QFontMetrics, QKeySequence, QShortcut
@@ -60,7 +67,9 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import Paragraph
+from reportlab.platypus import Paragraph, LongTable
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -766,6 +775,16 @@ def format_time_for_display(dt):
         return ""
     return dt.strftime("%H:%M:%S")
 
+def date_key(dt):
+    """Return a datetime's date as a yyyymmdd integer for cheap range comparisons, or 0"""
+    if not dt:
+        return 0
+    return dt.year * 10000 + dt.month * 100 + dt.day
+
+def qdate_key(qdate):
+    """Return a QDate as a yyyymmdd integer comparable with date_key"""
+    return qdate.year() * 10000 + qdate.month() * 100 + qdate.day()
+
 def format_datetime_for_database(dt=None):
     """Format datetime for database storage using system timezone"""
     from datetime import datetime as dt_class
@@ -774,6 +793,222 @@ def format_datetime_for_database(dt=None):
     # Store as local time in database for consistency
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
+# Number formatting utilities (called once per table cell, so memoized)
+@functools.lru_cache(maxsize=4096)
+def format_int_with_spaces(number):
+    """Format an integer with spaces every 3 digits"""
+    return f"{number:,}".replace(",", " ")
+
+@functools.lru_cache(maxsize=4096)
+def format_grams_int(grams):
+    """Format whole grams as kg and grams with spaces"""
+    kg, g = divmod(grams, 1000)
+    if kg > 0:
+        if g > 0:
+            return f"{format_int_with_spaces(kg)}kg {format_int_with_spaces(g)}g"
+        return f"{format_int_with_spaces(kg)}kg"
+    return f"{format_int_with_spaces(g)}g"
+
+_WEIGHT_RE = re.compile(r'^(?:(\d+)kg)?(?:(\d+)g)?$')
+
+@functools.lru_cache(maxsize=1024)
+def parse_grams_text(weight_text):
+    """Parse a format_grams_int string back to whole grams"""
+    m = _WEIGHT_RE.match(weight_text.replace(" ", ""))
+    if not m:
+        return 0
+    return int(m.group(1) or 0) * 1000 + int(m.group(2) or 0)
+
+# Inventory filter combo labels, shared by the widgets, search_items and the reset paths
+ALL_CATEGORIES_TEXT = "Всички категории"
+ALL_METALS_TEXT = "Всички метали"
+ALL_STONES_TEXT = "Всички камъни"
+STOCK_ALL, STOCK_AVAILABLE, STOCK_LOW, STOCK_NONE = (
+    "Всички", "С количество", "Малко количество (≤5)", "Без количество"
+)
+
+# (database column, EditItemDialog.get_data() key) pairs saved by an inventory edit;
+# the item name mirrors its category
+ITEM_EDIT_FIELDS = (
+    ('name', 'category'), ('description', 'description'), ('category', 'category'),
+    ('price', 'price'), ('cost', 'cost'), ('weight', 'weight'),
+    ('metal_type', 'metal'), ('stone_type', 'stone'), ('stock_quantity', 'stock'),
+)
+
+# Header row of the selected-items Excel export, in inventory table column order
+SELECTED_EXPORT_HEADERS = (
+    "Баркод", "Категория", "Метал", "Камък", "Описание",
+    "Цена на едро (€)", "Цена (€)", "Тегло (г)", "Количество", "Дата", "Час",
+)
+
+# Data rows per sheet of the warehouse and shop Excel exports
+EXCEL_SHEET_ROWS = 250000
+
+# Header row of the warehouse and shop Excel exports
+EXCEL_EXPORT_HEADERS = (
+    'Баркод', 'Име', 'Описание', 'Категория', 'Цена (лв)', 'Цена на едро (лв)',
+    'Тегло (г)', 'Метал', 'Камък', 'Количество',
+)
+
+# Currency utilities
+EUR_TO_LEV_RATE = 1.95583  # Fixed BGN/EUR peg
+
+@functools.lru_cache(maxsize=4096)
+def format_eur_amount(amount):
+    """Format amount as Euro currency with thousands separators"""
+    return f"{amount:,.2f} €".replace(",", " ")
+
+@functools.lru_cache(maxsize=4096)
+def format_lev_amount(amount):
+    """Format amount as Lev currency with thousands separators"""
+    return f"{amount:,.2f} лв".replace(",", " ")
+
+_EUR_NUM_RE = re.compile(r'\s*(-?\d[\d ]*(?:[.,]\d+)?)')
+
+@functools.lru_cache(maxsize=4096)
+def parse_eur_cell(cell_text):
+    """Parse the Euro amount from the first line of a dual-currency cell"""
+    m = _EUR_NUM_RE.match(cell_text)
+    if not m:
+        raise ValueError(f"could not convert string to float: {cell_text!r}")
+    return float(m.group(1).replace(" ", "").replace(",", "."))
+
+def parse_number_or_none(text, convert, default):
+    """Convert cell text with convert(); default for empty text, None if it is not a valid number"""
+    if not text:
+        return default
+    try:
+        return convert(text)
+    except ValueError:
+        return None
+
+@functools.lru_cache(maxsize=4096)
+def dual_currency_text(euro_amount):
+    """Format a Euro amount as the two-line Euro/Lev table cell text"""
+    return f"{euro_amount:.2f} €\n{round(euro_amount * EUR_TO_LEV_RATE, 2):.2f} лв"
+
+@functools.lru_cache(maxsize=None)
+def register_cyrillic_fonts():
+    """Register a Cyrillic-capable TTF with ReportLab once; returns (regular, bold) font names"""
+    font_paths = [
+        "fonts/arial.ttf",  # Our project font
+        "C:/Windows/Fonts/arial.ttf",  # Windows system font
+        "C:/Windows/Fonts/calibri.ttf",  # Alternative Windows font
+        "/System/Library/Fonts/Arial.ttf",  # macOS system font
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"  # Linux font
+    ]
+    for font_path in font_paths:
+        if os.path.exists(font_path):
+            try:
+                pdfmetrics.registerFont(TTFont('CyrillicFont', font_path))
+                pdfmetrics.registerFont(TTFont('CyrillicFont-Bold', font_path))  # Use same font for bold
+                return 'CyrillicFont', 'CyrillicFont-Bold'
+            except Exception:
+                continue
+    # Fallback to built-in font (may not display Cyrillic properly)
+    return 'Helvetica', 'Helvetica-Bold'
+
+EXPORT_WRITE_BUFFER = 1 << 20  # 1 MB file buffer - the ZIP writer issues many small writes
+
+def save_workbook(workbook, filename, compress=True):
+    """Save an openpyxl workbook through a large write buffer; compress=False stores the XLSX parts without deflate"""
+    with open(filename, 'wb', buffering=EXPORT_WRITE_BUFFER) as file:
+        if compress:
+            workbook.save(file)
+            return
+        from openpyxl.writer.excel import ExcelWriter
+        if workbook.write_only and not workbook.worksheets:
+            workbook.create_sheet()
+        archive = zipfile.ZipFile(file, 'w', zipfile.ZIP_STORED, allowZip64=True)
+        ExcelWriter(workbook, archive).save()  # Writes every part and closes the archive
+
+def truncate_text(value, limit):
+    """Text of value cut to limit characters plus an ellipsis; empty for empty values"""
+    text = str(value) if value else ""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+# Export filename utilities
+# Translation dictionary for common terms only (no shop names)
+_BG_TERM_TRANSLATIONS = {
+    # System terms
+    "warehouse": "склад",
+    "shop": "магазин",
+    "audit": "инвентаризация",
+    "selected_items": "избрани_артикули",
+    "analysis": "анализ",
+    "missing_items": "липсващи_артикули",
+    "missing items": "липсващи_артикули",
+    "export": "експорт",
+    "report": "доклад",
+    "items": "артикули",
+    "products": "продукти",
+    "inventory": "инвентар",
+    "database_export": "експорт_база_данни",
+    "complete_export": "пълен_експорт",
+    # Analysis types
+    "price analysis": "анализ_цени",
+    "category analysis": "анализ_категории"
+}
+# Common Bulgarian address abbreviations, expanded in this order
+_BG_ABBREV = (
+    ("бул.", "булевард"),
+    ("ул.", "улица"),
+    ("пл.", "площад"),
+    ("кв.", "квартал"),
+    ("ж.к.", "жилищен_комплекс"),
+)
+_BG_NONWORD_RE = re.compile(r'[^\w\u0400-\u04FF]')  # Keep Cyrillic and Latin letters
+_BG_DUP_US_RE = re.compile(r'_+')
+
+@functools.lru_cache(maxsize=256)
+def bulgarian_filename_stem(base_name):
+    """Convert a base name to the Bulgarian snake_case stem used for export filenames"""
+    clean_name = base_name.lower().strip()
+    
+    # Check if it's a known system term
+    bg_name = _BG_TERM_TRANSLATIONS.get(clean_name)
+    if bg_name is not None:
+        return bg_name
+    
+    # Dynamic processing for any shop name or custom term
+    bg_name = clean_name
+    for abbrev, full in _BG_ABBREV:
+        bg_name = bg_name.replace(abbrev, full)
+    
+    # Convert to snake_case: replace spaces, dots, slashes, etc.
+    # Names that are already single-underscore identifiers need neither regex pass
+    if not bg_name.isidentifier() or '__' in bg_name:
+        bg_name = _BG_NONWORD_RE.sub('_', bg_name)
+        bg_name = _BG_DUP_US_RE.sub('_', bg_name)  # Remove multiple underscores
+    bg_name = bg_name.strip('_')  # Remove leading/trailing underscores
+    
+    # Smart prefix handling - avoid duplication
+    has_audit_prefix = bg_name.startswith('инвентаризация') or clean_name.startswith('инвентаризация')
+    has_shop_prefix = bg_name.startswith('магазин') or clean_name.startswith('магазин')
+    
+    # Add audit prefix if needed
+    if (clean_name.startswith('инвентаризация') or 'audit' in clean_name) and not has_audit_prefix:
+        bg_name = f"инвентаризация_{bg_name}"
+    # Add shop prefix if needed
+    elif ('магазин' in clean_name or 'shop' in clean_name) and not has_shop_prefix and not has_audit_prefix:
+        bg_name = f"магазин_{bg_name}"
+    return bg_name
+
+# Search utilities
+def fold_search_text(text):
+    """Case-fold text for case-insensitive search (Cyrillic and Latin)"""
+    return text.casefold()
+
+# [timestamp, "DD.MM.YYYY"] - reformatted at most once per second
+_date_cache = [0.0, ""]
+
+def current_filename_date():
+    """Return today's date as DD.MM.YYYY for export filenames"""
+    now = time.time()
+    if now - _date_cache[0] > 1.0:
+        _date_cache[:] = [now, datetime.now().strftime("%d.%m.%Y")]
+    return _date_cache[1]
+
 class LoginWindow(QWidget):
     def __init__(self, parent=None, database=None):
         super().__init__(parent)
@@ -1085,18 +1320,17 @@ class LoginWindow(QWidget):
             QMessageBox.critical(self, "Грешка", f"Грешка при показване на диалога за възстановяване: {str(e)}")
 
 class PrinterHandler:
-    def __init__(self):
-        # Citizen CLP-631 specifications
-        self.printer_dpi = 300  # CLP-631 is exactly 300 DPI
-        self.mm_to_px = self.printer_dpi / 25.4  # 11.811 pixels per mm
-        
-        # Your label size: 1cm x 4.3cm
-        self.label_width_mm = 43.0   # 4.3cm
-        self.label_height_mm = 10.0  # 1cm
-        
-        # Calculate exact pixel dimensions
-        self.label_width = int(self.label_width_mm * self.mm_to_px)   # ~508 pixels
-        self.label_height = int(self.label_height_mm * self.mm_to_px) # ~118 pixels
+    # Citizen CLP-631 specifications
+    printer_dpi = 300  # CLP-631 is exactly 300 DPI
+    mm_to_px = printer_dpi / 25.4  # 11.811 pixels per mm
+    
+    # Your label size: 1cm x 4.3cm
+    label_width_mm = 43.0   # 4.3cm
+    label_height_mm = 10.0  # 1cm
+    
+    # Calculate exact pixel dimensions
+    label_width = int(label_width_mm * mm_to_px)   # ~508 pixels
+    label_height = int(label_height_mm * mm_to_px) # ~118 pixels
 
     def optimize_for_thermal_transfer(self, label_image):
         """Optimize image specifically for Citizen CLP-631 thermal transfer printing"""
@@ -1235,12 +1469,47 @@ class PrinterHandler:
 
 # Continue with MainWindow class next...
 
+class ExportWorker(QObject):
+    """Runs file export jobs on a background thread"""
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+    def __init__(self, jobs, success_message):
+        super().__init__()
+        self.jobs = jobs
+        self.success_message = success_message
+
+    @pyqtSlot()
+    def run(self):
+        """Run the jobs side by side (e.g. Excel and PDF) and report once all of them are done"""
+        try:
+            if len(self.jobs) == 1:
+                self.run_job(self.jobs[0])
+            else:
+                with ThreadPoolExecutor(max_workers=len(self.jobs)) as executor:
+                    for future in [executor.submit(self.run_job, job) for job in self.jobs]:
+                        future.result()  # Re-raises the job's exception
+        except Exception as e:
+            logger.error(f"Export failed: {e}", exc_info=True)
+            self.error.emit(str(e))
+        else:
+            self.finished.emit(self.success_message)
+
+    @staticmethod
+    def run_job(job):
+        """Run one export job and close any database connection its thread opened"""
+        try:
+            job()
+        finally:
+            Database().release_thread_connection()
+
+
 class ExportFormatDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Избор на формат за експорт")
         self.setModal(True)
-        self.setFixedSize(300, 150)
+        self.setFixedSize(300, 180)
         
         # Set dialog icon
         try:
@@ -1265,7 +1534,12 @@ class ExportFormatDialog(QDialog):
         self.excel_checkbox.setChecked(True)
         self.pdf_checkbox.setChecked(True)
         
+        # Storing the XLSX parts uncompressed saves large exports much faster (bigger file)
+        self.fast_excel_checkbox = QCheckBox("Бърз Excel запис (без компресия)")
+        self.fast_excel_checkbox.setStyleSheet("margin-left: 20px;")
+        
         layout.addWidget(self.excel_checkbox)
+        layout.addWidget(self.fast_excel_checkbox)
         layout.addWidget(self.pdf_checkbox)
         
         # Buttons
@@ -1287,6 +1561,7 @@ class ExportFormatDialog(QDialog):
         
         # Connect checkbox changes to validation
         self.excel_checkbox.toggled.connect(self.validate_selection)
+        self.excel_checkbox.toggled.connect(self.fast_excel_checkbox.setEnabled)
         self.pdf_checkbox.toggled.connect(self.validate_selection)
         
         # Initial validation
@@ -1312,6 +1587,10 @@ class ExportFormatDialog(QDialog):
     def get_selections(self):
         """Return tuple of (excel_selected, pdf_selected)"""
         return (self.excel_checkbox.isChecked(), self.pdf_checkbox.isChecked())
+    
+    def get_excel_compression(self):
+        """Return False when the Excel file should be saved without ZIP compression"""
+        return not self.fast_excel_checkbox.isChecked()
 
 class EditItemDialog(QDialog):
     def __init__(self, parent, barcode, category, description, price, cost, weight, metal, stone, stock, from_warehouse=False):
@@ -1335,7 +1614,7 @@ class EditItemDialog(QDialog):
         self.setFixedSize(500, 550)
         
         # Currency conversion rate (fixed)
-        self.EUR_TO_LEV_RATE = 1.95583
+        self.EUR_TO_LEV_RATE = EUR_TO_LEV_RATE
         
         # Store original barcode for reference
         self.original_barcode = barcode
@@ -1485,7 +1764,7 @@ class EditItemDialog(QDialog):
     
     def format_currency_lev(self, amount):
         """Format amount as Lev currency with thousands separators"""
-        return f"{amount:,.2f} лв".replace(",", " ")
+        return format_lev_amount(amount)
     
     def update_lev_price(self):
         """Update Lev price when Euro price changes"""
@@ -1552,38 +1831,36 @@ class EditItemDialog(QDialog):
                 scroll_widget = QWidget()
                 scroll_layout = QVBoxLayout(scroll_widget)
                 
-                total_in_shops = 0
-                for location in shop_locations:
-                    shop_name = location['shop_name']
-                    quantity = location['quantity']
-                    updated_at = location['updated_at']
-                    total_in_shops += quantity
-                    
-                    # Format the updated date
+                def format_updated(updated_at):
                     try:
-                        from datetime import datetime
                         if updated_at:
-                            updated_date = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                            formatted_date = updated_date.strftime('%d.%m.%Y %H:%M')
-                        else:
-                            formatted_date = "Неизвестно"
-                    except:
-                        formatted_date = "Неизвестно"
-                    
-                    # Create location info label
-                    location_label = QLabel(f"📍 {shop_name}: {quantity} бр. (обновено: {formatted_date})")
-                    location_label.setStyleSheet("""
-                        QLabel {
-                            background-color: #f8f9fa;
-                            border: 1px solid #dee2e6;
-                            border-radius: 3px;
-                            padding: 5px;
-                            margin: 2px 0;
-                            font-size: 11px;
-                            color: #212529;
-                        }
-                    """)
-                    scroll_layout.addWidget(location_label)
+                            return datetime.fromisoformat(updated_at.replace('Z', '+00:00')).strftime('%d.%m.%Y %H:%M')
+                    except (ValueError, AttributeError):
+                        pass
+                    return "Неизвестно"
+                
+                # Build the location rows as data first, then create a single label for all of them
+                total_in_shops = sum(location['quantity'] for location in shop_locations)
+                rows_html = "".join(
+                    f"<div>📍 {html.escape(str(location['shop_name']))}: {location['quantity']} бр. "
+                    f"(обновено: {format_updated(location['updated_at'])})</div>"
+                    for location in shop_locations
+                )
+                
+                locations_label = QLabel(rows_html)
+                locations_label.setTextFormat(Qt.TextFormat.RichText)
+                locations_label.setStyleSheet("""
+                    QLabel {
+                        background-color: #f8f9fa;
+                        border: 1px solid #dee2e6;
+                        border-radius: 3px;
+                        padding: 5px;
+                        margin: 2px 0;
+                        font-size: 11px;
+                        color: #212529;
+                    }
+                """)
+                scroll_layout.addWidget(locations_label)
                 
                 # Add summary
                 summary_label = QLabel(f"📊 Общо в магазини: {total_in_shops} бр.")
@@ -1704,6 +1981,41 @@ class MainWindow(QMainWindow):
         # Flag to prevent concurrent shop inventory loading
         self.shop_inventory_loading = False
         
+        # Dirty flags - database statistics and the backup list are only recomputed
+        # when something changed since they were last shown
+        self._db_stats_dirty = True
+        self._backup_list_dirty = True
+        
+        # Parsed source values for each inventory table row, indexed by the
+        # barcode cell's UserRole so lookups survive column sorting
+        self.inventory_records = []
+        self._filter_cols = self.build_filter_columns([])
+        self._inventory_view_state = None
+        self._last_search_summary = None  # (visible rows, price, weight, items) of the last search_items
+        self._search_corpus = ("", [])
+        
+        # Currency conversion rate (fixed)
+        self.EUR_TO_LEV_RATE = EUR_TO_LEV_RATE
+        
+        # Rendered label previews keyed by everything drawn on the label
+        self._label_preview_cache = {}
+        
+        # Bulk price dialog widgets, built on first use by build_bulk_price_dialog()
+        self._bulk_price_dialog = None
+        
+        # Background export in progress: (QThread, ExportWorker) or None
+        self._export_job = None
+        
+        # Refreshes requested inside defer_refresh() blocks, run once when the outermost block exits
+        self._refresh_depth = 0
+        self._pending_refresh = set()
+        
+        # (records, needle, matching indices) of the last general search
+        self._search_match_cache = (None, "", set())
+        
+        # Widgets watched by eventFilter, mapped to (role, owning spin box)
+        self._event_filter_roles = {}
+        
         # Initialize audit state variables
         self.audit_in_progress = False
         self.audit_shop_id = None
@@ -1765,9 +2077,10 @@ class MainWindow(QMainWindow):
     def on_backup_directory_changed(self):
         """Handle backup directory changes (files added/removed externally)"""
         try:
-            # Refresh the backup list when directory changes
-            self.load_backup_list()
-            logger.info("Backup list refreshed due to directory change")
+            # Backup files and the last backup time changed; reload them on the next visit
+            self.mark_backup_list_dirty()
+            self.mark_database_stats_dirty()
+            logger.info("Backup list marked for refresh due to directory change")
         except Exception as e:
             logger.error(f"Error handling backup directory change: {e}")
 
@@ -1834,6 +2147,7 @@ class MainWindow(QMainWindow):
                 cursor.execute("SELECT COUNT(*) FROM shops")
                 if cursor.fetchone()[0] == 0:
                     cursor.execute("INSERT INTO shops (name) VALUES (?)", ("Магазин 1",))
+                    self.db.invalidate_shop_cache()
                     logger.info("Created default shop 'Магазин 1'")
                 
                 conn.commit()
@@ -1900,10 +2214,18 @@ class MainWindow(QMainWindow):
         self.tabs.addTab(self.create_inventory_tab(), "Склад")
         self.tabs.addTab(self.create_shop_loading_tab(), "Зареждане на магазин")
         self.tabs.addTab(self.create_sales_tab(), "Продажби")
-        self.tabs.addTab(self.create_reports_tab(), "Отчети")
-        self.tabs.addTab(self.create_audit_tab(), "Инвентаризация")
-        self.tabs.addTab(self.create_database_tab(), "База данни")
-        self.tabs.addTab(self.create_help_tab(), "Помощ")
+        
+        # Tabs outside the everyday workflow start as empty placeholders and are
+        # built the first time they are opened (see build_lazy_tab)
+        self.lazy_tab_factories = {}
+        for factory, title in (
+            (self.create_reports_tab, "Отчети"),
+            (self.create_audit_tab, "Инвентаризация"),
+            (self.create_database_tab, "База данни"),
+            (self.create_help_tab, "Помощ"),
+        ):
+            index = self.tabs.addTab(QWidget(), title)
+            self.lazy_tab_factories[index] = factory
         
         # Connect tab change to set focus appropriately
         self.tabs.currentChanged.connect(self.on_tab_changed)
@@ -1911,25 +2233,54 @@ class MainWindow(QMainWindow):
         # Set up keyboard shortcuts for tab navigation
         self.setup_tab_shortcuts()
 
+    def build_lazy_tab(self, index):
+        """Replace a placeholder tab with its real content on first activation"""
+        factory = self.lazy_tab_factories.pop(index, None)
+        if factory is None:
+            return False
+        
+        title = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+        
+        # Block signals so swapping the widget doesn't re-enter on_tab_changed
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, factory(), title)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        
+        placeholder.deleteLater()
+        logger.info(f"Built tab '{title}' on first use")
+        return True
+
     def on_tab_changed(self, index):
         """Handle tab change events"""
         try:
+            # Build deferred tabs on first visit - their factories load fresh data themselves
+            if index in self.lazy_tab_factories:
+                self.build_lazy_tab(index)
+                return
+            
             # Get the tab text to identify which tab was selected
             tab_text = self.tabs.tabText(index)
             
             # Set focus to barcode input when sales tab is selected
             if tab_text == "Продажби" and hasattr(self, 'sale_barcode_input'):
                 # Use QTimer to ensure focus is set after tab switch is complete
-                from PyQt6.QtCore import QTimer
-                QTimer.singleShot(100, lambda: self.sale_barcode_input.setFocus())
+                QTimer.singleShot(100, self.sale_barcode_input.setFocus)
             
             # Update statistics when switching to Reports or Database tabs
             elif tab_text == "Отчети":
-                self.update_reports_and_database_stats()
+                if hasattr(self, 'stats_cards'):
+                    self.update_dashboard_stats()
             elif tab_text == "База данни":
-                # Force immediate update of database statistics
-                self.update_database_statistics()
-                self.load_backup_list()
+                # Only recompute what changed since the tab was last shown
+                if self._db_stats_dirty:
+                    self.update_database_statistics()
+                if self._backup_list_dirty:
+                    self.load_backup_list()
             
         except Exception as e:
             # Ignore errors in tab change handling
@@ -2145,16 +2496,41 @@ class MainWindow(QMainWindow):
                 # Update label with both unique items and total quantity
                 if unique_items == 0:
                     self.shop_inventory_info_label.setText("Налични артикули в магазин: 0")
-                    self.shop_inventory_info_label.setStyleSheet("color: #f44336; font-weight: bold;")  # Red for empty
+                    self.set_label_state(self.shop_inventory_info_label, "empty")  # Red for empty
                 else:
                     self.shop_inventory_info_label.setText(f"Налични артикули в магазин: {unique_items} вида ({total_quantity} бр.)")
-                    self.shop_inventory_info_label.setStyleSheet("color: #4CAF50; font-weight: bold;")  # Green for available
+                    self.set_label_state(self.shop_inventory_info_label, "ok")  # Green for available
                     
         except Exception as e:
             logger.error(f"Error updating shop inventory info: {e}")
             if hasattr(self, 'shop_inventory_info_label'):
                 self.shop_inventory_info_label.setText("Налични артикули в магазин: ? (грешка)")
 
+    def set_label_state(self, label, state):
+        """Switch a label between its stylesheet state variants without re-applying QSS"""
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
+
+    def is_database_tab_visible(self):
+        """Check whether the database tab is the currently shown tab"""
+        return hasattr(self, 'tabs') and self.tabs.tabText(self.tabs.currentIndex()) == "База данни"
+
+    def mark_database_stats_dirty(self):
+        """Flag the database statistics as stale; recomputed now only if their tab is shown"""
+        self._db_stats_dirty = True
+        if hasattr(self, 'db_stats_cards') and self.is_database_tab_visible():
+            self.update_database_statistics()
+
+    def mark_backup_list_dirty(self):
+        """Flag the backup list as stale; reloaded now only if the database tab is shown"""
+        self._backup_list_dirty = True
+        if hasattr(self, 'backup_list') and self.is_database_tab_visible():
+            self.load_backup_list()
+
     def update_reports_and_database_stats(self):
         """Update both reports dashboard and database statistics"""
         try:
@@ -2162,12 +2538,10 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'stats_cards'):
                 self.update_dashboard_stats()
             
-            # Update database statistics if it exists
-            if hasattr(self, 'db_stats_cards'):
-                self.update_database_statistics()
-            
-            # Also update backup list if we're on database tab
-            if hasattr(self, 'backup_list'):
+            # Database statistics and backup list are refreshed right away only if
+            # their tab is on screen, otherwise on_tab_changed picks them up
+            self.mark_database_stats_dirty()
+            if self._backup_list_dirty and hasattr(self, 'backup_list') and self.is_database_tab_visible():
                 self.load_backup_list()
                 
         except Exception as e:
@@ -2186,38 +2560,21 @@ class MainWindow(QMainWindow):
         form_group = QGroupBox("Добави артикул")
         form_layout = QFormLayout()
 
-        # Currency conversion rate (fixed)
-        self.EUR_TO_LEV_RATE = 1.95583
-        
         # Initialize all input widgets
         self.barcode_input = QLineEdit()
         self.barcode_input.setReadOnly(True)  # Make barcode readonly
         
         # Price input in Euro
-        self.price_input = BlurOnEnterDoubleSpinBox()
-        self.price_input.setRange(0, 1000000)
-        self.price_input.setDecimals(2)
-        self.price_input.setSuffix(" €")
+        self.price_input = self.make_spin_box('add_item_spin', 1000000, decimals=2, suffix=" €")
         self.price_input.valueChanged.connect(self.update_lev_price)
-        # Auto-select all text when clicked
-        self.price_input.lineEdit().installEventFilter(self)
         
         # Price display in Lev (read-only)
         self.price_lev_label = QLabel("0.00 лв")
         self.price_lev_label.setStyleSheet("font-weight: bold; color: #2196F3; padding: 5px; background-color: #f0f8ff; border-radius: 3px;")
         
-        self.weight_input = BlurOnEnterDoubleSpinBox()
-        self.weight_input.setRange(0, 1000)
-        self.weight_input.setDecimals(2)
-        # Auto-select all text when clicked
-        self.weight_input.lineEdit().installEventFilter(self)
-        # Blur on Enter key press
+        self.weight_input = self.make_spin_box('add_item_spin', 1000, decimals=2)
         
-        self.stock_input = BlurOnEnterSpinBox()
-        self.stock_input.setRange(0, 10000)
-        # Auto-select all text when clicked
-        self.stock_input.lineEdit().installEventFilter(self)
-        # Blur on Enter key press
+        self.stock_input = self.make_spin_box('add_item_spin', 10000, spin_class=BlurOnEnterSpinBox)
         
         # Description - Auto-resizing text area with word wrap
         self.description_input = QTextEdit()
@@ -2240,22 +2597,15 @@ class MainWindow(QMainWindow):
         
         # Set initial size
         self.description_input.setFixedHeight(self.desc_min_height)
+        self._last_desc_h = self.desc_min_height
         
         self.category_input = QComboBox()
         self.category_input.setItemDelegate(self.combo_delegate)
         self.category_input.addItems(["Пръстен", "Гривна", "Обеци", "Синджир", "Друго"])
-        self.category_input.currentTextChanged.connect(
-            lambda text: self.handle_custom_input(self.category_input, self.custom_categories, text)
-        )
+        self.category_input.currentTextChanged.connect(self.on_custom_combo_text_changed)
         # Cost input in Euro  
-        self.cost_input = BlurOnEnterDoubleSpinBox()
-        self.cost_input.setRange(0, 1000000)
-        self.cost_input.setDecimals(2)
-        self.cost_input.setSuffix(" €")
+        self.cost_input = self.make_spin_box('add_item_spin', 1000000, decimals=2, suffix=" €")
         self.cost_input.valueChanged.connect(self.update_lev_cost)
-        # Auto-select all text when clicked
-        self.cost_input.lineEdit().installEventFilter(self)
-        # Blur on Enter key press
         
         # Cost display in Lev (read-only)
         self.cost_lev_label = QLabel("0.00 лв")
@@ -2265,16 +2615,12 @@ class MainWindow(QMainWindow):
         self.metal_input.setItemDelegate(self.combo_delegate)
         self.metal_input.addItems(["Злато", "Сребро", "Платина", "Друго"])
         self.metal_input.setCurrentIndex(1)  # Set default to Сребро (index 1)
-        self.metal_input.currentTextChanged.connect(
-            lambda text: self.handle_custom_input(self.metal_input, self.custom_metals, text)
-        )
+        self.metal_input.currentTextChanged.connect(self.on_custom_combo_text_changed)
         self.stone_input = QComboBox()
         self.stone_input.setItemDelegate(self.combo_delegate)
         self.stone_input.addItems(["Диамант", "Рубин", "Сапфир", "Смарагд", "Без камък", "Друго"])
         self.stone_input.setCurrentIndex(4)  # Set default to Без камък (index 4)
-        self.stone_input.currentTextChanged.connect(
-            lambda text: self.handle_custom_input(self.stone_input, self.custom_stones, text)
-        )
+        self.stone_input.currentTextChanged.connect(self.on_custom_combo_text_changed)
 
         # Add fields to layout in the specified order
         form_layout.addRow("Категория:", self.category_input)
@@ -2335,15 +2681,13 @@ class MainWindow(QMainWindow):
         preview_group = QGroupBox("Преглед на етикет")
         preview_layout = QVBoxLayout()
         
-        # Calculate label dimensions
-        # Initialize PrinterHandler for CLP-631 specifications
-        self.printer_handler = PrinterHandler()
-        self.label_width_mm = self.printer_handler.label_width_mm
-        self.label_height_mm = self.printer_handler.label_height_mm
-        self.dpi = self.printer_handler.printer_dpi
-        self.mm_to_px = self.printer_handler.mm_to_px
-        self.label_width = self.printer_handler.label_width
-        self.label_height = self.printer_handler.label_height
+        # Label dimensions - CLP-631 specifications are PrinterHandler class constants
+        self.label_width_mm = PrinterHandler.label_width_mm
+        self.label_height_mm = PrinterHandler.label_height_mm
+        self.dpi = PrinterHandler.printer_dpi
+        self.mm_to_px = PrinterHandler.mm_to_px
+        self.label_width = PrinterHandler.label_width
+        self.label_height = PrinterHandler.label_height
         
         # Add checkbox for price display option
         self.include_lev_price_checkbox = QCheckBox("Включи лв цена на етикета")
@@ -2398,11 +2742,17 @@ class MainWindow(QMainWindow):
         general_tab = QWidget()
         general_layout = QVBoxLayout(general_tab)
         
+        # Coalesce bursts of filter edits into a single search_items pass
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.search_items)
+        
         # Main search bar for general search
         main_search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Търси по всички полета (баркод, категория, метал, камък, описание, цена, тегло, количество, дата)...")
-        self.search_input.textChanged.connect(self.search_items)
+        self.search_input.textChanged.connect(self.schedule_search_items)
         clear_search_btn = QPushButton("✕")
         clear_search_btn.setFixedSize(30, 30)
         clear_search_btn.clicked.connect(self.clear_search)
@@ -2426,23 +2776,10 @@ class MainWindow(QMainWindow):
         price_weight_layout = QHBoxLayout()
         
         # Price controls (more compact)
-        self.min_price_input = BlurOnEnterDoubleSpinBox()
-        self.min_price_input.setRange(0, 999999)
-        self.min_price_input.setSuffix(" лв")
-        self.min_price_input.setMaximumWidth(100)
-        self.min_price_input.editingFinished.connect(self.search_items)
-        # Auto-clear text when clicked
-        self.min_price_input.lineEdit().installEventFilter(self)
-        # Blur on Enter key press
-        self.max_price_input = BlurOnEnterDoubleSpinBox()
-        self.max_price_input.setRange(0, 999999)
-        self.max_price_input.setValue(999999)
-        self.max_price_input.setSuffix(" лв")
-        self.max_price_input.setMaximumWidth(100)
-        self.max_price_input.editingFinished.connect(self.search_items)
-        # Auto-clear text when clicked
-        self.max_price_input.lineEdit().installEventFilter(self)
-        # Blur on Enter key press
+        self.min_price_input = self.make_spin_box('filter_spin', 999999, suffix=" лв", max_width=100)
+        self.min_price_input.editingFinished.connect(self.schedule_search_items)
+        self.max_price_input = self.make_spin_box('filter_spin', 999999, suffix=" лв", value=999999, max_width=100)
+        self.max_price_input.editingFinished.connect(self.schedule_search_items)
         
         price_weight_layout.addWidget(QLabel("Цена:"))
         price_weight_layout.addWidget(self.min_price_input)
@@ -2453,23 +2790,10 @@ class MainWindow(QMainWindow):
         price_weight_layout.addWidget(QLabel(" | "))
         
         # Weight controls (more compact)
-        self.min_weight_input = BlurOnEnterDoubleSpinBox()
-        self.min_weight_input.setRange(0, 9999)
-        self.min_weight_input.setSuffix(" г")
-        self.min_weight_input.setMaximumWidth(100)
-        self.min_weight_input.editingFinished.connect(self.search_items)
-        # Auto-clear text when clicked
-        self.min_weight_input.lineEdit().installEventFilter(self)
-        # Blur on Enter key press
-        self.max_weight_input = BlurOnEnterDoubleSpinBox()
-        self.max_weight_input.setRange(0, 9999)
-        self.max_weight_input.setValue(9999)
-        self.max_weight_input.setSuffix(" г")
-        self.max_weight_input.setMaximumWidth(100)
-        self.max_weight_input.editingFinished.connect(self.search_items)
-        # Auto-clear text when clicked
-        self.max_weight_input.lineEdit().installEventFilter(self)
-        # Blur on Enter key press
+        self.min_weight_input = self.make_spin_box('filter_spin', 9999, suffix=" г", max_width=100)
+        self.min_weight_input.editingFinished.connect(self.schedule_search_items)
+        self.max_weight_input = self.make_spin_box('filter_spin', 9999, suffix=" г", value=9999, max_width=100)
+        self.max_weight_input.editingFinished.connect(self.schedule_search_items)
         
         price_weight_layout.addWidget(QLabel("Тегло:"))
         price_weight_layout.addWidget(self.min_weight_input)
@@ -2525,9 +2849,9 @@ class MainWindow(QMainWindow):
         
         # Connect to auto-switch and search functions
         self.start_date_input.dateChanged.connect(self.auto_switch_to_custom_inventory_period)
-        self.start_date_input.dateChanged.connect(self.search_items)
+        self.start_date_input.dateChanged.connect(self.schedule_search_items)
         self.start_date_input.editingFinished.connect(self.auto_switch_to_custom_inventory_period)
-        self.start_date_input.installEventFilter(self)
+        self.watch_events(self.start_date_input, 'inventory_date')
         
         self.end_date_input = QDateEdit()
         self.end_date_input.setDate(QDate.currentDate())  # Default to today
@@ -2537,9 +2861,9 @@ class MainWindow(QMainWindow):
         
         # Connect to auto-switch and search functions
         self.end_date_input.dateChanged.connect(self.auto_switch_to_custom_inventory_period)
-        self.end_date_input.dateChanged.connect(self.search_items)
+        self.end_date_input.dateChanged.connect(self.schedule_search_items)
         self.end_date_input.editingFinished.connect(self.auto_switch_to_custom_inventory_period)
-        self.end_date_input.installEventFilter(self)
+        self.watch_events(self.end_date_input, 'inventory_date')
         
         date_range_layout.addWidget(QLabel("От дата:"))
         date_range_layout.addWidget(self.start_date_input)
@@ -2564,33 +2888,33 @@ class MainWindow(QMainWindow):
         # Category filter
         all_cat_filters_layout.addWidget(QLabel("Категория:"))
         self.category_filter = QComboBox()
-        self.category_filter.addItem("Всички категории")
+        self.category_filter.setModel(QStringListModel([ALL_CATEGORIES_TEXT], self.category_filter))  # Refilled in one setStringList
         self.category_filter.setMaximumWidth(150)
-        self.category_filter.currentTextChanged.connect(self.search_items)
+        self.category_filter.currentTextChanged.connect(self.schedule_search_items)
         all_cat_filters_layout.addWidget(self.category_filter)
         
         # Metal filter
         all_cat_filters_layout.addWidget(QLabel("Метал:"))
         self.metal_filter = QComboBox()
-        self.metal_filter.addItem("Всички метали")
+        self.metal_filter.setModel(QStringListModel([ALL_METALS_TEXT], self.metal_filter))  # Refilled in one setStringList
         self.metal_filter.setMaximumWidth(120)
-        self.metal_filter.currentTextChanged.connect(self.search_items)
+        self.metal_filter.currentTextChanged.connect(self.schedule_search_items)
         all_cat_filters_layout.addWidget(self.metal_filter)
         
         # Stone filter
         all_cat_filters_layout.addWidget(QLabel("Камък:"))
         self.stone_filter = QComboBox()
-        self.stone_filter.addItem("Всички камъни")
+        self.stone_filter.setModel(QStringListModel([ALL_STONES_TEXT], self.stone_filter))  # Refilled in one setStringList
         self.stone_filter.setMaximumWidth(120)
-        self.stone_filter.currentTextChanged.connect(self.search_items)
+        self.stone_filter.currentTextChanged.connect(self.schedule_search_items)
         all_cat_filters_layout.addWidget(self.stone_filter)
         
         # Stock status filter
         all_cat_filters_layout.addWidget(QLabel("Количество:"))
         self.stock_filter = QComboBox()
-        self.stock_filter.addItems(["Всички", "С количество", "Малко количество (≤5)", "Без количество"])
+        self.stock_filter.addItems([STOCK_ALL, STOCK_AVAILABLE, STOCK_LOW, STOCK_NONE])
         self.stock_filter.setMaximumWidth(180)
-        self.stock_filter.currentTextChanged.connect(self.search_items)
+        self.stock_filter.currentTextChanged.connect(self.schedule_search_items)
         all_cat_filters_layout.addWidget(self.stock_filter)
         
         all_cat_filters_layout.addStretch()
@@ -2652,9 +2976,9 @@ class MainWindow(QMainWindow):
         bulk_edit_btn.clicked.connect(self.bulk_edit_prices)
         bulk_actions_layout.addWidget(bulk_edit_btn)
         
-        export_warehouse_btn = QPushButton("📄 Експорт склад")
-        export_warehouse_btn.clicked.connect(self.export_warehouse)
-        bulk_actions_layout.addWidget(export_warehouse_btn)
+        self.export_warehouse_btn = QPushButton("📄 Експорт склад")
+        self.export_warehouse_btn.clicked.connect(self.export_warehouse)
+        bulk_actions_layout.addWidget(self.export_warehouse_btn)
         
         bulk_actions_layout.addStretch()
         
@@ -2702,6 +3026,11 @@ class MainWindow(QMainWindow):
         self.items_table.customContextMenuRequested.connect(self.inventory_right_click)
         # Enable sorting
         self.items_table.setSortingEnabled(True)
+        # Any reorder or row-count change invalidates the cached per-row view state
+        items_model = self.items_table.model()
+        for signal in (items_model.layoutChanged, items_model.modelReset,
+                       items_model.rowsInserted, items_model.rowsRemoved):
+            signal.connect(self.invalidate_inventory_view_state)
         # MULTI-SELECT: Allow multiple row selection
         self.items_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.items_table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)  # Ctrl+Click, Shift+Click support
@@ -2710,30 +3039,54 @@ class MainWindow(QMainWindow):
         self.items_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         # DISABLE INLINE EDITING: Force users to use the edit dialog only
         self.items_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        # Connect selection change to update info
-        self.items_table.itemSelectionChanged.connect(self.update_selection_info)
+        # Connect selection change to update info (cache invalidation first, so the
+        # info update already sees the new selection)
+        self._selected_rows_cache = None
+        self.items_table.itemSelectionChanged.connect(self.invalidate_selected_rows)
+        # Coalesce a Shift-drag or Ctrl+A burst of selection signals into one info update
+        self._selection_info_timer = QTimer(self)
+        self._selection_info_timer.setSingleShot(True)
+        self._selection_info_timer.setInterval(50)
+        self._selection_info_timer.timeout.connect(self.update_selection_info)
+        self.items_table.itemSelectionChanged.connect(self.schedule_update_selection_info)
         # Add keyboard shortcut for deletion
         self.items_table.keyPressEvent = self.handle_table_key_press
         layout.addWidget(self.items_table)
 
         # Summary bar at the bottom
+        # One rich-text label laid out as six equal columns, so a refresh is a single setText
         summary_layout = QHBoxLayout()
-        self.summary_labels = []
-        for i in range(6):
-            label = QLabel()
-            label.setStyleSheet("font-weight: bold;")
-            self.summary_labels.append(label)
-            summary_layout.addWidget(label)
-        self.summary_labels[1].setText("ОБЩО:")
+        self.summary_label = QLabel()
+        self.summary_label.setTextFormat(Qt.TextFormat.RichText)
+        self.summary_label.setStyleSheet("font-weight: bold;")
+        summary_layout.addWidget(self.summary_label)
         layout.addLayout(summary_layout)
+        self.set_inventory_summary("", 0.0, 0.0, 0)
 
         return widget
 
+    def set_inventory_summary(self, shown_text, total_price, total_weight, total_items):
+        """Render the inventory summary bar (totals in Euro and Lev)"""
+        total_price_lev = self.euro_to_lev(total_price)
+        cells = (
+            shown_text,
+            "ОБЩО:",
+            f"{self.format_currency_eur(total_price)}<br>{self.format_currency_lev(total_price_lev)}",
+            self.format_grams(total_weight),
+            f"{total_items} артикула",
+            "",
+        )
+        self.summary_label.setText(
+            '<table width="100%" cellspacing="0" cellpadding="0"><tr>'
+            + "".join(f'<td width="16%">{cell}</td>' for cell in cells)
+            + "</tr></table>"
+        )
+
     def format_number_with_spaces(self, number):
         """Format integer or float with spaces every 3 digits"""
         if isinstance(number, float):
             number = int(number)
-        return f"{number:,}".replace(",", " ")
+        return format_int_with_spaces(number)
 
     def format_grams(self, grams):
         """Convert grams to kg and grams, format with spaces"""
@@ -2741,15 +3094,7 @@ class MainWindow(QMainWindow):
             grams = int(float(grams))
         except Exception:
             return ""
-        kg = grams // 1000
-        g = grams % 1000
-        if kg > 0:
-            if g > 0:
-                return f"{self.format_number_with_spaces(kg)}kg {self.format_number_with_spaces(g)}g"
-            else:
-                return f"{self.format_number_with_spaces(kg)}kg"
-        else:
-            return f"{self.format_number_with_spaces(g)}g"
+        return format_grams_int(grams)
     
     def get_exports_directory(self):
         """Ensure exports directory exists and return its path"""
@@ -2761,67 +3106,10 @@ class MainWindow(QMainWindow):
     
     def generate_bulgarian_filename(self, base_name, file_extension):
         """Generate Bulgarian snake_case filename with DD.MM.YYYY format - Dynamic and flexible"""
-        from datetime import datetime
-        import re
-        
-        # Convert base_name to Bulgarian snake_case
-        clean_name = base_name.lower().strip()
-        
-        # Translation dictionary for common terms only (no shop names)
-        term_translations = {
-            # System terms
-            "warehouse": "склад",
-            "shop": "магазин", 
-            "audit": "инвентаризация",
-            "selected_items": "избрани_артикули",
-            "analysis": "анализ",
-            "missing_items": "липсващи_артикули",
-            "missing items": "липсващи_артикули",
-            "export": "експорт",
-            "report": "доклад",
-            "items": "артикули",
-            "products": "продукти",
-            "inventory": "инвентар",
-            "database_export": "експорт_база_данни",
-            "complete_export": "пълен_експорт",
-            # Analysis types
-            "price analysis": "анализ_цени",
-            "category analysis": "анализ_категории"
-        }
-        
-        # Check if it's a known system term
-        if clean_name in term_translations:
-            bg_name = term_translations[clean_name]
-        else:
-            # Dynamic processing for any shop name or custom term
-            # Replace common abbreviations and words
-            bg_name = clean_name
-            
-            # Replace common Bulgarian abbreviations
-            bg_name = bg_name.replace("бул.", "булевард")
-            bg_name = bg_name.replace("ул.", "улица") 
-            bg_name = bg_name.replace("пл.", "площад")
-            bg_name = bg_name.replace("кв.", "квартал")
-            bg_name = bg_name.replace("ж.к.", "жилищен_комплекс")
-            
-            # Convert to snake_case: replace spaces, dots, slashes, etc.
-            bg_name = re.sub(r'[^\w\u0400-\u04FF]', '_', bg_name)  # Keep Cyrillic and Latin letters
-            bg_name = re.sub(r'_+', '_', bg_name)  # Remove multiple underscores
-            bg_name = bg_name.strip('_')  # Remove leading/trailing underscores
-            
-            # Smart prefix handling - avoid duplication
-            has_audit_prefix = bg_name.startswith('инвентаризация') or clean_name.startswith('инвентаризация')
-            has_shop_prefix = bg_name.startswith('магазин') or clean_name.startswith('магазин')
-            
-            # Add audit prefix if needed
-            if (clean_name.startswith('инвентаризация') or 'audit' in clean_name) and not has_audit_prefix:
-                bg_name = f"инвентаризация_{bg_name}"
-            # Add shop prefix if needed  
-            elif ('магазин' in clean_name or 'shop' in clean_name) and not has_shop_prefix and not has_audit_prefix:
-                bg_name = f"магазин_{bg_name}"
+        bg_name = bulgarian_filename_stem(base_name)
         
         # Generate DD.MM.YYYY date format
-        current_date = datetime.now().strftime("%d.%m.%Y")
+        current_date = current_filename_date()
         
         # Ensure extension starts with dot
         if not file_extension.startswith('.'):
@@ -2832,163 +3120,127 @@ class MainWindow(QMainWindow):
     def parse_weight_to_grams(self, weight_text):
         """Parse formatted weight string back to grams"""
         try:
-            weight_text = weight_text.replace(" ", "")  # Remove spaces
-            total_grams = 0
-            
-            # Handle kg
-            if "kg" in weight_text:
-                kg_part = weight_text.split("kg")[0]
-                total_grams += int(kg_part) * 1000
-                weight_text = weight_text.split("kg")[1] if "kg" in weight_text else ""
-            
-            # Handle remaining grams
-            if "g" in weight_text:
-                g_part = weight_text.replace("g", "")
-                if g_part:
-                    total_grams += int(g_part)
-            
-            return total_grams
+            return parse_grams_text(weight_text)
         except Exception:
             return 0
 
     def load_items(self):
         """Load items into table"""
         try:
-            items = self.db.get_all_items()
-            self.items_table.setRowCount(len(items))
+            items = self.db.get_inventory_rows()
             
-            # Update database statistics when loading items
-            if hasattr(self, 'db_stats_cards'):
-                self.update_database_statistics()
-            total_price = 0.0
-            total_weight = 0.0
-            total_items = 0
+            # Item counts may have changed - refresh or flag the database statistics
+            self.mark_database_stats_dirty()
+            records = [None] * len(items)
 
-            for row, item in enumerate(items):
-                try:
-                    # Basic item data with safe indexing
-                    # Barcode - NEVER EDITABLE (barcodes must never change once assigned)
-                    barcode_item = QTableWidgetItem(str(item[1]) if len(item) > 1 else "")
-                    barcode_item.setFlags(barcode_item.flags() & ~Qt.ItemFlag.ItemIsEditable)  # Remove editable flag
-                    barcode_item.setToolTip("Баркодът не може да бъде редактиран директно в таблицата")  # Tooltip
-                    barcode_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                    self.items_table.setItem(row, 0, barcode_item)  # Barcode
-                    
-                    category_item = QTableWidgetItem(str(item[4]) if len(item) > 4 else "")
-                    category_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                    self.items_table.setItem(row, 1, category_item)  # Category
-                    
-                    metal_item = QTableWidgetItem(str(item[8]) if len(item) > 8 else "")
-                    metal_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                    self.items_table.setItem(row, 2, metal_item)  # Metal
-                    
-                    stone_item = QTableWidgetItem(str(item[9]) if len(item) > 9 else "")
-                    stone_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                    self.items_table.setItem(row, 3, stone_item)  # Stone
-                    
-                    # Description
-                    description_item = QTableWidgetItem(str(item[3]) if len(item) > 3 else "")
-                    description_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                    self.items_table.setItem(row, 4, description_item)  # Description
-                    
-                    # Handle cost with fallback (Price bought / wholesale price in Euro)
-                    cost_eur = float(item[6]) if len(item) > 6 and item[6] is not None else 0.0
-                    cost_lev = self.euro_to_lev(cost_eur)
-                    cost_text = f"{cost_eur:.2f} €\n{cost_lev:.2f} лв"
-                    cost_item = QTableWidgetItem(cost_text)
-                    cost_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                    self.items_table.setItem(row, 5, cost_item)  # Cost / Price bought
-                    
-                    # Handle price with fallback (Retail price in Euro)
-                    price_eur = float(item[5]) if len(item) > 5 and item[5] is not None else 0.0
-                    price_lev = self.euro_to_lev(price_eur)
-                    price_text = f"{price_eur:.2f} €\n{price_lev:.2f} лв"
-                    price_item = QTableWidgetItem(price_text)
-                    price_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                    self.items_table.setItem(row, 6, price_item)  # Price
-                    
-                    # Handle weight with fallback
-                    weight = float(item[7]) if len(item) > 7 and item[7] is not None else 0.0
-                    weight_item = QTableWidgetItem(self.format_grams(weight))
-                    weight_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                    self.items_table.setItem(row, 7, weight_item)  # Weight
-                    
-                    # Handle stock with fallback
-                    stock = int(item[10]) if len(item) > 10 and item[10] is not None else 0
-                    stock_item = QTableWidgetItem(str(stock))
-                    stock_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                    self.items_table.setItem(row, 8, stock_item)  # Stock
-                    
-                    # Highlight row if quantity is 0
-                    self.highlight_zero_quantity_row(self.items_table, row, stock)
-                    
-                    # Date and Time - prioritize updated_at timestamp - NEVER EDITABLE
-                    date_added = None
+            # Populate with sorting, repaints and item signals suspended; with sorting
+            # enabled each setItem could reorder rows mid-population
+            self.items_table.setSortingEnabled(False)
+            self.items_table.setUpdatesEnabled(False)
+            self.items_table.blockSignals(True)
+            try:
+                self.items_table.setRowCount(len(items))
+                
+                # Cell prototypes - each cell is a clone carrying alignment, flags and the
+                # highlight_zero_quantity_row styling, so no per-cell setters are needed
+                def row_prototypes(zero_stock):
+                    """Prototype cells for one row, styled for zero or non-zero stock"""
+                    cell = QTableWidgetItem()
+                    cell.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
+                    font = cell.font()
+                    if zero_stock:
+                        cell.setBackground(QColor(255, 204, 204))  # Light pink background (#ffcccc)
+                        cell.setForeground(QColor(204, 0, 0))     # Dark red text (#cc0000)
+                        cell.setToolTip("ВНИМАНИЕ: Количеството е 0!")
+                        font.setBold(True)
+                    else:
+                        cell.setBackground(QColor())  # Default background
+                        cell.setForeground(QColor(255, 255, 255))  # White text
+                        font.setBold(False)
+                    cell.setFont(font)
+                    # Barcode, Date and Time are NEVER EDITABLE (barcodes must never change once assigned)
+                    locked = cell.clone()
+                    locked.setFlags(locked.flags() & ~Qt.ItemFlag.ItemIsEditable)  # Remove editable flag
+                    return (locked,) + (cell,) * 8 + (locked, locked)
+                
+                normal_cells = row_prototypes(False)
+                zero_stock_cells = row_prototypes(True)
+                set_item = self.items_table.setItem
+                
+                for row, item in enumerate(items):
                     try:
-                        # With explicit column order: created_at=item[11], updated_at=item[12]
-                        # Prioritize updated_at to show when item was last modified
-                        if len(item) > 12 and item[12]:  # updated_at column (most recent)
-                            date_added = parse_database_datetime(item[12])
-                        elif len(item) > 11 and item[11]:  # created_at column (fallback)
-                            date_added = parse_database_datetime(item[11])
-                    except (IndexError, TypeError, ValueError) as e:
-                        # Log the error but continue loading other items
-                        logger.warning(f"Could not parse date for item {item[1] if len(item) > 1 else 'unknown'}: {e}")
+                        # Numeric columns arrive typed and NULL-free from get_inventory_rows
+                        (_, barcode, _, description, category, price_eur, cost_eur, weight,
+                         metal, stone, stock, created_at, updated_at) = item
+                        
+                        # Date and Time - prioritize updated_at timestamp
                         date_added = None
-                    
-                    if date_added:
-                        # Date - NEVER EDITABLE (Column 9)
-                        date_item = QTableWidgetItem(format_date_for_display(date_added))
-                        date_item.setFlags(date_item.flags() & ~Qt.ItemFlag.ItemIsEditable)  # Remove editable flag
-                        date_item.setToolTip("Датата се генерира автоматично и не може да бъде редактирана")
-                        date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                        self.items_table.setItem(row, 9, date_item)  # Date
+                        try:
+                            # Prioritize updated_at to show when item was last modified
+                            if updated_at:  # updated_at column (most recent)
+                                date_added = parse_database_datetime(updated_at)
+                            elif created_at:  # created_at column (fallback)
+                                date_added = parse_database_datetime(created_at)
+                        except (TypeError, ValueError) as e:
+                            # Log the error but continue loading other items
+                            logger.warning(f"Could not parse date for item {barcode}: {e}")
+                            date_added = None
                         
-                        # Time - NEVER EDITABLE (Column 10)
-                        time_item = QTableWidgetItem(format_time_for_display(date_added))
-                        time_item.setFlags(time_item.flags() & ~Qt.ItemFlag.ItemIsEditable)  # Remove editable flag
-                        time_item.setToolTip("Часът се генерира автоматично и не може да бъде редактиран")
-                        time_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                        self.items_table.setItem(row, 10, time_item)  # Time
-                    else:
-                        # Set empty cells if no date is available - NEVER EDITABLE
-                        empty_date_item = QTableWidgetItem("")
-                        empty_date_item.setFlags(empty_date_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        empty_date_item.setToolTip("Датата се генерира автоматично и не може да бъде редактирана")
-                        empty_date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                        self.items_table.setItem(row, 9, empty_date_item)  # Date
+                        texts = (
+                            str(barcode),  # Barcode
+                            str(category),  # Category
+                            str(metal),  # Metal
+                            str(stone),  # Stone
+                            str(description),  # Description
+                            dual_currency_text(cost_eur),  # Cost / Price bought
+                            dual_currency_text(price_eur),  # Price
+                            self.format_grams(weight),  # Weight
+                            str(stock),  # Stock
+                            format_date_for_display(date_added),  # Date (empty if unknown)
+                            format_time_for_display(date_added),  # Time (empty if unknown)
+                        )
+                        # Highlight row if quantity is 0
+                        cell_prototypes = zero_stock_cells if stock <= 0 else normal_cells
+                        for col, text in enumerate(texts):
+                            cell = cell_prototypes[col].clone()
+                            cell.setText(text)
+                            if col == 0:
+                                cell.setData(Qt.ItemDataRole.UserRole, row)  # Index into inventory_records
+                            set_item(row, col, cell)
                         
-                        empty_time_item = QTableWidgetItem("")
-                        empty_time_item.setFlags(empty_time_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        empty_time_item.setToolTip("Часът се генерира автоматично и не може да бъде редактиран")
-                        empty_time_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center align
-                        self.items_table.setItem(row, 10, empty_time_item)  # Time
-
-                    # Update totals safely (using Euro prices)
-                    try:
-                        total_price += price_eur * stock
-                        total_weight += weight * stock
-                        total_items += stock
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Could not calculate totals for item {item[1] if len(item) > 1 else 'unknown'}: {e}")
+                        records[row] = (
+                            texts[0], texts[1], texts[2], texts[3], texts[4], cost_eur, price_eur,
+                            weight, stock,
+                            date_key(date_added),  # yyyymmdd, 0 if unknown
+                            # Case-folded text of every column, matched by the general search
+                            fold_search_text("\x00".join(texts)),
+                        )
 
-                except Exception as e:
-                    # Log error for individual item but continue loading others
-                    logger.error(f"Error loading item at row {row}: {e}")
-                    continue
+                    except Exception as e:
+                        # Log error for individual item but continue loading others
+                        logger.error(f"Error loading item at row {row}: {e}")
+                        continue
+            finally:
+                self.items_table.blockSignals(False)
+                self.items_table.setUpdatesEnabled(True)
+                self.items_table.setSortingEnabled(True)
+            self.inventory_records = records
+            self.invalidate_inventory_view_state()
+            self._last_search_summary = None  # Filter results must be recomputed for the new rows
+            self._filter_cols = cols = self.build_filter_columns(records)
+            self._search_corpus = self.build_search_corpus(records)
+
+            # Totals (using Euro prices) over the parsed records in one vectorized pass
+            total_price = float(cols['price'] @ cols['stock'])
+            total_weight = float(cols['weight'] @ cols['stock'])
+            total_items = int(cols['stock'].sum())
 
             # Update summary (show both currencies)
-            self.summary_labels[0].setText("")
-            total_price_lev = self.euro_to_lev(total_price)
-            price_summary = f"{self.format_currency_eur(total_price)}\n{self.format_currency_lev(total_price_lev)}"
-            self.summary_labels[2].setText(price_summary)
-            self.summary_labels[3].setText(self.format_grams(total_weight))
-            self.summary_labels[4].setText(f"{total_items} артикула")
-            self.summary_labels[5].setText("")
+            self.set_inventory_summary("", total_price, total_weight, total_items)
             
             # Populate filter dropdowns with unique values
             if hasattr(self, 'category_filter'):  # Check if filters exist
-                self.populate_filter_dropdowns(items)
+                self.populate_filter_dropdowns(*self.db.get_distinct_filter_values())
 
         except Exception as e:
             logger.error(f"Critical error in load_items: {e}", exc_info=True)
@@ -2997,188 +3249,133 @@ class MainWindow(QMainWindow):
             else:
                 logger.error(f"Error in load_items (suppressed): {e}")
 
+    @pyqtSlot()
+    def schedule_search_items(self):
+        """Restart the search debounce timer"""
+        self._search_timer.start()
+
+    @pyqtSlot()
     def search_items(self):
         """Enhanced search function with cumulative filtering across all tabs"""
-        visible_rows = 0
-        total_price = 0.0
-        total_weight = 0.0
-        total_items = 0
+        if hasattr(self, '_search_timer'):
+            self._search_timer.stop()  # A direct call supersedes any pending debounced run
         active_filters = []
+        cols = self._filter_cols
+        
+        # Filters from ALL tabs apply cumulatively as boolean masks over the loaded records
+        mask = cols['valid'].copy()
+        
+        # 1. General Search Filter (Tab 0)
+        search_text = fold_search_text(self.search_input.text())
+        if search_text:
+            active_filters.append(f"Общо търсене: '{search_text}'")
+            # Search ALL columns via the rows' precomputed keys
+            text_mask = np.zeros(len(mask), dtype=bool)
+            matches = self.get_search_matches(search_text)
+            text_mask[np.fromiter(matches, dtype=np.intp, count=len(matches))] = True
+            mask &= text_mask
+        
+        # 2. Price/Weight Filter (Tab 1)
+        min_price = self.min_price_input.value()
+        max_price = self.max_price_input.value()
+        min_weight = self.min_weight_input.value()
+        max_weight = self.max_weight_input.value()
+        
+        # Price filter
+        if min_price > 0 or max_price < 999999:
+            active_filters.append(f"Цена: {min_price:.2f} - {max_price:.2f} лв")
+            price_lev = np.round(cols['price'] * self.EUR_TO_LEV_RATE, 2)  # Convert to lev for comparison
+            mask &= (price_lev >= min_price) & (price_lev <= max_price)
+        
+        # Weight filter
+        if min_weight > 0 or max_weight < 9999:
+            active_filters.append(f"Тегло: {min_weight:.2f} - {max_weight:.2f} г")
+            mask &= (cols['weight'] >= min_weight) & (cols['weight'] <= max_weight)
+        
+        # 3. Date Filter (Tab 2)
+        start_date = self.start_date_input.date()
+        end_date = self.end_date_input.date()
+        
+        # Check if date filter is at default "show all" state
+        default_end = QDate.currentDate()
+        default_start = default_end.addMonths(-1)
+        is_default_date_range = (start_date == default_start and end_date == default_end)
+        
+        # Only apply date filter if it's not at default "show all" state
+        if not is_default_date_range:
+            active_filters.append(f"Дата: {start_date.toString('dd.MM.yyyy')} - {end_date.toString('dd.MM.yyyy')}")
+            # Unknown dates are stored as 0 and so fall outside any range
+            mask &= (cols['date'] >= qdate_key(start_date)) & (cols['date'] <= qdate_key(end_date))
+        
+        # 4. Category Filters (Tab 3)
+        category_filter = self.category_filter.currentText()
+        metal_filter = self.metal_filter.currentText()
+        stone_filter = self.stone_filter.currentText()
+        stock_filter = self.stock_filter.currentText()
+        
+        if category_filter != ALL_CATEGORIES_TEXT:
+            active_filters.append(f"Категория: {category_filter}")
+            codes, lookup = cols['category']
+            mask &= codes == lookup.get(category_filter, -2)
+        if metal_filter != ALL_METALS_TEXT:
+            active_filters.append(f"Метал: {metal_filter}")
+            codes, lookup = cols['metal']
+            mask &= codes == lookup.get(metal_filter, -2)
+        if stone_filter != ALL_STONES_TEXT:
+            active_filters.append(f"Камък: {stone_filter}")
+            codes, lookup = cols['stone']
+            mask &= codes == lookup.get(stone_filter, -2)
+        if stock_filter != STOCK_ALL:
+            active_filters.append(f"Количество: {stock_filter}")
+            if stock_filter == STOCK_AVAILABLE:
+                mask &= cols['stock'] > 0
+            elif stock_filter == STOCK_LOW:
+                mask &= cols['stock'] <= 5
+            elif stock_filter == STOCK_NONE:
+                mask &= cols['stock'] <= 0
+        
+        # Apply visibility - only rows whose state changes are touched, without a repaint per row
+        row_index, row_hidden = self.get_inventory_view_state()
+        hide = np.zeros(len(row_index), dtype=bool)
+        linked = row_index >= 0
+        hide[linked] = ~mask[row_index[linked]]
+        changed = np.flatnonzero(hide != row_hidden)
+        if len(changed):
+            self.items_table.setUpdatesEnabled(False)
+            try:
+                set_row_hidden = self.items_table.setRowHidden
+                for row in changed.tolist():
+                    set_row_hidden(row, bool(hide[row]))
+            finally:
+                self.items_table.setUpdatesEnabled(True)
+            row_hidden[changed] = hide[changed]
+        visible_rows = len(hide) - int(np.count_nonzero(hide))
         
-        for row in range(self.items_table.rowCount()):
-            show_row = True
-            
-            # Apply filters from ALL tabs cumulatively, not just the current tab
-            
-            # 1. General Search Filter (Tab 0)
-            search_text = self.search_input.text().lower()
-            if search_text:
-                active_filters.append(f"Общо търсене: '{search_text}'")
-                text_match = False
-                # Search ALL columns
-                search_columns = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-                for col in search_columns:
-                    item = self.items_table.item(row, col)
-                    if item and search_text in item.text().lower():
-                        text_match = True
-                        break
-                if not text_match:
-                    show_row = False
-            
-            # 2. Price/Weight Filter (Tab 1) - apply regardless of current tab
-            if show_row:
-                min_price = self.min_price_input.value()
-                max_price = self.max_price_input.value()
-                min_weight = self.min_weight_input.value()
-                max_weight = self.max_weight_input.value()
-                
-                # Price filter
-                if min_price > 0 or max_price < 999999:
-                    active_filters.append(f"Цена: {min_price:.2f} - {max_price:.2f} лв")
-                    price_item = self.items_table.item(row, 6)  # Price column
-                    if price_item:
-                        try:
-                            # Extract Euro price from dual currency text (first line)
-                            price_text = price_item.text().split('\n')[0].replace(" €", "").replace(" ", "")
-                            price_value_eur = float(price_text)
-                            price_value_lev = self.euro_to_lev(price_value_eur)  # Convert to lev for comparison
-                            if price_value_lev < min_price or price_value_lev > max_price:
-                                show_row = False
-                        except (ValueError, IndexError):
-                            show_row = False
-                
-                # Weight filter
-                if min_weight > 0 or max_weight < 9999:
-                    active_filters.append(f"Тегло: {min_weight:.2f} - {max_weight:.2f} г")
-                    weight_item = self.items_table.item(row, 7)  # Weight column
-                    if weight_item:
-                        try:
-                            weight_grams = self.parse_weight_to_grams(weight_item.text())
-                            if weight_grams < min_weight or weight_grams > max_weight:
-                                show_row = False
-                        except (ValueError, AttributeError):
-                            show_row = False
-            
-            # 3. Date Filter (Tab 2) - apply regardless of current tab
-            if show_row:
-                start_date = self.start_date_input.date()
-                end_date = self.end_date_input.date()
-                
-                # Check if date filter is at default "show all" state
-                default_start = QDate.currentDate().addMonths(-1)
-                default_end = QDate.currentDate()
-                is_default_date_range = (start_date == default_start and end_date == default_end)
-                
-                # Only apply date filter if it's not at default "show all" state
-                if not is_default_date_range:
-                    active_filters.append(f"Дата: {start_date.toString('dd.MM.yyyy')} - {end_date.toString('dd.MM.yyyy')}")
-                    
-                    date_item = self.items_table.item(row, 9)  # Date column
-                    if date_item:
-                        try:
-                            item_date_str = date_item.text()
-                            # Convert date string to QDate for comparison (using correct format with slashes)
-                            item_date = QDate.fromString(item_date_str, "dd/MM/yyyy")
-                            if not item_date.isValid() or item_date < start_date or item_date > end_date:
-                                show_row = False
-                        except (ValueError, AttributeError):
-                            show_row = False
-            
-            # 4. Category Filters (Tab 3) - apply regardless of current tab
-            if show_row:
-                category_filter = self.category_filter.currentText()
-                metal_filter = self.metal_filter.currentText()
-                stone_filter = self.stone_filter.currentText()
-                stock_filter = self.stock_filter.currentText()
-                
-                # Category filter
-                if category_filter != "Всички категории":
-                    active_filters.append(f"Категория: {category_filter}")
-                    category_item = self.items_table.item(row, 1)  # Category column
-                    if not category_item or category_item.text() != category_filter:
-                        show_row = False
-                
-                # Metal filter
-                if show_row and metal_filter != "Всички метали":
-                    active_filters.append(f"Метал: {metal_filter}")
-                    metal_item = self.items_table.item(row, 2)  # Metal column
-                    if not metal_item or metal_item.text() != metal_filter:
-                        show_row = False
-                
-                # Stone filter
-                if show_row and stone_filter != "Всички камъни":
-                    active_filters.append(f"Камък: {stone_filter}")
-                    stone_item = self.items_table.item(row, 3)  # Stone column
-                    if not stone_item or stone_item.text() != stone_filter:
-                        show_row = False
-                
-                # Stock filter
-                if show_row and stock_filter != "Всички":
-                    active_filters.append(f"Количество: {stock_filter}")
-                    stock_item = self.items_table.item(row, 8)  # Stock column
-                    if stock_item:
-                        try:
-                            stock_value = int(stock_item.text())
-                            if stock_filter == "С количество" and stock_value <= 0:
-                                show_row = False
-                            elif stock_filter == "Малко количество (≤5)" and stock_value > 5:
-                                show_row = False
-                            elif stock_filter == "Без количество" and stock_value > 0:
-                                show_row = False
-                        except ValueError:
-                            show_row = False
-            
-            # Apply visibility
-            self.items_table.setRowHidden(row, not show_row)
-            
-            # Update summary for visible rows
-            if show_row:
-                visible_rows += 1
-                try:
-                    # Calculate totals for visible items only (using Euro prices)
-                    price_item = self.items_table.item(row, 6)  # Price column
-                    stock_item = self.items_table.item(row, 8)  # Stock column
-                    weight_item = self.items_table.item(row, 7)  # Weight column
-                    
-                    if price_item and stock_item:
-                        # Extract Euro price from dual currency text (first line)
-                        price_text = price_item.text().split('\n')[0].replace(" €", "").replace(" ", "")
-                        price_value = float(price_text)
-                        stock_value = int(stock_item.text())
-                        total_price += price_value * stock_value
-                        total_items += stock_value
-                    
-                    if weight_item and stock_item:
-                        weight_text = weight_item.text()
-                        if weight_text:
-                            # Convert weight back to grams for calculation
-                            weight_grams = self.parse_weight_to_grams(weight_text)
-                            stock_value = int(stock_item.text())
-                            total_weight += weight_grams * stock_value
-                except (ValueError, AttributeError, IndexError):
-                    pass
+        # Calculate totals for visible items only (using Euro prices)
+        stocks = cols['stock'][mask]
+        total_price = float(cols['price'][mask] @ stocks)
+        total_weight = float(cols['weight'][mask] @ stocks)
+        total_items = int(stocks.sum())
         
         # Update search info label
         if active_filters:
-            # Remove duplicates and show active filters
-            unique_filters = list(dict.fromkeys(active_filters))
-            self.search_info_label.setText(f"Активни филтри: {' | '.join(unique_filters[:2])}")
+            self.search_info_label.setText(f"Активни филтри: {' | '.join(active_filters[:2])}")
         else:
             self.search_info_label.setText("Няма активни филтри")
         
         # Update summary with filtered results (show both currencies)
+        self._last_search_summary = (visible_rows, total_price, total_weight, total_items)
+        self.refresh_main_summary()
+    
+    def refresh_main_summary(self):
+        """Redraw the inventory summary from the last search results and the current selection"""
+        visible_rows, total_price, total_weight, total_items = self._last_search_summary
         selected_count = len(self.get_selected_rows())
         if selected_count > 0:
-            self.summary_labels[0].setText(f"Показани: {visible_rows} | Избрани: {selected_count}")
+            shown_text = f"Показани: {visible_rows} | Избрани: {selected_count}"
         else:
-            self.summary_labels[0].setText(f"Показани: {visible_rows}")
-        
-        total_price_lev = self.euro_to_lev(total_price)
-        price_summary = f"{self.format_currency_eur(total_price)}\n{self.format_currency_lev(total_price_lev)}"
-        self.summary_labels[2].setText(price_summary)
-        self.summary_labels[3].setText(self.format_grams(total_weight))
-        self.summary_labels[4].setText(f"{total_items} артикула")
-        self.summary_labels[5].setText("")
+            shown_text = f"Показани: {visible_rows}"
+        self.set_inventory_summary(shown_text, total_price, total_weight, total_items)
 
     def clear_search(self):
         """Clear the main search input"""
@@ -3186,30 +3383,36 @@ class MainWindow(QMainWindow):
     
     def clear_all_filters(self):
         """Clear all search filters in all tabs"""
-        # General search tab
-        self.search_input.clear()
-        
-        # Price/Weight search tab
-        self.min_price_input.setValue(0)
-        self.max_price_input.setValue(999999)
-        self.min_weight_input.setValue(0)
-        self.max_weight_input.setValue(9999)
-        
-        # Reset confirmed values for filter spin boxes
-        self.min_price_input.reset_confirmed_value()
-        self.max_price_input.reset_confirmed_value()
-        self.min_weight_input.reset_confirmed_value()
-        self.max_weight_input.reset_confirmed_value()
-        
-        # Date search tab
-        self.start_date_input.setDate(QDate.currentDate().addMonths(-1))
-        self.end_date_input.setDate(QDate.currentDate())
-        
-        # Category search tab
-        self.category_filter.setCurrentText("Всички категории")
-        self.metal_filter.setCurrentText("Всички метали")
-        self.stone_filter.setCurrentText("Всички камъни")
-        self.stock_filter.setCurrentText("Всички")
+        # Reset every widget silently; a single search runs at the end
+        with QSignalBlocker(self.search_input), \
+                QSignalBlocker(self.start_date_input), QSignalBlocker(self.end_date_input), \
+                QSignalBlocker(self.category_filter), QSignalBlocker(self.metal_filter), \
+                QSignalBlocker(self.stone_filter), QSignalBlocker(self.stock_filter):
+            # General search tab
+            self.search_input.clear()
+        
+            # Price/Weight search tab
+            self.min_price_input.setValue(0)
+            self.max_price_input.setValue(999999)
+            self.min_weight_input.setValue(0)
+            self.max_weight_input.setValue(9999)
+        
+            # Reset confirmed values for filter spin boxes
+            self.min_price_input.reset_confirmed_value()
+            self.max_price_input.reset_confirmed_value()
+            self.min_weight_input.reset_confirmed_value()
+            self.max_weight_input.reset_confirmed_value()
+        
+            # Date search tab
+            today = QDate.currentDate()
+            self.start_date_input.setDate(today.addMonths(-1))
+            self.end_date_input.setDate(today)
+        
+            # Category search tab
+            self.category_filter.setCurrentText(ALL_CATEGORIES_TEXT)
+            self.metal_filter.setCurrentText(ALL_METALS_TEXT)
+            self.stone_filter.setCurrentText(ALL_STONES_TEXT)
+            self.stock_filter.setCurrentText(STOCK_ALL)
         
         # Update search info
         self.search_info_label.setText("Няма активни филтри")
@@ -3242,21 +3445,22 @@ class MainWindow(QMainWindow):
         self.programmatic_date_change = True
         
         try:
+            today = QDate.currentDate()
             if period_type == "today":
-                start_date = QDate.currentDate()
-                end_date = QDate.currentDate()
+                start_date = today
+                end_date = today
             elif period_type == "week":
                 # Start of current week (Monday)
-                start_date = QDate.currentDate().addDays(-QDate.currentDate().dayOfWeek() + 1)
-                end_date = QDate.currentDate()
+                start_date = today.addDays(-today.dayOfWeek() + 1)
+                end_date = today
             elif period_type == "month":
                 # Start of current month
-                start_date = QDate(QDate.currentDate().year(), QDate.currentDate().month(), 1)
-                end_date = QDate.currentDate()
+                start_date = QDate(today.year(), today.month(), 1)
+                end_date = today
             elif period_type == "year":
                 # Start of current year
-                start_date = QDate(QDate.currentDate().year(), 1, 1)
-                end_date = QDate.currentDate()
+                start_date = QDate(today.year(), 1, 1)
+                end_date = today
             else:
                 # Default case or "all" - don't change dates
                 return
@@ -3272,6 +3476,7 @@ class MainWindow(QMainWindow):
         self.load_sales()
         self.search_sales()
     
+    @pyqtSlot()
     def on_inventory_period_changed(self):
         """Handle inventory period radio button changes"""
         checked_button = self.inventory_period_group.checkedButton()
@@ -3297,64 +3502,73 @@ class MainWindow(QMainWindow):
                 # Reset date fields to default "show all" range
                 self.programmatic_inventory_date_change = True
                 try:
-                    self.start_date_input.setDate(QDate.currentDate().addMonths(-1))
-                    self.end_date_input.setDate(QDate.currentDate())
+                    today = QDate.currentDate()
+                    self.start_date_input.setDate(today.addMonths(-1))
+                    self.end_date_input.setDate(today)
                 finally:
                     self.programmatic_inventory_date_change = False
                 self.search_items()
     
+    @pyqtSlot()
+    def schedule_search_sales(self):
+        """Restart the sales search debounce timer"""
+        self._sales_search_timer.start()
+
+    @pyqtSlot()
     def search_sales(self):
         """Enhanced search function for sales table with cumulative filtering"""
+        if hasattr(self, '_sales_search_timer'):
+            self._sales_search_timer.stop()  # A direct call supersedes any pending debounced run
         visible_rows = 0
         active_sales_filters = []
         
-        for row in range(self.sales_table.rowCount()):
+        # 1. General Search Filter (Tab 0)
+        search_text = self.sales_search_input.text().lower()
+        if search_text:
+            active_sales_filters.append(f"Общо търсене: '{search_text}'")
+        
+        # 2. Date Filter (Tab 1) - window as yyyymmdd keys, compared against each date cell's stored key
+        start_date = self.sales_start_date_input.date()
+        end_date = self.sales_end_date_input.date()
+        start_key = qdate_key(start_date)
+        end_key = qdate_key(end_date)
+        
+        # Check if date filter is at default "show all" state (same logic as warehouse)
+        default_end = QDate.currentDate()
+        default_start = default_end.addMonths(-1)
+        filter_dates = not (start_date == default_start and end_date == default_end)
+        if filter_dates:
+            active_sales_filters.append(f"Дата: {start_date.toString('dd.MM.yyyy')} - {end_date.toString('dd.MM.yyyy')}")
+        
+        table = self.sales_table
+        item_at = table.item
+        set_hidden = table.setRowHidden
+        user_role = Qt.ItemDataRole.UserRole
+        row_count = table.rowCount()
+        for row in range(row_count):
             show_row = True
             
             # Apply filters from ALL tabs cumulatively
-            
-            # 1. General Search Filter (Tab 0)
-            search_text = self.sales_search_input.text().lower()
             if search_text:
-                active_sales_filters.append(f"Общо търсене: '{search_text}'")
-                text_match = False
                 # Search ALL columns
-                search_columns = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-                for col in search_columns:
-                    item = self.sales_table.item(row, col)
+                show_row = False
+                for col in range(11):
+                    item = item_at(row, col)
                     if item and search_text in item.text().lower():
-                        text_match = True
+                        show_row = True
                         break
-                if not text_match:
-                    show_row = False
             
-            # 2. Date Filter (Tab 1) - apply regardless of current tab
-            if show_row:
-                start_date = self.sales_start_date_input.date()
-                end_date = self.sales_end_date_input.date()
-                
-                # Check if date filter is at default "show all" state (same logic as warehouse)
-                default_start = QDate.currentDate().addMonths(-1)
-                default_end = QDate.currentDate()
-                is_default_date_range = (start_date == default_start and end_date == default_end)
-                
-                # Only apply date filter if it's not at default "show all" state
-                if not is_default_date_range:
-                    active_sales_filters.append(f"Дата: {start_date.toString('dd.MM.yyyy')} - {end_date.toString('dd.MM.yyyy')}")
-                    
-                    date_item = self.sales_table.item(row, 9)  # Date column
-                    if date_item:
-                        try:
-                            item_date_str = date_item.text()
-                            # Convert date string to QDate for comparison (using correct format with slashes)
-                            item_date = QDate.fromString(item_date_str, "dd/MM/yyyy")
-                            if not item_date.isValid() or item_date < start_date or item_date > end_date:
-                                show_row = False
-                        except (ValueError, AttributeError):
-                            show_row = False
+            # Only apply date filter if it's not at default "show all" state
+            if show_row and filter_dates:
+                date_item = item_at(row, 9)  # Date column
+                if date_item:
+                    # yyyymmdd key stored by load_sales; 0 (unknown date) is out of range
+                    item_key = date_item.data(user_role) or 0
+                    if not start_key <= item_key <= end_key:
+                        show_row = False
             
             # Apply visibility
-            self.sales_table.setRowHidden(row, not show_row)
+            set_hidden(row, not show_row)
             
             # Update summary for visible rows
             if show_row:
@@ -3362,9 +3576,7 @@ class MainWindow(QMainWindow):
         
         # Update sales search info label
         if active_sales_filters:
-            # Remove duplicates and show active filters
-            unique_filters = list(dict.fromkeys(active_sales_filters))
-            self.sales_search_info_label.setText(f"Активни филтри: {' | '.join(unique_filters[:2])}")
+            self.sales_search_info_label.setText(f"Активни филтри: {' | '.join(active_sales_filters)}")
         else:
             self.sales_search_info_label.setText("Няма активни филтри")
         
@@ -3386,8 +3598,9 @@ class MainWindow(QMainWindow):
         
         try:
             # Date search tab - reset to default "show all" range like warehouse
-            self.sales_start_date.setDate(QDate.currentDate().addMonths(-1))
-            self.sales_end_date.setDate(QDate.currentDate())
+            today = QDate.currentDate()
+            self.sales_start_date.setDate(today.addMonths(-1))
+            self.sales_end_date.setDate(today)
             
             # Keep "Всички" selected instead of switching to "Персонализиран"
             if hasattr(self, 'all_time_radio'):
@@ -3403,53 +3616,28 @@ class MainWindow(QMainWindow):
         self.load_sales()
         self.search_sales()
     
-    def populate_filter_dropdowns(self, items):
-        """Populate filter dropdowns with unique values from items"""
-        categories = set()
-        metals = set()
-        stones = set()
-        
-        for item in items:
-            if len(item) > 8:
-                categories.add(item[4])  # Category
-                metals.add(item[8])      # Metal
-                stones.add(item[9])      # Stone
-        
-        # Update category filter
-        current_category = self.category_filter.currentText()
-        self.category_filter.clear()
-        self.category_filter.addItem("Всички категории")
-        for category in sorted(categories):
-            if category:  # Skip empty values
-                self.category_filter.addItem(category)
-        # Restore selection if it still exists
-        index = self.category_filter.findText(current_category)
-        if index >= 0:
-            self.category_filter.setCurrentIndex(index)
-        
-        # Update metal filter
-        current_metal = self.metal_filter.currentText()
-        self.metal_filter.clear()
-        self.metal_filter.addItem("Всички метали")
-        for metal in sorted(metals):
-            if metal:  # Skip empty values
-                self.metal_filter.addItem(metal)
-        # Restore selection if it still exists
-        index = self.metal_filter.findText(current_metal)
-        if index >= 0:
-            self.metal_filter.setCurrentIndex(index)
-        
-        # Update stone filter
-        current_stone = self.stone_filter.currentText()
-        self.stone_filter.clear()
-        self.stone_filter.addItem("Всички камъни")
-        for stone in sorted(stones):
-            if stone:  # Skip empty values
-                self.stone_filter.addItem(stone)
-        # Restore selection if it still exists
-        index = self.stone_filter.findText(current_stone)
-        if index >= 0:
-            self.stone_filter.setCurrentIndex(index)
+    def populate_filter_dropdowns(self, categories, metals, stones):
+        """Populate filter dropdowns with the sorted distinct values from the database"""
+        # Refill silently; only a lost selection needs a new search
+        changed = self.refill_filter_combo(self.category_filter, ALL_CATEGORIES_TEXT, categories)
+        changed |= self.refill_filter_combo(self.metal_filter, ALL_METALS_TEXT, metals)
+        changed |= self.refill_filter_combo(self.stone_filter, ALL_STONES_TEXT, stones)
+        if changed:
+            self.schedule_search_items()
+    
+    def refill_filter_combo(self, combo, all_text, values):
+        """Replace a filter combo's items in one batch, keeping the selection if it still exists"""
+        current = combo.currentText()
+        entries = [all_text, *values]  # Values are already sorted, deduplicated and non-empty
+        combo.blockSignals(True)
+        try:
+            # One model reset for the whole list
+            combo.model().setStringList(entries)
+            # Restore selection if it still exists
+            combo.setCurrentIndex(entries.index(current) if current in entries else 0)
+        finally:
+            combo.blockSignals(False)
+        return combo.currentText() != current
 
     def edit_item(self, item):
         """Edit selected item using dedicated dialog"""
@@ -3479,23 +3667,26 @@ class MainWindow(QMainWindow):
             stone = stone_item.text()
             description = description_item.text() if description_item else ""
             
-            # Parse dual currency format (Euro on first line)
-            cost_text = cost_item.text().split('\n')[0].replace(" €", "").replace(" ", "") if cost_item else "0"
-            price_text = price_item.text().split('\n')[0].replace(" €", "").replace(" ", "") if price_item else "0"
+            # Dual currency cells (Euro on first line), parsed below
+            cost_text = cost_item.text() if cost_item else ""
+            price_text = price_item.text() if price_item else ""
             weight_text = weight_item.text()
             stock_text = stock_item.text()
             
-            # Convert numeric values with error handling
-            try:
-                price = float(price_text) if price_text else 0.0
-                cost = float(cost_text) if cost_text else 0.0
-                stock = int(stock_text) if stock_text else 0
-            except (ValueError, IndexError) as e:
-                QMessageBox.warning(self, "Грешка", f"Невалидни числови данни: {str(e)}")
+            # Convert numeric values; None marks a cell that does not hold a valid number
+            price = parse_number_or_none(price_text, parse_eur_cell, 0.0)
+            cost = parse_number_or_none(cost_text, parse_eur_cell, 0.0)
+            stock = parse_number_or_none(stock_text, int, 0)
+            if price is None or cost is None or stock is None:
+                QMessageBox.warning(self, "Грешка", f"Невалидни числови данни: {price_text!r}, {cost_text!r}, {stock_text!r}")
                 return
             
-            # Parse weight back to grams
-            weight_grams = self.parse_weight_to_grams(weight_text)
+            # Whole grams as displayed, taken from the loaded record rather than re-parsed from the cell
+            record = self.get_row_record(row)
+            if record is not None:
+                weight_grams = int(record[7])
+            else:
+                weight_grams = self.parse_weight_to_grams(weight_text)
             
             # Create and show edit dialog - passing description as well and from_warehouse=True
             dialog = EditItemDialog(self, barcode, category, description, price, cost, weight_grams, metal, stone, stock, from_warehouse=True)
@@ -3510,47 +3701,28 @@ class MainWindow(QMainWindow):
                         cursor = conn.cursor()
                         cursor.execute('SELECT id FROM items WHERE barcode = ?', (barcode,))
                         result = cursor.fetchone()
-                        if not result:
-                            QMessageBox.warning(self, "Грешка", "Артикулът не е намерен")
-                            return
-                        
-                        item_id = result[0]
-                        
-                        # Create old data dict for undo
-                        old_data = {
-                            'name': category,
-                            'description': description,
-                            'category': category,
-                            'price': price,
-                            'cost': cost,
-                            'weight': weight_grams,
-                            'metal_type': metal,
-                            'stone_type': stone,
-                            'stock_quantity': stock
-                        }
-                        
-                        # Create new data dict
-                        new_data = {
-                            'name': updated_data['category'],
-                            'description': updated_data['description'],
-                            'category': updated_data['category'],
-                            'price': updated_data['price'],
-                            'cost': updated_data['cost'],
-                            'weight': updated_data['weight'],
-                            'metal_type': updated_data['metal'],
-                            'stone_type': updated_data['stone'],
-                            'stock_quantity': updated_data['stock']
-                        }
-                        
-                        # Create and execute edit action
-                        edit_action = EditItemAction(self.db, item_id, barcode, old_data, new_data)
-                        if self.action_history.execute_action(edit_action):
-                            QMessageBox.information(self, "Успех", "Артикулът е обновен успешно")
-                            self.load_items()  # Reload the table
-                            self.update_action_buttons()
-                            self.update_reports_and_database_stats()
-                        else:
-                            QMessageBox.warning(self, "Грешка", "Неуспешно обновяване на артикула")
+                    if not result:
+                        QMessageBox.warning(self, "Грешка", "Артикулът не е намерен")
+                        return
+                    
+                    item_id = result[0]
+                    
+                    # Old data dict for undo and new data dict, both keyed by database column
+                    old_values = {
+                        'category': category, 'description': description, 'price': price,
+                        'cost': cost, 'weight': weight_grams, 'metal': metal, 'stone': stone,
+                        'stock': stock,
+                    }
+                    old_data = {column: old_values[field] for column, field in ITEM_EDIT_FIELDS}
+                    new_data = {column: updated_data[field] for column, field in ITEM_EDIT_FIELDS}
+                    
+                    # Create and execute edit action
+                    edit_action = EditItemAction(self.db, item_id, barcode, old_data, new_data)
+                    if self.action_history.execute_action(edit_action):
+                        QMessageBox.information(self, "Успех", "Артикулът е обновен успешно")
+                        self.request_refresh('items', 'actions', 'reports')
+                    else:
+                        QMessageBox.warning(self, "Грешка", "Неуспешно обновяване на артикула")
                 except Exception as e:
                     QMessageBox.critical(self, "Грешка", f"Грешка при обновяване: {str(e)}")
         
@@ -3620,32 +3792,77 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             self.delete_item(barcode)
 
+    @contextmanager
+    def defer_refresh(self):
+        """Collect refresh requests made inside the block and run each one once on exit"""
+        self._refresh_depth += 1
+        try:
+            yield
+        finally:
+            self._refresh_depth -= 1
+            if self._refresh_depth == 0 and self._pending_refresh:
+                pending, self._pending_refresh = self._pending_refresh, set()
+                self.run_refreshes(pending)
+
+    def request_refresh(self, *kinds):
+        """Refresh 'items', 'shop', 'actions' and/or 'reports' now, or at the end of a defer_refresh block"""
+        if self._refresh_depth:
+            self._pending_refresh.update(kinds)
+        else:
+            self.run_refreshes(kinds)
+
+    def run_refreshes(self, kinds):
+        """Run the requested refreshes in a fixed order"""
+        if 'items' in kinds:
+            self.load_items()
+        if 'shop' in kinds:
+            self.load_shop_inventory()  # Refresh shop inventory table
+        if 'actions' in kinds:
+            self.update_action_buttons()
+        if 'reports' in kinds:
+            self.update_reports_and_database_stats()
+
     def delete_item(self, barcode):
         """Delete item from database"""
         try:
-            # First get the item_id from the barcode
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('SELECT id FROM items WHERE barcode = ?', (barcode,))
-                result = cursor.fetchone()
-                if not result:
-                    QMessageBox.warning(self, "Грешка", "Артикулът не е намерен")
-                    return
-                
-                item_id = result[0]
-                
-                # Create and execute delete action
-                delete_action = DeleteItemAction(self.db, item_id, barcode)
-                if self.action_history.execute_action(delete_action):
-                    QMessageBox.information(self, "Успех", "Артикулът е изтрит успешно")
-                    self.load_items()
-                    self.update_action_buttons()
-                    self.update_reports_and_database_stats()
-                else:
-                    QMessageBox.warning(self, "Грешка", "Неуспешно изтриване на артикула")
+            deleted_count, failed_items, missing_items = self.delete_barcodes([barcode])
+            if missing_items:
+                QMessageBox.warning(self, "Грешка", "Артикулът не е намерен")
+                return
+            
+            if deleted_count:
+                QMessageBox.information(self, "Успех", "Артикулът е изтрит успешно")
+                self.request_refresh('items', 'actions', 'reports')
+            else:
+                QMessageBox.warning(self, "Грешка", "Неуспешно изтриване на артикула")
         except Exception as e:
             QMessageBox.critical(self, "Грешка", f"Грешка при изтриване на артикула: {str(e)}")
 
+    def delete_barcodes(self, barcodes):
+        """Delete items through the action system; returns (deleted count, failed barcodes, unknown barcodes)"""
+        deleted_count = 0
+        failed_items = []
+        missing_items = []
+        
+        # Resolve all item ids in one batched lookup
+        id_by_barcode = self.db.get_item_ids_by_barcodes(barcodes)
+        
+        # Delete each item as its own undoable action
+        for barcode in barcodes:
+            item_id = id_by_barcode.get(barcode)
+            if item_id is None:
+                missing_items.append(barcode)
+                continue
+            try:
+                if self.action_history.execute_action(DeleteItemAction(self.db, item_id, barcode)):
+                    deleted_count += 1
+                else:
+                    failed_items.append(barcode)
+            except Exception as e:
+                logger.error(f"Error deleting item {barcode}: {e}")
+                failed_items.append(barcode)
+        return deleted_count, failed_items, missing_items
+
     def move_to_shop(self, barcode):
         """Move item to shop"""
         try:
@@ -3681,8 +3898,7 @@ class MainWindow(QMainWindow):
 
             # Add shop selection combo box
             shop_combo = QComboBox()
-            for shop in shops:
-                shop_combo.addItem(shop[1])
+            shop_combo.addItems([shop[1] for shop in shops])
             layout.addWidget(QLabel("Избери магазин:"))
             layout.addWidget(shop_combo)
 
@@ -3729,9 +3945,7 @@ class MainWindow(QMainWindow):
                 
                 if self.db.move_item_to_shop(shop_id, barcode, quantity):
                     QMessageBox.information(self, "Успех", f"Успешно преместени {quantity} артикула в магазин '{shop_name}'")
-                    self.load_items()
-                    self.load_shop_inventory()  # Refresh shop inventory table
-                    self.update_reports_and_database_stats()
+                    self.request_refresh('items', 'shop', 'reports')
                 else:
                     QMessageBox.warning(self, "Грешка", "Неуспешно преместване на артикула")
         except Exception as e:
@@ -3740,17 +3954,134 @@ class MainWindow(QMainWindow):
     # Bulk operations methods
     def get_selected_rows(self):
         """Get list of selected row numbers"""
-        selected_ranges = self.items_table.selectionModel().selectedRows()
-        return [index.row() for index in selected_ranges]
+        if self._selected_rows_cache is None:
+            selected_ranges = self.items_table.selectionModel().selectedRows()
+            self._selected_rows_cache = [index.row() for index in selected_ranges]
+        return list(self._selected_rows_cache)
+    
+    def invalidate_selected_rows(self):
+        """Drop the cached selected row numbers after the selection changes"""
+        self._selected_rows_cache = None
+    
+    def invalidate_inventory_view_state(self, *args):
+        """Drop the cached row-to-record map after the table's rows move or change"""
+        self._inventory_view_state = None
+        self._selected_rows_cache = None  # Selected rows move with the data
+    
+    def get_inventory_view_state(self):
+        """Return (record index per table row or -1, hidden flag per table row) arrays"""
+        if self._inventory_view_state is None:
+            table = self.items_table
+            item_at = table.item
+            is_hidden = table.isRowHidden
+            records = self.inventory_records
+            record_count = len(records)
+            user_role = Qt.ItemDataRole.UserRole
+            row_count = table.rowCount()
+            row_index = np.full(row_count, -1, dtype=np.intp)
+            row_hidden = np.zeros(row_count, dtype=bool)
+            # Same lookup as get_row_index, with the per-row attribute loads hoisted
+            for row in range(row_count):
+                row_hidden[row] = is_hidden(row)
+                barcode_item = item_at(row, 0)
+                if barcode_item is None:
+                    continue
+                index = barcode_item.data(user_role)
+                if index is not None and index < record_count and records[index] is not None:
+                    row_index[row] = index
+            self._inventory_view_state = (row_index, row_hidden)
+        return self._inventory_view_state
+    
+    def get_row_index(self, row):
+        """Return the inventory_records index behind an inventory table row, or None"""
+        barcode_item = self.items_table.item(row, 0)
+        if barcode_item is None:
+            return None
+        index = barcode_item.data(Qt.ItemDataRole.UserRole)
+        if index is None or index >= len(self.inventory_records) or self.inventory_records[index] is None:
+            return None
+        return index
     
-    def get_selected_barcodes(self):
-        """Get list of barcodes for selected rows"""
-        selected_rows = self.get_selected_rows()
+    def get_row_record(self, row):
+        """Return the parsed source values behind an inventory table row, or None"""
+        index = self.get_row_index(row)
+        return None if index is None else self.inventory_records[index]
+    
+    def build_filter_columns(self, records):
+        """Column arrays over inventory_records for vectorized filtering and totals"""
+        count = len(records)
+        
+        def column(field, default, dtype):
+            return np.fromiter(
+                (default if record is None else record[field] for record in records),
+                dtype=dtype, count=count
+            )
+        
+        def code_column(field):
+            """Integer code per record plus the value-to-code map; comparing codes avoids object arrays"""
+            codes = {}
+            return np.fromiter(
+                (-1 if record is None else codes.setdefault(record[field], len(codes)) for record in records),
+                dtype=np.int32, count=count
+            ), codes
+        
+        return {
+            'valid': np.fromiter((record is not None for record in records), dtype=bool, count=count),
+            'category': code_column(1),
+            'metal': code_column(2),
+            'stone': code_column(3),
+            'price': column(6, 0.0, np.float64),
+            'weight': column(7, 0.0, np.float64),
+            'stock': column(8, 0, np.int64),
+            'date': column(9, 0, np.int32),
+        }
+    
+    def build_search_corpus(self, records):
+        """Join all row search keys into one string plus the start offset of each record"""
+        keys = ["" if record is None else record[10] for record in records]
+        starts = []
+        offset = 0
+        for key in keys:
+            starts.append(offset)
+            offset += len(key) + 1  # Record separator
+        return "\x01".join(keys), starts
+    
+    def get_search_matches(self, needle):
+        """Return the indices of inventory records whose search key contains needle"""
+        records = self.inventory_records
+        cached_records, cached_needle, cached_matches = self._search_match_cache
+        if cached_records is records and cached_needle in needle:
+            # Typing narrows the search - only previous matches can still match
+            matches = {i for i in cached_matches if needle in records[i][10]}
+        else:
+            # One str.find sweep over all keys, jumping to the next record after each hit
+            corpus, starts = self._search_corpus
+            matches = set()
+            position = corpus.find(needle)
+            while position != -1:
+                index = bisect.bisect_right(starts, position) - 1
+                matches.add(index)
+                if index + 1 >= len(starts):
+                    break
+                position = corpus.find(needle, starts[index + 1])
+        self._search_match_cache = (records, needle, matches)
+        return matches
+    
+    def get_selected_barcodes(self):
+        """Get list of barcodes for selected rows"""
+        row_index, _ = self.get_inventory_view_state()
+        records = self.inventory_records
+        item_at = self.items_table.item
         barcodes = []
-        for row in selected_rows:
-            barcode_item = self.items_table.item(row, 0)
-            if barcode_item:
-                barcodes.append(barcode_item.text())
+        for row in self.get_selected_rows():
+            index = row_index[row]
+            if index >= 0:
+                barcodes.append(records[index][0])
+            else:
+                # Row without a parsed record - fall back to the cell text
+                barcode_item = item_at(row, 0)
+                if barcode_item:
+                    barcodes.append(barcode_item.text())
         return barcodes
     
     def select_all_items(self):
@@ -3761,8 +4092,15 @@ class MainWindow(QMainWindow):
         """Deselect all items in the table"""
         self.items_table.clearSelection()
     
+    @pyqtSlot()
+    def schedule_update_selection_info(self):
+        """Restart the selection info debounce timer"""
+        self._selection_info_timer.start()
+
+    @pyqtSlot()
     def update_selection_info(self):
         """Update the selection info label and summary"""
+        self._selection_info_timer.stop()  # A direct call supersedes any pending debounced run
         selected_rows = self.get_selected_rows()
         
         if len(selected_rows) == 0:
@@ -3770,32 +4108,21 @@ class MainWindow(QMainWindow):
         elif len(selected_rows) == 1:
             # Show detailed info for single selection
             try:
-                row = selected_rows[0]
-                category = self.items_table.item(row, 1).text() if self.items_table.item(row, 1) else ""
-                price_text = self.items_table.item(row, 6).text() if self.items_table.item(row, 6) else "0.00 €\n0.00 лв"
-                # Extract Euro price (first line)
-                price_eur = price_text.split('\n')[0].replace(" €", "").replace(" ", "")
-                self.selection_info_label.setText(f"Избран: {category} ({price_eur} €)")
+                record = self.get_row_record(selected_rows[0])
+                self.selection_info_label.setText(f"Избран: {record[1]} ({record[6]:.2f} €)")
             except:
                 self.selection_info_label.setText("Избран 1 артикул")
         else:
             # Show summary for multiple selections
             try:
-                total_value = 0
-                total_items = 0
-                for row in selected_rows:
-                    try:
-                        price_item = self.items_table.item(row, 6)  # Price column
-                        stock_item = self.items_table.item(row, 8)  # Stock column
-                        if price_item and stock_item:
-                            # Extract Euro price from dual currency text (first line)
-                            price_text = price_item.text().split('\n')[0].replace(" €", "").replace(" ", "")
-                            price = float(price_text)
-                            stock = int(stock_item.text())
-                            total_value += price * stock
-                            total_items += stock
-                    except (ValueError, AttributeError):
-                        pass
+                # Price and stock come from the loaded filter columns - no cell reads or text parsing
+                row_index, _ = self.get_inventory_view_state()
+                indices = row_index[np.fromiter(selected_rows, dtype=np.intp, count=len(selected_rows))]
+                indices = indices[indices >= 0]
+                cols = self._filter_cols
+                stocks = cols['stock'][indices]
+                total_value = float(cols['price'][indices] @ stocks)
+                total_items = int(stocks.sum())
                 
                 # Show total value in both currencies
                 total_value_lev = self.euro_to_lev(total_value)
@@ -3807,9 +4134,12 @@ class MainWindow(QMainWindow):
             except:
                 self.selection_info_label.setText(f"Избрани {len(selected_rows)} артикула")
         
-        # Also update the main summary to show selection count
-        # Trigger a search update to refresh summary
-        self.search_items()
+        # Also update the main summary to show selection count; the filter
+        # results are unchanged, so the last search's totals are reused
+        if self._last_search_summary is None:
+            self.search_items()
+        else:
+            self.refresh_main_summary()
     
     def handle_table_key_press(self, event):
         """Handle keyboard shortcuts in the table"""
@@ -3834,66 +4164,43 @@ class MainWindow(QMainWindow):
     def bulk_delete_items(self):
         """Delete multiple selected items"""
         try:
-            selected_barcodes = self.get_selected_barcodes()
-            if not selected_barcodes:
-                QMessageBox.warning(self, "Предупреждение", "Няма избрани артикули за изтриване")
-                return
+            # Refresh once after the whole batch, however many actions it runs
+            with self.defer_refresh():
+                selected_barcodes = self.get_selected_barcodes()
+                if not selected_barcodes:
+                    QMessageBox.warning(self, "Предупреждение", "Няма избрани артикули за изтриване")
+                    return
             
-            # Confirmation dialog
-            reply = QMessageBox.question(
-                self, "Изтрий артикули",
-                f"Сигурни ли сте, че искате да изтриете {len(selected_barcodes)} избрани артикула?\n\n"
-                f"Това действие е необратимо!",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No  # Default to No for safety
-            )
+                # Confirmation dialog
+                reply = QMessageBox.question(
+                    self, "Изтрий артикули",
+                    f"Сигурни ли сте, че искате да изтриете {len(selected_barcodes)} избрани артикула?\n\n"
+                    f"Това действие е необратимо!",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.No  # Default to No for safety
+                )
 
-            if reply == QMessageBox.StandardButton.Yes:
-                deleted_count = 0
-                failed_items = []
-                
-                # Delete each item using action system (only track the last one for undo)
-                last_successful_action = None
-                for barcode in selected_barcodes:
-                    try:
-                        # Get item_id from barcode
-                        with self.db.get_connection() as conn:
-                            cursor = conn.cursor()
-                            cursor.execute('SELECT id FROM items WHERE barcode = ?', (barcode,))
-                            result = cursor.fetchone()
-                            if result:
-                                item_id = result[0]
-                                delete_action = DeleteItemAction(self.db, item_id, barcode)
-                                if self.action_history.execute_action(delete_action):
-                                    deleted_count += 1
-                                    last_successful_action = delete_action
-                                else:
-                                    failed_items.append(barcode)
-                            else:
-                                failed_items.append(barcode)
-                    except Exception as e:
-                        logger.error(f"Error deleting item {barcode}: {e}")
-                        failed_items.append(barcode)
+                if reply == QMessageBox.StandardButton.Yes:
+                    deleted_count, failed_items, missing_items = self.delete_barcodes(selected_barcodes)
+                    failed_items += missing_items
                 
-                # Show results
-                if failed_items:
-                    QMessageBox.warning(
-                        self, "Частично изтриване",
-                        f"Изтрити: {deleted_count} артикула\n"
-                        f"Неуспешни: {len(failed_items)} артикула\n\n"
-                        f"Неуспешни баркодове: {', '.join(failed_items[:5])}"
-                        f"{'...' if len(failed_items) > 5 else ''}"
-                    )
-                else:
-                    QMessageBox.information(
-                        self, "Успех",
-                        f"Успешно изтрити {deleted_count} артикула"
-                    )
+                    # Show results
+                    if failed_items:
+                        QMessageBox.warning(
+                            self, "Частично изтриване",
+                            f"Изтрити: {deleted_count} артикула\n"
+                            f"Неуспешни: {len(failed_items)} артикула\n\n"
+                            f"Неуспешни баркодове: {', '.join(failed_items[:5])}"
+                            f"{'...' if len(failed_items) > 5 else ''}"
+                        )
+                    else:
+                        QMessageBox.information(
+                            self, "Успех",
+                            f"Успешно изтрити {deleted_count} артикула"
+                        )
                 
-                # Reload the table
-                self.load_items()
-                self.update_action_buttons()
-                self.update_reports_and_database_stats()
+                    # Reload the table
+                    self.request_refresh('items', 'actions', 'reports')
                 
         except Exception as e:
             QMessageBox.critical(self, "Грешка", f"Грешка при масово изтриване: {str(e)}")
@@ -3932,20 +4239,16 @@ class MainWindow(QMainWindow):
             # Shop selection
             layout.addWidget(QLabel("Избери магазин:"))
             shop_combo = QComboBox()
-            for shop in shops:
-                shop_combo.addItem(shop[1])
+            shop_combo.addItems([shop[1] for shop in shops])
             layout.addWidget(shop_combo)
 
             # Check minimum available stock to set reasonable limit
             min_available_stock = 1000  # Default high value
             try:
-                with self.db.get_connection() as conn:
-                    cursor = conn.cursor()
-                    for barcode in selected_barcodes[:5]:  # Check first 5 items for performance
-                        cursor.execute("SELECT stock_quantity FROM items WHERE barcode = ?", (barcode,))
-                        result = cursor.fetchone()
-                        if result and result[0] < min_available_stock:
-                            min_available_stock = result[0]
+                # One aggregate over the whole selection
+                selection_min = self.db.get_min_stock(selected_barcodes)
+                if selection_min is not None and selection_min < min_available_stock:
+                    min_available_stock = selection_min
             except Exception:
                 min_available_stock = 1
 
@@ -3980,18 +4283,17 @@ class MainWindow(QMainWindow):
                 shop_id = self.db.get_shop_id(shop_name)
                 
                 moved_count = 0
-                failed_items = []
                 
-                # Move each item
-                for barcode in selected_barcodes:
-                    try:
-                        if self.db.move_item_to_shop(shop_id, barcode, quantity):
-                            moved_count += 1
-                        else:
-                            failed_items.append(barcode)
-                    except Exception as e:
-                        logger.error(f"Error moving item {barcode}: {e}")
-                        failed_items.append(barcode)
+                # Resolve all item ids in one batched lookup; unknown barcodes fail up front
+                id_by_barcode = self.db.get_item_ids_by_barcodes(selected_barcodes)
+                
+                # Move every known item in one transaction - all of them or none
+                failed_items = [barcode for barcode in selected_barcodes if barcode not in id_by_barcode]
+                item_ids = [id_by_barcode[barcode] for barcode in selected_barcodes if barcode in id_by_barcode]
+                if item_ids and self.db.move_items_to_shop_bulk(shop_id, item_ids, quantity):
+                    moved_count = len(item_ids)
+                else:
+                    failed_items = list(selected_barcodes)
                 
                 # Show results
                 if failed_items:
@@ -4009,9 +4311,7 @@ class MainWindow(QMainWindow):
                     )
                 
                 # Reload both tables and update statistics
-                self.load_items()
-                self.load_shop_inventory()  # Refresh shop inventory table
-                self.update_reports_and_database_stats()
+                self.request_refresh('items', 'shop', 'reports')
                 
         except Exception as e:
             QMessageBox.critical(self, "Грешка", f"Грешка при масово преместване: {str(e)}")
@@ -4037,60 +4337,177 @@ class MainWindow(QMainWindow):
                 if not file_path.endswith('.xlsx'):
                     file_path += '.xlsx'
                 
-                # Create workbook
-                from openpyxl import Workbook
-                from openpyxl.utils import get_column_letter
-                wb = Workbook()
-                ws = wb.active
-                ws.title = "Избрани артикули"
+                # Create a write-only workbook - rows are streamed straight to the file
+                wb = Workbook(write_only=True)
+                ws = wb.create_sheet("Избрани артикули")
                 
-                # Headers
-                headers = [
-                    "Баркод", "Категория", "Метал", "Камък", "Описание", 
-                    "Цена на едро", "Цена", "Тегло", "Количество", "Дата", "Час"
-                ]
-                for col, header in enumerate(headers, 1):
-                    ws.cell(row=1, column=col, value=header)
+                # Headers (column widths must be set before the first row)
+                for col in range(1, len(SELECTED_EXPORT_HEADERS) + 1):
                     ws.column_dimensions[get_column_letter(col)].width = 15
-                
-                # Export selected items data
+                ws.append(SELECTED_EXPORT_HEADERS)
+                
+                # Export selected items from the parsed records behind each row;
+                # only the display-formatted date and time come from the cells
+                row_index, _ = self.get_inventory_view_state()
+                records = self.inventory_records
+                item_at = self.items_table.item
+                ws_append = ws.append
                 exported_count = 0
-                for row_idx, table_row in enumerate(selected_rows, 2):
+                for table_row in selected_rows:
+                    index = row_index[table_row]
+                    if index < 0:
+                        continue
                     try:
-                        # Export all columns except image column (9)
-                        col_mapping = [0, 1, 2, 3, 4, 5, 6, 7, 8, 10, 11]  # Skip image column (9)
-                        for excel_col, table_col in enumerate(col_mapping, 1):
-                            item = self.items_table.item(table_row, table_col)
-                            if item:
-                                value = item.text()
-                                # Clean up and format numeric values
-                                if table_col in [5, 6]:  # Cost, Price columns
-                                    value = value.replace(" лв", "").replace(" ", "")
-                                    try:
-                                        value = f"{float(value):.2f}"
-                                    except:
-                                        pass
-                                elif table_col == 7:  # Weight column
-                                    value = value.replace(" гр", "").replace(" ", "")
-                                    try:
-                                        value = f"{float(value):.2f}"
-                                    except:
-                                        pass
-                                ws.cell(row=row_idx, column=excel_col, value=value)
+                        record = records[index]
+                        date_cell = item_at(table_row, 9)
+                        time_cell = item_at(table_row, 10)
+                        ws_append((
+                            record[0], record[1], record[2], record[3], record[4],
+                            f"{record[5]:.2f}", f"{record[6]:.2f}", f"{record[7]:.2f}", record[8],
+                            date_cell.text() if date_cell else "",
+                            time_cell.text() if time_cell else "",
+                        ))
                         exported_count += 1
                     except Exception as e:
                         logger.warning(f"Error exporting row {table_row}: {e}")
                 
                 # Save file
-                wb.save(file_path)
-                QMessageBox.information(
-                    self, "Успех", 
-                    f"Успешно експортирани {exported_count} артикула в:\n{file_path}"
-                )
+                save_workbook(wb, file_path)
+                self.show_temp_success_message(f"Успешно експортирани {exported_count} артикула в:\n{file_path}")
                 
         except Exception as e:
             QMessageBox.critical(self, "Грешка", f"Грешка при експорт: {str(e)}")
     
+    def patch_item_prices(self, new_prices):
+        """Set new prices on loaded inventory rows in place; returns False if a full reload is needed"""
+        records = list(self.inventory_records)
+        index_of = {record[0]: index for index, record in enumerate(records) if record is not None}
+        
+        # Table row of every record (sorting moves rows, the record index stays on the barcode cell)
+        row_index, _ = self.get_inventory_view_state()
+        valid = row_index >= 0
+        row_of = np.full(len(records), -1, dtype=np.intp)
+        row_of[row_index[valid]] = np.flatnonzero(valid)
+        
+        targets = []
+        for barcode, price in new_prices.items():
+            index = index_of.get(barcode)
+            if index is None or row_of[index] < 0:
+                return False
+            targets.append((int(row_of[index]), index, price))
+        
+        # Rows must not re-sort while their cells change
+        self.items_table.setSortingEnabled(False)
+        try:
+            item_at = self.items_table.item
+            for row, index, price in targets:
+                item_at(row, 6).setText(dual_currency_text(price))
+                texts = [item_at(row, col).text() for col in range(11)]
+                record = records[index]
+                records[index] = record[:6] + (price,) + record[7:10] + (fold_search_text("\x00".join(texts)),)
+        finally:
+            self.items_table.setSortingEnabled(True)
+        
+        self.inventory_records = records
+        self.invalidate_inventory_view_state()
+        self._last_search_summary = None
+        self._filter_cols = self.build_filter_columns(records)
+        self._search_corpus = self.build_search_corpus(records)
+        self.search_items()  # Re-apply the active filters and refresh the summary
+        return True
+
+    def build_bulk_price_dialog(self):
+        """Build the bulk price dialog once; returns (dialog, info label, button group, absolute radio, inputs...)"""
+        dialog = QDialog(self)
+        dialog.setModal(True)
+        dialog.setFixedSize(400, 250)
+        layout = QVBoxLayout(dialog)
+        
+        # Info
+        info_label = QLabel()
+        layout.addWidget(info_label)
+        
+        # Price adjustment options
+        adjustment_group = QGroupBox("Метод на корекция")
+        adjustment_layout = QVBoxLayout()
+        
+        # Create button group for mutual exclusivity
+        from PyQt6.QtWidgets import QRadioButton, QButtonGroup
+        price_button_group = QButtonGroup(dialog)
+        
+        # Option 1: Set absolute price
+        set_absolute_radio = QRadioButton("Задай нова цена за всички")
+        price_button_group.addButton(set_absolute_radio, 0)
+        adjustment_layout.addWidget(set_absolute_radio)
+        
+        absolute_price_layout = QHBoxLayout()
+        absolute_price_layout.addWidget(QLabel("Нова цена:"))
+        absolute_price_input = BlurOnEnterDoubleSpinBox()
+        absolute_price_input.setRange(0, 999999)
+        absolute_price_input.setDecimals(2)
+        absolute_price_input.setSuffix(" лв")
+        absolute_price_layout.addWidget(absolute_price_input)
+        adjustment_layout.addLayout(absolute_price_layout)
+        
+        # Option 2: Percentage adjustment
+        percentage_radio = QRadioButton("Процентно изменение")
+        price_button_group.addButton(percentage_radio, 1)
+        adjustment_layout.addWidget(percentage_radio)
+        
+        percentage_layout = QHBoxLayout()
+        percentage_layout.addWidget(QLabel("Изменение:"))
+        percentage_input = BlurOnEnterDoubleSpinBox()
+        percentage_input.setRange(-99, 999)
+        percentage_input.setDecimals(1)
+        percentage_input.setSuffix(" %")
+        percentage_input.setEnabled(False)
+        percentage_layout.addWidget(percentage_input)
+        percentage_layout.addWidget(QLabel("(+ за увеличение, - за намаление)"))
+        adjustment_layout.addLayout(percentage_layout)
+        
+        # Option 3: Fixed amount adjustment
+        fixed_radio = QRadioButton("Фиксирано изменение")
+        price_button_group.addButton(fixed_radio, 2)
+        adjustment_layout.addWidget(fixed_radio)
+        
+        fixed_layout = QHBoxLayout()
+        fixed_layout.addWidget(QLabel("Изменение:"))
+        fixed_input = BlurOnEnterDoubleSpinBox()
+        fixed_input.setRange(-99999, 99999)
+        fixed_input.setDecimals(2)
+        fixed_input.setSuffix(" лв")
+        fixed_input.setEnabled(False)
+        fixed_layout.addWidget(fixed_input)
+        fixed_layout.addWidget(QLabel("(+ за увеличение, - за намаление)"))
+        adjustment_layout.addLayout(fixed_layout)
+        
+        adjustment_group.setLayout(adjustment_layout)
+        layout.addWidget(adjustment_group)
+        
+        # Connect radio buttons to enable/disable inputs
+        def toggle_inputs():
+            absolute_price_input.setEnabled(set_absolute_radio.isChecked())
+            percentage_input.setEnabled(percentage_radio.isChecked())
+            fixed_input.setEnabled(fixed_radio.isChecked())
+        
+        set_absolute_radio.toggled.connect(toggle_inputs)
+        percentage_radio.toggled.connect(toggle_inputs)
+        fixed_radio.toggled.connect(toggle_inputs)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        ok_button = QPushButton("Приложи")
+        cancel_button = QPushButton("Отказ")
+        button_layout.addWidget(ok_button)
+        button_layout.addWidget(cancel_button)
+        layout.addLayout(button_layout)
+        
+        ok_button.clicked.connect(dialog.accept)
+        cancel_button.clicked.connect(dialog.reject)
+        
+        return (dialog, info_label, price_button_group, set_absolute_radio,
+                absolute_price_input, percentage_input, fixed_input)
+
     def bulk_edit_prices(self):
         """Bulk edit prices for selected items"""
         try:
@@ -4099,101 +4516,17 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Предупреждение", "Няма избрани артикули за редактиране на цени")
                 return
             
-            # Create price adjustment dialog
-            dialog = QDialog(self)
+            # Price adjustment dialog, built once and reset to its defaults on every use
+            if self._bulk_price_dialog is None:
+                self._bulk_price_dialog = self.build_bulk_price_dialog()
+            (dialog, info_label, price_button_group, set_absolute_radio,
+             absolute_price_input, percentage_input, fixed_input) = self._bulk_price_dialog
             dialog.setWindowTitle(f"Редактиране на цени за {len(selected_barcodes)} артикула")
-            dialog.setModal(True)
-            dialog.setFixedSize(400, 250)
-            layout = QVBoxLayout(dialog)
-            
-            # Info
-            info_label = QLabel(f"Ще промените цените на {len(selected_barcodes)} избрани артикула:")
-            layout.addWidget(info_label)
-            
-            # Price adjustment options
-            adjustment_group = QGroupBox("Метод на корекция")
-            adjustment_layout = QVBoxLayout()
-            
-            # Create button group for mutual exclusivity
-            from PyQt6.QtWidgets import QRadioButton, QButtonGroup
-            price_button_group = QButtonGroup()
-            
-            # Option 1: Set absolute price
-            set_absolute_radio = QRadioButton("Задай нова цена за всички")
-            set_absolute_radio.setChecked(True)  # Default selection
-            price_button_group.addButton(set_absolute_radio, 0)
-            adjustment_layout.addWidget(set_absolute_radio)
-            
-            absolute_price_layout = QHBoxLayout()
-            absolute_price_layout.addWidget(QLabel("Нова цена:"))
-            absolute_price_input = BlurOnEnterDoubleSpinBox()
-            absolute_price_input.setRange(0, 999999)
-            absolute_price_input.setDecimals(2)
-            absolute_price_input.setSuffix(" лв")
-            absolute_price_input.setValue(100.0)  # Default value
-            absolute_price_layout.addWidget(absolute_price_input)
-            adjustment_layout.addLayout(absolute_price_layout)
-            
-            # Option 2: Percentage adjustment
-            percentage_radio = QRadioButton("Процентно изменение")
-            price_button_group.addButton(percentage_radio, 1)
-            adjustment_layout.addWidget(percentage_radio)
-            
-            percentage_layout = QHBoxLayout()
-            percentage_layout.addWidget(QLabel("Изменение:"))
-            percentage_input = BlurOnEnterDoubleSpinBox()
-            percentage_input.setRange(-99, 999)
-            percentage_input.setDecimals(1)
-            percentage_input.setSuffix(" %")
-            percentage_input.setValue(10.0)  # Default value
-            percentage_input.setEnabled(False)
-            percentage_layout.addWidget(percentage_input)
-            percentage_layout.addWidget(QLabel("(+ за увеличение, - за намаление)"))
-            adjustment_layout.addLayout(percentage_layout)
-            
-            # Option 3: Fixed amount adjustment
-            fixed_radio = QRadioButton("Фиксирано изменение")
-            price_button_group.addButton(fixed_radio, 2)
-            adjustment_layout.addWidget(fixed_radio)
-            
-            fixed_layout = QHBoxLayout()
-            fixed_layout.addWidget(QLabel("Изменение:"))
-            fixed_input = BlurOnEnterDoubleSpinBox()
-            fixed_input.setRange(-99999, 99999)
-            fixed_input.setDecimals(2)
-            fixed_input.setSuffix(" лв")
-            fixed_input.setValue(10.0)  # Default value
-            fixed_input.setEnabled(False)
-            fixed_layout.addWidget(fixed_input)
-            fixed_layout.addWidget(QLabel("(+ за увеличение, - за намаление)"))
-            adjustment_layout.addLayout(fixed_layout)
-            
-            adjustment_group.setLayout(adjustment_layout)
-            layout.addWidget(adjustment_group)
-            
-            # Connect radio buttons to enable/disable inputs
-            def toggle_inputs():
-                absolute_price_input.setEnabled(set_absolute_radio.isChecked())
-                percentage_input.setEnabled(percentage_radio.isChecked())
-                fixed_input.setEnabled(fixed_radio.isChecked())
-            
-            set_absolute_radio.toggled.connect(toggle_inputs)
-            percentage_radio.toggled.connect(toggle_inputs)
-            fixed_radio.toggled.connect(toggle_inputs)
-            
-            # Initialize with correct enabled state
-            toggle_inputs()
-            
-            # Buttons
-            button_layout = QHBoxLayout()
-            ok_button = QPushButton("Приложи")
-            cancel_button = QPushButton("Отказ")
-            button_layout.addWidget(ok_button)
-            button_layout.addWidget(cancel_button)
-            layout.addLayout(button_layout)
-            
-            ok_button.clicked.connect(dialog.accept)
-            cancel_button.clicked.connect(dialog.reject)
+            info_label.setText(f"Ще промените цените на {len(selected_barcodes)} избрани артикула:")
+            set_absolute_radio.setChecked(True)  # Default selection - toggles the inputs
+            absolute_price_input.setValue(100.0)  # Default values
+            percentage_input.setValue(10.0)
+            fixed_input.setValue(10.0)
             
             # Show dialog
             if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -4247,41 +4580,29 @@ class MainWindow(QMainWindow):
                     with self.db.get_connection() as conn:
                         cursor = conn.cursor()
                         
-                        for barcode in selected_barcodes:
-                            try:
-                                # Get current item data
-                                cursor.execute('SELECT id, price FROM items WHERE barcode = ?', (barcode,))
-                                result = cursor.fetchone()
-                                if not result:
-                                    failed_items.append(barcode)
-                                    continue
-                                
-                                item_id, current_price = result
-                                current_price = float(current_price)
-                                new_price = current_price
-                            
-                                # Calculate new price based on selected method
-                                if selected_method == 0:  # Absolute price
-                                    new_price = absolute_price_input.value()
-                                elif selected_method == 1:  # Percentage
-                                    change_percent = percentage_input.value()
-                                    new_price = current_price * (1 + change_percent / 100)
-                                elif selected_method == 2:  # Fixed amount
-                                    fixed_change = fixed_input.value()
-                                    new_price = current_price + fixed_change
-                                
-                                # Ensure price is not negative
-                                new_price = max(0, new_price)
-                                        
-                                logger.info(f"Updating item {barcode}: {current_price:.2f} -> {new_price:.2f}")
-                                    
-                                # Update in database
-                                cursor.execute('UPDATE items SET price = ? WHERE id = ?', (new_price, item_id))
-                                updated_count += 1
-                                
-                            except Exception as e:
-                                logger.error(f"Error updating price for item {barcode}: {e}")
-                                failed_items.append(barcode)
+                        # New price as an SQL expression over the current one, never below zero
+                        if selected_method == 0:  # Absolute price
+                            price_expr, price_param = 'MAX(0, ?)', absolute_price_input.value()
+                        elif selected_method == 1:  # Percentage
+                            price_expr, price_param = 'MAX(0, price * ?)', 1 + percentage_input.value() / 100
+                        else:  # Fixed amount
+                            price_expr, price_param = 'MAX(0, price + ?)', fixed_input.value()
+                        
+                        # Let SQLite do the arithmetic - one UPDATE per chunk, then read back the
+                        # new prices. Unknown barcodes and items without a price are left unchanged
+                        # and reported as failed
+                        new_prices = {}
+                        for start in range(0, len(selected_barcodes), 500):
+                            chunk = selected_barcodes[start:start + 500]
+                            placeholders = ",".join("?" * len(chunk))
+                            cursor.execute(
+                                f'UPDATE items SET price = {price_expr} WHERE barcode IN ({placeholders}) AND price IS NOT NULL',
+                                [price_param, *chunk]
+                            )
+                            updated_count += cursor.rowcount
+                            cursor.execute(f'SELECT barcode, price FROM items WHERE barcode IN ({placeholders}) AND price IS NOT NULL', chunk)
+                            new_prices.update(cursor.fetchall())
+                        failed_items = [barcode for barcode in selected_barcodes if barcode not in new_prices]
                         
                         # Commit all changes at once
                         conn.commit()
@@ -4309,23 +4630,12 @@ class MainWindow(QMainWindow):
                         f"Успешно обновени цените на {updated_count} артикула"
                     )
                 
-                # Force UI to process pending events
-                QApplication.processEvents()
-                
-                # Reload the table and update undo/redo buttons
-                logger.info("Refreshing inventory table after bulk price update...")
-                self.load_items()
-                
-                # Force table to refresh and update display
-                self.items_table.viewport().update()
-                QApplication.processEvents()
-                
-                # Update reports and database statistics
-                self.update_reports_and_database_stats()
+                # Patch the changed rows in place; reload only if some item is not in the table
+                if not self.patch_item_prices(new_prices):
+                    self.load_items()
                 
-                logger.info("Table refresh completed.")
-                # Note: Bulk price editing creates multiple individual edit actions
-                # The undo system will track the last edit action for undo capability
+                # Update reports and database statistics once the UI is interactive again
+                QTimer.singleShot(0, self.update_reports_and_database_stats)
                 
         except Exception as e:
             QMessageBox.critical(self, "Грешка", f"Грешка при масово редактиране на цени: {str(e)}")
@@ -4333,9 +4643,6 @@ class MainWindow(QMainWindow):
     def export_warehouse(self):
         """Export warehouse items to Excel and PDF"""
         try:
-            from datetime import datetime
-            import os
-            
             # Ensure exports directory exists
             exports_dir = self.get_exports_directory()
             
@@ -4351,6 +4658,7 @@ class MainWindow(QMainWindow):
             export_dialog = ExportFormatDialog(self)
             if export_dialog.exec() == QDialog.DialogCode.Accepted:
                 excel_selected, pdf_selected = export_dialog.get_selections()
+                compress = export_dialog.get_excel_compression()
                 
                 if excel_selected and pdf_selected:
                     # Get save location for Excel file
@@ -4373,10 +4681,11 @@ class MainWindow(QMainWindow):
                     if not pdf_file:
                         return
                     
-                    # Export both formats
-                    self.export_to_excel(items, "Склад", excel_file, date_str, time_str)
-                    self.export_to_pdf(items, "Склад", pdf_file, date_str, time_str)
-                    QMessageBox.information(self, "Успех", f"Експортирани файлове:\n- {os.path.basename(excel_file)}\n- {os.path.basename(pdf_file)}")
+                    # Export both formats in the background
+                    self.start_export([
+                        functools.partial(self.export_to_excel, items, "Склад", excel_file, date_str, time_str, compress=compress),
+                        functools.partial(self.export_to_pdf, items, "Склад", pdf_file, date_str, time_str),
+                    ], f"Експортирани файлове:\n- {os.path.basename(excel_file)}\n- {os.path.basename(pdf_file)}")
                 elif excel_selected:
                     # Get save location for Excel file
                     excel_filename = self.generate_bulgarian_filename("склад", "xlsx")
@@ -4388,9 +4697,10 @@ class MainWindow(QMainWindow):
                     if not excel_file:
                         return
                     
-                    # Export Excel only
-                    self.export_to_excel(items, "Склад", excel_file, date_str, time_str)
-                    QMessageBox.information(self, "Успех", f"Експортиран файл: {os.path.basename(excel_file)}")
+                    # Export Excel only, in the background
+                    self.start_export([
+                        functools.partial(self.export_to_excel, items, "Склад", excel_file, date_str, time_str, compress=compress),
+                    ], f"Експортиран файл: {os.path.basename(excel_file)}")
                 elif pdf_selected:
                     # Get save location for PDF file
                     pdf_filename = self.generate_bulgarian_filename("склад", "pdf")
@@ -4402,9 +4712,10 @@ class MainWindow(QMainWindow):
                     if not pdf_file:
                         return
                     
-                    # Export PDF only
-                    self.export_to_pdf(items, "Склад", pdf_file, date_str, time_str)
-                    QMessageBox.information(self, "Успех", f"Експортиран файл: {os.path.basename(pdf_file)}")
+                    # Export PDF only, in the background
+                    self.start_export([
+                        functools.partial(self.export_to_pdf, items, "Склад", pdf_file, date_str, time_str),
+                    ], f"Експортиран файл: {os.path.basename(pdf_file)}")
                 
         except Exception as e:
             QMessageBox.critical(self, "Грешка", f"Грешка при експорт на склад: {str(e)}")
@@ -4412,9 +4723,6 @@ class MainWindow(QMainWindow):
     def export_shop(self):
         """Export shop items to Excel and PDF"""
         try:
-            from datetime import datetime
-            import os
-            
             # Check if a shop is selected
             shop_name = self.shop_combo.currentText()
             if not shop_name:
@@ -4430,13 +4738,7 @@ class MainWindow(QMainWindow):
             time_str = now.strftime("%H:%M:%S")
             
             # Get shop items
-            shop_id = None
-            shops = self.db.get_all_shops()
-            for shop in shops:
-                if shop[1] == shop_name:
-                    shop_id = shop[0]
-                    break
-            
+            shop_id = self.db.get_shop_id(shop_name)
             if not shop_id:
                 QMessageBox.warning(self, "Грешка", "Магазинът не е намерен!")
                 return
@@ -4447,283 +4749,291 @@ class MainWindow(QMainWindow):
             export_dialog = ExportFormatDialog(self)
             if export_dialog.exec() == QDialog.DialogCode.Accepted:
                 excel_selected, pdf_selected = export_dialog.get_selections()
+                compress = export_dialog.get_excel_compression()
                 
-                # Generate Bulgarian filename based on shop name
-                shop_base_name = shop_name.lower().strip()
-                
-                if excel_selected and pdf_selected:
-                    # Get save location for Excel file
-                    excel_filename = self.generate_bulgarian_filename(shop_base_name, "xlsx")
-                    excel_file, _ = QFileDialog.getSaveFileName(
-                        self, f"Запази Excel файл за магазин {shop_name}", 
-                        f"{exports_dir}/{excel_filename}",
-                        "Excel Files (*.xlsx)"
-                    )
-                    if not excel_file:
-                        return
-                    
-                    # Get save location for PDF file
-                    pdf_filename = self.generate_bulgarian_filename(shop_base_name, "pdf")
-                    pdf_file, _ = QFileDialog.getSaveFileName(
-                        self, f"Запази PDF файл за магазин {shop_name}", 
-                        f"{exports_dir}/{pdf_filename}",
-                        "PDF Files (*.pdf)"
-                    )
-                    if not pdf_file:
-                        return
-                    
-                    # Export both formats
-                    self.export_to_excel(items, f"Магазин: {shop_name}", excel_file, date_str, time_str)
-                    self.export_to_pdf(items, f"Магазин: {shop_name}", pdf_file, date_str, time_str)
-                    QMessageBox.information(self, "Успех", f"Експортирани файлове:\n- {os.path.basename(excel_file)}\n- {os.path.basename(pdf_file)}")
-                elif excel_selected:
-                    # Get save location for Excel file
-                    excel_filename = self.generate_bulgarian_filename(shop_base_name, "xlsx")
-                    excel_file, _ = QFileDialog.getSaveFileName(
-                        self, f"Запази Excel файл за магазин {shop_name}", 
-                        f"{exports_dir}/{excel_filename}",
-                        "Excel Files (*.xlsx)"
-                    )
-                    if not excel_file:
-                        return
-                    
-                    # Export Excel only
-                    self.export_to_excel(items, f"Магазин: {shop_name}", excel_file, date_str, time_str)
-                    QMessageBox.information(self, "Успех", f"Експортиран файл: {os.path.basename(excel_file)}")
-                elif pdf_selected:
-                    # Get save location for PDF file
-                    pdf_filename = self.generate_bulgarian_filename(shop_base_name, "pdf")
-                    pdf_file, _ = QFileDialog.getSaveFileName(
-                        self, f"Запази PDF файл за магазин {shop_name}", 
-                        f"{exports_dir}/{pdf_filename}",
-                        "PDF Files (*.pdf)"
-                    )
-                    if not pdf_file:
-                        return
-                    
-                    # Export PDF only
-                    self.export_to_pdf(items, f"Магазин: {shop_name}", pdf_file, date_str, time_str)
-                    QMessageBox.information(self, "Успех", f"Експортиран файл: {os.path.basename(pdf_file)}")
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Грешка", f"Грешка при експорт на магазин: {str(e)}")
-
-    def export_to_excel(self, items, title, filename, date_str, time_str):
-        """Export items to Excel format"""
-        try:
-            import pandas as pd
-            
-            # Prepare data for Excel
-            data = []
-            for item in items:
-                # Handle both warehouse and shop item formats
-                if len(item) >= 13:  # Shop item format
-                    row = {
-                        'Баркод': item[1],
-                        'Име': item[2], 
-                        'Описание': item[3],
-                        'Категория': item[4],
-                        'Цена (лв)': f"{float(item[5]) * 1.95583:.2f}",
-                        'Цена на едро (лв)': f"{float(item[6]) * 1.95583:.2f}",
-                        'Тегло (г)': f"{float(item[7]):.2f}",
-                        'Метал': item[8],
-                        'Камък': item[9],
-                        'Количество': item[13] if len(item) > 13 else item[10]
-                    }
-                else:  # Warehouse item format
-                    row = {
-                        'Баркод': item[1],
-                        'Име': item[2], 
-                        'Описание': item[3],
-                        'Категория': item[4],
-                        'Цена (лв)': f"{float(item[5]) * 1.95583:.2f}",
-                        'Цена на едро (лв)': f"{float(item[6]) * 1.95583:.2f}",
-                        'Тегло (г)': f"{float(item[7]):.2f}",
-                        'Метал': item[8],
-                        'Камък': item[9],
-                        'Количество': item[10]
-                    }
-                data.append(row)
-            
-            # Create DataFrame
-            df = pd.DataFrame(data)
-            
-            # Create Excel writer with formatting
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                # Write title and date info
-                title_df = pd.DataFrame({
-                    'A': [title, f"Дата на експорт: {date_str}", f"Час на експорт: {time_str}", ""]
-                })
-                title_df.to_excel(writer, sheet_name='Данни', index=False, header=False, startrow=0)
-                
-                # Write main data
-                df.to_excel(writer, sheet_name='Данни', index=False, startrow=4)
-                
-                # Format the worksheet
-                worksheet = writer.sheets['Данни']
-                
-                # Set column widths
-                worksheet.column_dimensions['A'].width = 15  # Баркод
-                worksheet.column_dimensions['B'].width = 25  # Име
-                worksheet.column_dimensions['C'].width = 30  # Описание
-                worksheet.column_dimensions['D'].width = 15  # Категория
-                worksheet.column_dimensions['E'].width = 15  # Цена
-                worksheet.column_dimensions['F'].width = 18  # Цена на едро
-                worksheet.column_dimensions['G'].width = 12  # Тегло
-                worksheet.column_dimensions['H'].width = 12  # Метал
-                worksheet.column_dimensions['I'].width = 12  # Камък
-                worksheet.column_dimensions['J'].width = 12  # Количество
-                
-        except ImportError:
-            QMessageBox.critical(self, "Грешка", "Pandas библиотеката не е инсталирана. Моля инсталирайте я с: pip install pandas openpyxl")
-        except Exception as e:
-            raise e
-
-    def export_to_pdf(self, items, title, filename, date_str, time_str):
-        """Export items to PDF format with proper Cyrillic font support"""
-        try:
-            from reportlab.lib.pagesizes import A4
-            from reportlab.lib import colors
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-            from reportlab.lib.units import inch
-            from reportlab.pdfbase import pdfmetrics
-            from reportlab.pdfbase.ttfonts import TTFont
-            import os
-            
-            # Register fonts that support Cyrillic characters
-            try:
-                # Try to use system fonts that support Cyrillic
-                font_paths = [
-                    "fonts/arial.ttf",  # Our project font
-                    "C:/Windows/Fonts/arial.ttf",  # Windows system font
-                    "C:/Windows/Fonts/calibri.ttf",  # Alternative Windows font
-                    "/System/Library/Fonts/Arial.ttf",  # macOS system font
-                    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"  # Linux font
-                ]
-                
-                font_registered = False
-                for font_path in font_paths:
-                    if os.path.exists(font_path):
-                        try:
-                            pdfmetrics.registerFont(TTFont('CyrillicFont', font_path))
-                            pdfmetrics.registerFont(TTFont('CyrillicFont-Bold', font_path))  # Use same font for bold
-                            font_registered = True
-                            break
-                        except Exception:
-                            continue
-                
-                if not font_registered:
-                    # Fallback to built-in font (may not display Cyrillic properly)
-                    cyrillic_font = 'Helvetica'
-                    cyrillic_font_bold = 'Helvetica-Bold'
-                else:
-                    cyrillic_font = 'CyrillicFont'
-                    cyrillic_font_bold = 'CyrillicFont-Bold'
-                    
-            except Exception:
-                # Fallback to built-in fonts
-                cyrillic_font = 'Helvetica'
-                cyrillic_font_bold = 'Helvetica-Bold'
-            
-            # Create PDF document
-            doc = SimpleDocTemplate(filename, pagesize=A4)
-            elements = []
-            styles = getSampleStyleSheet()
-            
-            # Create custom styles with Cyrillic font support and black text
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Title'],
-                fontName=cyrillic_font_bold,
-                fontSize=16,
-                textColor=colors.black,  # Ensure black text
-                spaceAfter=12
-            )
-            
-            normal_style = ParagraphStyle(
-                'CustomNormal',
-                parent=styles['Normal'],
-                fontName=cyrillic_font,
-                fontSize=12,
-                textColor=colors.black,  # Ensure black text
-                spaceAfter=6
-            )
-            
-            # Title
-            title_para = Paragraph(title, title_style)
-            elements.append(title_para)
-            elements.append(Spacer(1, 12))
-            
-            # Date and time
-            date_para = Paragraph(f"Дата на експорт: {date_str} | Час на експорт: {time_str}", normal_style)
-            elements.append(date_para)
-            elements.append(Spacer(1, 20))
-            
-            # Prepare table data
-            table_data = [['Баркод', 'Име', 'Описание', 'Категория', 'Цена (лв)', 'Цена на едро (лв)', 'Тегло (г)', 'Метал', 'Камък', 'Количество']]
-            
-            for item in items:
-                # Handle both warehouse and shop item formats
-                if len(item) >= 13:  # Shop item format
-                    row = [
-                        str(item[1]) if item[1] else "",  # Баркод
-                        (str(item[2])[:15] + "..." if len(str(item[2])) > 15 else str(item[2])) if item[2] else "",  # Име (truncated)
-                        (str(item[3])[:20] + "..." if len(str(item[3])) > 20 else str(item[3])) if item[3] else "",  # Описание (truncated)
-                        str(item[4]) if item[4] else "",  # Категория
-                        f"{float(item[5]) * 1.95583:.2f}" if item[5] else "0.00",  # Цена
-                        f"{float(item[6]) * 1.95583:.2f}" if item[6] else "0.00",  # Цена на едро
-                        str(item[7]) if item[7] else "",  # Тегло
-                        str(item[8]) if item[8] else "",  # Метал
-                        str(item[9]) if item[9] else "",  # Камък
-                        str(item[13] if len(item) > 13 else item[10]) if len(item) > 10 else ""  # Количество
-                    ]
-                else:  # Warehouse item format
-                    row = [
-                        str(item[1]) if item[1] else "",  # Баркод
-                        (str(item[2])[:15] + "..." if len(str(item[2])) > 15 else str(item[2])) if item[2] else "",  # Име (truncated)
-                        (str(item[3])[:20] + "..." if len(str(item[3])) > 20 else str(item[3])) if item[3] else "",  # Описание (truncated)
-                        str(item[4]) if item[4] else "",  # Категория
-                        f"{float(item[5]) * 1.95583:.2f}" if item[5] else "0.00",  # Цена
-                        f"{float(item[6]) * 1.95583:.2f}" if item[6] else "0.00",  # Цена на едро
-                        str(item[7]) if item[7] else "",  # Тегло
-                        str(item[8]) if item[8] else "",  # Метал
-                        str(item[9]) if item[9] else "",  # Камък
-                        str(item[10]) if item[10] else ""  # Количество
-                    ]
-                table_data.append(row)
-            
-            # Create table with proper font support
-            table = Table(table_data)
-            table.setStyle(TableStyle([
-                # Header styling
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),  # White text on grey header
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), cyrillic_font_bold),  # Use Cyrillic font for header
-                ('FONTSIZE', (0, 0), (-1, 0), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                # Generate Bulgarian filename based on shop name
+                shop_base_name = shop_name.lower().strip()
                 
-                # Body styling
-                ('FONTNAME', (0, 1), (-1, -1), cyrillic_font),  # Use Cyrillic font for body
-                ('FONTSIZE', (0, 1), (-1, -1), 6),
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),  # BLACK text on light background
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),  # White background for body
+                if excel_selected and pdf_selected:
+                    # Get save location for Excel file
+                    excel_filename = self.generate_bulgarian_filename(shop_base_name, "xlsx")
+                    excel_file, _ = QFileDialog.getSaveFileName(
+                        self, f"Запази Excel файл за магазин {shop_name}", 
+                        f"{exports_dir}/{excel_filename}",
+                        "Excel Files (*.xlsx)"
+                    )
+                    if not excel_file:
+                        return
+                    
+                    # Get save location for PDF file
+                    pdf_filename = self.generate_bulgarian_filename(shop_base_name, "pdf")
+                    pdf_file, _ = QFileDialog.getSaveFileName(
+                        self, f"Запази PDF файл за магазин {shop_name}", 
+                        f"{exports_dir}/{pdf_filename}",
+                        "PDF Files (*.pdf)"
+                    )
+                    if not pdf_file:
+                        return
+                    
+                    # Export both formats in the background
+                    self.start_export([
+                        functools.partial(self.export_to_excel, items, f"Магазин: {shop_name}", excel_file, date_str, time_str, compress=compress),
+                        functools.partial(self.export_to_pdf, items, f"Магазин: {shop_name}", pdf_file, date_str, time_str),
+                    ], f"Експортирани файлове:\n- {os.path.basename(excel_file)}\n- {os.path.basename(pdf_file)}")
+                elif excel_selected:
+                    # Get save location for Excel file
+                    excel_filename = self.generate_bulgarian_filename(shop_base_name, "xlsx")
+                    excel_file, _ = QFileDialog.getSaveFileName(
+                        self, f"Запази Excel файл за магазин {shop_name}", 
+                        f"{exports_dir}/{excel_filename}",
+                        "Excel Files (*.xlsx)"
+                    )
+                    if not excel_file:
+                        return
+                    
+                    # Export Excel only, in the background
+                    self.start_export([
+                        functools.partial(self.export_to_excel, items, f"Магазин: {shop_name}", excel_file, date_str, time_str, compress=compress),
+                    ], f"Експортиран файл: {os.path.basename(excel_file)}")
+                elif pdf_selected:
+                    # Get save location for PDF file
+                    pdf_filename = self.generate_bulgarian_filename(shop_base_name, "pdf")
+                    pdf_file, _ = QFileDialog.getSaveFileName(
+                        self, f"Запази PDF файл за магазин {shop_name}", 
+                        f"{exports_dir}/{pdf_filename}",
+                        "PDF Files (*.pdf)"
+                    )
+                    if not pdf_file:
+                        return
+                    
+                    # Export PDF only, in the background
+                    self.start_export([
+                        functools.partial(self.export_to_pdf, items, f"Магазин: {shop_name}", pdf_file, date_str, time_str),
+                    ], f"Експортиран файл: {os.path.basename(pdf_file)}")
                 
-                # Grid and borders
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-            
-            elements.append(table)
-            
-            # Build PDF
-            doc.build(elements)
-            
-        except ImportError:
-            QMessageBox.critical(self, "Грешка", "ReportLab библиотеката не е инсталирана. Моля инсталирайте я с: pip install reportlab")
         except Exception as e:
-            raise e
+            QMessageBox.critical(self, "Грешка", f"Грешка при експорт на магазин: {str(e)}")
+
+    def start_export(self, jobs, success_message):
+        """Run export jobs on a worker thread; the result is reported when they finish"""
+        if self._export_job is not None:
+            QMessageBox.warning(self, "Предупреждение", "Експортът все още се изпълнява")
+            return
+        thread = QThread(self)
+        worker = ExportWorker(jobs, success_message)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self.on_export_finished)
+        worker.error.connect(self.on_export_failed)
+        # Stop the thread's event loop from the worker side so it ends even when the
+        # GUI thread is blocked (e.g. waiting for it in closeEvent)
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        self._export_job = (thread, worker)
+        self.set_export_buttons_enabled(False)
+        thread.start()
+
+    def finish_export(self):
+        """Stop the finished export thread and re-enable the export buttons"""
+        if self._export_job is None:
+            return
+        thread, worker = self._export_job
+        self._export_job = None
+        thread.quit()
+        thread.wait()
+        worker.deleteLater()
+        thread.deleteLater()
+        self.set_export_buttons_enabled(True)
+
+    def set_export_buttons_enabled(self, enabled):
+        """Enable or disable the warehouse and shop export buttons"""
+        for button_name in ('export_warehouse_btn', 'export_shop_btn'):
+            if hasattr(self, button_name):
+                getattr(self, button_name).setEnabled(enabled)
+
+    def on_export_finished(self, message):
+        """Report a completed background export with a non-blocking toast"""
+        self.finish_export()
+        self.show_temp_success_message(message)
+
+    def on_export_failed(self, error):
+        """Report a failed background export"""
+        self.finish_export()
+        QMessageBox.critical(self, "Грешка", f"Грешка при експорт: {error}")
+
+    def export_to_excel(self, items, title, filename, date_str, time_str, compress=True):
+        """Export items to Excel format, streaming rows through a write-only workbook"""
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+        
+        wb = Workbook(write_only=True)
+        header_font = Font(bold=True)
+        
+        def add_sheet(name):
+            """New data sheet with column widths set (write-only sheets need them before the first row)"""
+            sheet = wb.create_sheet(name)
+            for column, width in zip('ABCDEFGHIJ', (15, 25, 30, 15, 15, 18, 12, 12, 12, 12)):
+                sheet.column_dimensions[column].width = width
+            return sheet
+        
+        def append_headers(sheet):
+            """Append the bold header row"""
+            headers = []
+            for text in EXCEL_EXPORT_HEADERS:
+                cell = WriteOnlyCell(sheet, value=text)
+                cell.font = header_font
+                headers.append(cell)
+            sheet.append(headers)
+        
+        # Title and date info, a blank spacer row, then the header row
+        worksheet = add_sheet('Данни')
+        worksheet.append([title])
+        worksheet.append([f"Дата на експорт: {date_str}"])
+        worksheet.append([f"Час на експорт: {time_str}"])
+        worksheet.append([])
+        append_headers(worksheet)
+        
+        # Format the numeric columns for every row in one vectorized pass each
+        count = len(items)
+        prices = np.fromiter((item[5] for item in items), dtype=np.float64, count=count)
+        wholesale = np.fromiter((item[6] for item in items), dtype=np.float64, count=count)
+        weights = np.fromiter((item[7] for item in items), dtype=np.float64, count=count)
+        price_texts = np.char.mod("%.2f", prices * EUR_TO_LEV_RATE).tolist()
+        wholesale_texts = np.char.mod("%.2f", wholesale * EUR_TO_LEV_RATE).tolist()
+        weight_texts = np.char.mod("%.2f", weights).tolist()
+        
+        # Main data - shop items carry their shop quantity at index 13; a list holds
+        # only one kind of row, so the index is picked once
+        qty_idx = 13 if items and len(items[0]) > 13 else 10
+        # Every EXCEL_SHEET_ROWS rows continue on a new sheet, keeping each one
+        # well below Excel's 1,048,576-row limit
+        for start in range(0, count, EXCEL_SHEET_ROWS):
+            if start:
+                worksheet = add_sheet(f"Данни {start // EXCEL_SHEET_ROWS + 1}")
+                append_headers(worksheet)
+            end = start + EXCEL_SHEET_ROWS
+            for item, price_text, wholesale_text, weight_text in zip(
+                items[start:end], price_texts[start:end], wholesale_texts[start:end], weight_texts[start:end]
+            ):
+                worksheet.append((
+                    item[1], item[2], item[3], item[4],
+                    price_text, wholesale_text, weight_text,
+                    item[8], item[9], item[qty_idx],
+                ))
+        
+        save_workbook(wb, filename, compress)
+
+    def export_to_pdf(self, items, title, filename, date_str, time_str):
+        """Export items to PDF format with proper Cyrillic font support"""
+        # Fonts that support Cyrillic characters, registered once per session
+        cyrillic_font, cyrillic_font_bold = register_cyrillic_fonts()
+        
+        # Prepare table data
+        table_data = [['Баркод', 'Име', 'Описание', 'Категория', 'Цена (лв)', 'Цена на едро (лв)', 'Тегло (г)', 'Метал', 'Камък', 'Количество']]
+        
+        # Convert and format both price columns in one vectorized pass each (missing prices show 0.00)
+        count = len(items)
+        prices = np.fromiter((item[5] or 0.0 for item in items), dtype=np.float64, count=count)
+        wholesale = np.fromiter((item[6] or 0.0 for item in items), dtype=np.float64, count=count)
+        price_texts = np.char.mod("%.2f", prices * EUR_TO_LEV_RATE).tolist()
+        wholesale_texts = np.char.mod("%.2f", wholesale * EUR_TO_LEV_RATE).tolist()
+        
+        # Shop items carry their shop quantity at index 13; a list holds only one kind of row
+        qty_idx = 13 if items and len(items[0]) > 13 else 10
+        for item, price_text, wholesale_text in zip(items, price_texts, wholesale_texts):
+            quantity = item[qty_idx]
+            table_data.append([
+                str(item[1]) if item[1] else "",  # Баркод
+                truncate_text(item[2], 15),  # Име (truncated)
+                truncate_text(item[3], 20),  # Описание (truncated)
+                str(item[4]) if item[4] else "",  # Категория
+                price_text,  # Цена
+                wholesale_text,  # Цена на едро
+                str(item[7]) if item[7] else "",  # Тегло
+                str(item[8]) if item[8] else "",  # Метал
+                str(item[9]) if item[9] else "",  # Камък
+                "" if quantity is None else str(quantity),  # Количество
+            ])
+        
+        # Column widths fit the widest cell (6pt padding each side); a table wider than the page
+        # is shrunk as a whole - fonts, padding and row heights too - so text stays inside its cell
+        page_width, page_height = A4
+        margin = 72
+        header_size, body_size = 8, 6
+        widths = [pdfmetrics.stringWidth(text, cyrillic_font_bold, header_size) + 12 for text in table_data[0]]
+        for row in table_data[1:]:
+            for col, text in enumerate(row):
+                width = pdfmetrics.stringWidth(text, cyrillic_font, body_size) + 12
+                if width > widths[col]:
+                    widths[col] = width
+        scale = min(1.0, (page_width - 2 * margin) / sum(widths))
+        widths = [width * scale for width in widths]
+        header_size, body_size = header_size * scale, body_size * scale
+        table_width = sum(widths)
+        left = (page_width - table_width) / 2
+        edges = [left]
+        for width in widths:
+            edges.append(edges[-1] + width)
+        centers = [(edges[col] + edges[col + 1]) / 2 for col in range(len(widths))]
+        header_height, row_height = 24 * scale, 13 * scale
+        
+        # Draw the PDF page by page on a canvas instead of laying out one big table flowable
+        pdf = canvas.Canvas(filename, pagesize=A4)
+        pdf.setLineWidth(1)
+        pdf.setStrokeColor(colors.black)
+        
+        def draw_header(top):
+            """Grey header row with white text; returns the y below it"""
+            pdf.setFillColor(colors.grey)
+            pdf.rect(left, top - header_height, table_width, header_height, stroke=0, fill=1)
+            pdf.setFillColor(colors.white)
+            pdf.setFont(cyrillic_font_bold, header_size)
+            for text, center in zip(table_data[0], centers):
+                pdf.drawCentredString(center, top - header_height / 2, text)
+            pdf.setFillColor(colors.black)
+            pdf.setFont(cyrillic_font, body_size)
+            return top - header_height
+        
+        def draw_grid(top, row_lines):
+            """Grid lines of the table part drawn on the current page"""
+            bottom = row_lines[-1]
+            for x in edges:
+                pdf.line(x, top, x, bottom)
+            pdf.line(left, top, left + table_width, top)
+            for y in row_lines:
+                pdf.line(left, y, left + table_width, y)
+        
+        # Title and date
+        y = page_height - margin - 16
+        pdf.setFillColor(colors.black)
+        pdf.setFont(cyrillic_font_bold, 16)
+        pdf.drawCentredString(page_width / 2, y, title)
+        y -= 12 + 6 + 12
+        pdf.setFont(cyrillic_font, 12)
+        pdf.drawString(margin, y, f"Дата на експорт: {date_str} | Час на експорт: {time_str}")
+        y -= 6 + 20
+        
+        # Table rows; the header is repeated on every page
+        table_top = y
+        y = draw_header(table_top)
+        row_lines = [y]
+        for row in table_data[1:]:
+            if y - row_height < margin:
+                draw_grid(table_top, row_lines)
+                pdf.showPage()
+                pdf.setLineWidth(1)
+                pdf.setStrokeColor(colors.black)
+                table_top = page_height - margin
+                y = draw_header(table_top)
+                row_lines = [y]
+            baseline = y - row_height + 4.5 * scale
+            for text, center in zip(row, centers):
+                pdf.drawCentredString(center, baseline, text)
+            y -= row_height
+            row_lines.append(y)
+        draw_grid(table_top, row_lines)
+        
+        pdf.save()
 
     def create_sales_tab(self):
         """Create the sales management tab"""
@@ -4742,11 +5052,17 @@ class MainWindow(QMainWindow):
         sales_general_tab = QWidget()
         sales_general_layout = QVBoxLayout(sales_general_tab)
         
+        # Coalesce bursts of sales filter edits into a single search_sales pass
+        self._sales_search_timer = QTimer(self)
+        self._sales_search_timer.setSingleShot(True)
+        self._sales_search_timer.setInterval(200)  # One search per typing pause, not per keystroke
+        self._sales_search_timer.timeout.connect(self.search_sales)
+        
         # Main search bar for sales general search
         sales_main_search_layout = QHBoxLayout()
         self.sales_search_input = QLineEdit()
         self.sales_search_input.setPlaceholderText("Търси по всички полета (баркод, категория, метал, камък, описание, цени, тегло, количество, дата, час)...")
-        self.sales_search_input.textChanged.connect(self.search_sales)
+        self.sales_search_input.textChanged.connect(self.schedule_search_sales)
         clear_sales_search_btn = QPushButton("✕")
         clear_sales_search_btn.setFixedSize(30, 30)
         clear_sales_search_btn.clicked.connect(self.clear_sales_search)
@@ -4850,23 +5166,17 @@ class MainWindow(QMainWindow):
         self.time_button_group.buttonClicked.connect(self.on_time_filter_changed)
         self.time_button_group.buttonClicked.connect(self.update_reports_and_database_stats)
         
-        # Connect unified date fields to both reload sales AND trigger search
-        self.sales_start_date.dateChanged.connect(self.load_sales)
-        self.sales_end_date.dateChanged.connect(self.load_sales)
-        self.sales_start_date.dateChanged.connect(self.search_sales)
-        self.sales_end_date.dateChanged.connect(self.search_sales)
-        
-        # Auto-switch to custom period when calendar is clicked
-        self.sales_start_date.dateChanged.connect(self.auto_switch_to_custom_period)
-        self.sales_end_date.dateChanged.connect(self.auto_switch_to_custom_period)
+        # One slot per date change: switch to custom period, reload sales, then search
+        self.sales_start_date.dateChanged.connect(self.on_sales_date_changed)
+        self.sales_end_date.dateChanged.connect(self.on_sales_date_changed)
         
         # Also switch when user clicks into the date field or calendar popup
         self.sales_start_date.editingFinished.connect(self.auto_switch_to_custom_period)
         self.sales_end_date.editingFinished.connect(self.auto_switch_to_custom_period)
         
         # Use installEventFilter to catch focus events on the date fields
-        self.sales_start_date.installEventFilter(self)
-        self.sales_end_date.installEventFilter(self)
+        self.watch_events(self.sales_start_date, 'sales_date')
+        self.watch_events(self.sales_end_date, 'sales_date')
 
         # Shop selection dropdown
         shop_select_frame = QGroupBox("Магазин")
@@ -4876,8 +5186,7 @@ class MainWindow(QMainWindow):
         self.sales_shop_combo = QComboBox()
         self.sales_shop_combo.setMinimumWidth(200)
         shops = self.db.get_all_shops()
-        for shop in shops:
-            self.sales_shop_combo.addItem(shop[1])  # shop[1] is the name
+        self.sales_shop_combo.addItems([shop[1] for shop in shops])  # shop[1] is the name
         
         if self.sales_shop_combo.count() > 0:
             self.sales_shop_combo.setCurrentIndex(0)
@@ -4890,7 +5199,13 @@ class MainWindow(QMainWindow):
         # Add shop inventory info label
         shop_layout.addWidget(QLabel(" | "))
         self.shop_inventory_info_label = QLabel("Налични артикули в магазин: 0")
-        self.shop_inventory_info_label.setStyleSheet("color: #2196F3; font-weight: bold;")
+        # Colour variants are selected through the "state" property so that refreshing
+        # the label only re-polishes it instead of re-parsing a new stylesheet each time
+        self.shop_inventory_info_label.setStyleSheet(
+            'QLabel { color: #2196F3; font-weight: bold; }'
+            'QLabel[state="empty"] { color: #f44336; }'
+            'QLabel[state="ok"] { color: #4CAF50; }'
+        )
         shop_layout.addWidget(self.shop_inventory_info_label)
         
         shop_layout.addStretch()
@@ -5181,8 +5496,7 @@ class MainWindow(QMainWindow):
         
         # Load shops into combo box
         shops = self.db.get_all_shops()
-        for shop in sorted(shops, key=lambda x: x[1]):  # Sort by shop name
-            self.shop_combo.addItem(shop[1])
+        self.shop_combo.addItems(sorted(shop[1] for shop in shops))  # Sort by shop name
         
         add_shop_btn = QPushButton("+ Нов магазин")
         add_shop_btn.clicked.connect(self.add_new_shop)
@@ -5190,15 +5504,15 @@ class MainWindow(QMainWindow):
         edit_shop_btn.clicked.connect(self.rename_selected_shop)
         delete_shop_btn = QPushButton("🗑 Изтрий магазин")
         delete_shop_btn.clicked.connect(self.delete_selected_shop)
-        export_shop_btn = QPushButton("📄 Експорт магазин")
-        export_shop_btn.clicked.connect(self.export_shop)
+        self.export_shop_btn = QPushButton("📄 Експорт магазин")
+        self.export_shop_btn.clicked.connect(self.export_shop)
 
         shop_select_layout.addWidget(shop_label)
         shop_select_layout.addWidget(self.shop_combo)
         shop_select_layout.addWidget(add_shop_btn)
         shop_select_layout.addWidget(edit_shop_btn)
         shop_select_layout.addWidget(delete_shop_btn)
-        shop_select_layout.addWidget(export_shop_btn)
+        shop_select_layout.addWidget(self.export_shop_btn)
         shop_select_layout.addStretch()
         layout.addLayout(shop_select_layout)
 
@@ -5469,7 +5783,7 @@ class MainWindow(QMainWindow):
                 self.new_password_input.setEchoMode(QLineEdit.EchoMode.Normal)
                 self.show_new_password.setText("Скрий парола")
         
-        self.show_new_password.stateChanged.connect(lambda: toggle_new_password())
+        self.show_new_password.stateChanged.connect(toggle_new_password)
         new_password_row.addWidget(self.show_new_password)
         
         new_password_row.addStretch()  # Push everything to the left
@@ -5499,7 +5813,7 @@ class MainWindow(QMainWindow):
                 self.confirm_password_input.setEchoMode(QLineEdit.EchoMode.Normal)
                 self.show_confirm_password.setText("Скрий парола")
         
-        self.show_confirm_password.stateChanged.connect(lambda: toggle_confirm_password())
+        self.show_confirm_password.stateChanged.connect(toggle_confirm_password)
         confirm_password_row.addWidget(self.show_confirm_password)
         
         confirm_password_row.addStretch()  # Push everything to the left
@@ -5529,7 +5843,7 @@ class MainWindow(QMainWindow):
                 self.old_password_input.setEchoMode(QLineEdit.EchoMode.Normal)
                 self.show_old_password.setText("Скрий парола")
         
-        self.show_old_password.stateChanged.connect(lambda: toggle_old_password())
+        self.show_old_password.stateChanged.connect(toggle_old_password)
         old_password_row.addWidget(self.show_old_password)
         
         old_password_row.addStretch()  # Push everything to the left
@@ -5646,7 +5960,8 @@ class MainWindow(QMainWindow):
         # Set up periodic updates every 30 seconds for real-time stats
         from PyQt6.QtCore import QTimer
         self.db_stats_timer = QTimer()
-        self.db_stats_timer.timeout.connect(self.update_database_statistics)
+        # Only recompute while the tab is shown; otherwise flag for the next visit
+        self.db_stats_timer.timeout.connect(self.mark_database_stats_dirty)
         self.db_stats_timer.start(30000)  # Update every 30 seconds
 
         return widget
@@ -7057,41 +7372,9 @@ class MainWindow(QMainWindow):
             from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
             from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
             from reportlab.lib.units import inch
-            from reportlab.pdfbase import pdfmetrics
-            from reportlab.pdfbase.ttfonts import TTFont
-            import os
             
-            # Register fonts that support Cyrillic characters (same as existing export_to_pdf)
-            try:
-                font_paths = [
-                    "fonts/arial.ttf",  # Our project font
-                    "C:/Windows/Fonts/arial.ttf",  # Windows system font
-                    "C:/Windows/Fonts/calibri.ttf",  # Alternative Windows font
-                    "/System/Library/Fonts/Arial.ttf",  # macOS system font
-                    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"  # Linux font
-                ]
-                
-                font_registered = False
-                for font_path in font_paths:
-                    if os.path.exists(font_path):
-                        try:
-                            pdfmetrics.registerFont(TTFont('CyrillicFont', font_path))
-                            pdfmetrics.registerFont(TTFont('CyrillicFont-Bold', font_path))
-                            font_registered = True
-                            break
-                        except Exception:
-                            continue
-                
-                if not font_registered:
-                    cyrillic_font = 'Helvetica'
-                    cyrillic_font_bold = 'Helvetica-Bold'
-                else:
-                    cyrillic_font = 'CyrillicFont'
-                    cyrillic_font_bold = 'CyrillicFont-Bold'
-                    
-            except Exception:
-                cyrillic_font = 'Helvetica'
-                cyrillic_font_bold = 'Helvetica-Bold'
+            # Fonts that support Cyrillic characters, registered once per session
+            cyrillic_font, cyrillic_font_bold = register_cyrillic_fonts()
             
             # Create PDF document
             doc = SimpleDocTemplate(file_path, pagesize=A4, topMargin=0.5*inch)
@@ -7482,9 +7765,9 @@ class MainWindow(QMainWindow):
                     # Update shop combo
                     self.shop_combo.clear()
                     self.sales_shop_combo.clear()
-                    for shop in shops:
-                        self.shop_combo.addItem(shop[1])
-                        self.sales_shop_combo.addItem(shop[1])
+                    shop_names = [shop[1] for shop in shops]
+                    self.shop_combo.addItems(shop_names)
+                    self.sales_shop_combo.addItems(shop_names)
             except Exception as e:
                 logger.warning(f"Error loading shops: {e}")
                 
@@ -7497,6 +7780,9 @@ class MainWindow(QMainWindow):
     def load_sales(self):
         """Load sales into table with filtering"""
         try:
+            # Sales may have been recorded or removed - the sales count card is stale
+            self.mark_database_stats_dirty()
+            
             # Clear existing data
             self.sales_table.setRowCount(0)
             
@@ -7567,101 +7853,102 @@ class MainWindow(QMainWindow):
                 cursor.execute(base_query, params)
                 sales = cursor.fetchall()
                 
-                # Populate table
-                self.sales_table.setRowCount(len(sales))
-                for row, sale in enumerate(sales):
-                    # Updated to match new database query for sales
-                    # Need to get description from items table via join
-                    with self.db.get_connection() as conn:
-                        cursor = conn.cursor()
-                        cursor.execute("SELECT description FROM items WHERE barcode = ?", (sale[0],))
-                        description_row = cursor.fetchone()
-                        description = description_row[0] if description_row else ""
+                # Populate table with sorting and repaints suspended; with sorting enabled
+                # each setItem could reorder rows mid-population
+                self.sales_table.setSortingEnabled(False)
+                self.sales_table.setUpdatesEnabled(False)
+                try:
+                    self.sales_table.setRowCount(len(sales))
+                    for row, sale in enumerate(sales):
+                        # Updated to match new database query for sales
+                        # Need to get description from items table via join
+                        with self.db.get_connection() as conn:
+                            cursor = conn.cursor()
+                            cursor.execute("SELECT description FROM items WHERE barcode = ?", (sale[0],))
+                            description_row = cursor.fetchone()
+                            description = description_row[0] if description_row else ""
                     
-                    barcode, category, price, cost, weight, metal, stone, quantity, sale_date = sale
+                        barcode, category, price, cost, weight, metal, stone, quantity, sale_date = sale
                     
-                    # Parse and format the sale date
-                    try:
-                        dt = parse_database_datetime(sale_date)
-                        if dt:
-                            date_str = format_date_for_display(dt)
-                            time_str = format_time_for_display(dt)
-                        else:
+                        # Parse and format the sale date
+                        try:
+                            dt = parse_database_datetime(sale_date)
+                            if dt:
+                                date_str = format_date_for_display(dt)
+                                time_str = format_time_for_display(dt)
+                            else:
+                                date_str = ""
+                                time_str = ""
+                        except Exception:
                             date_str = ""
                             time_str = ""
-                    except Exception:
-                        date_str = ""
-                        time_str = ""
-                    
-                    # Set table items - matching new inventory table structure
-                    # ALL SALES TABLE ITEMS ARE IMMUTABLE (READ-ONLY)
-                    barcode_item = QTableWidgetItem(str(barcode))
-                    barcode_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    barcode_item.setFlags(barcode_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.sales_table.setItem(row, 0, barcode_item)
-                    
-                    category_item = QTableWidgetItem(str(category) if category else "")
-                    category_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    category_item.setFlags(category_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.sales_table.setItem(row, 1, category_item)
-                    
-                    metal_item = QTableWidgetItem(str(metal) if metal else "")
-                    metal_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    metal_item.setFlags(metal_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.sales_table.setItem(row, 2, metal_item)
-                    
-                    stone_item = QTableWidgetItem(str(stone) if stone else "")
-                    stone_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    stone_item.setFlags(stone_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.sales_table.setItem(row, 3, stone_item)
-                    
-                    description_item = QTableWidgetItem(str(description) if description else "")
-                    description_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    description_item.setFlags(description_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.sales_table.setItem(row, 4, description_item)
-                    
-                    # Cost in dual currency (assuming database stores Euro)
-                    if cost:
-                        cost_lev = self.euro_to_lev(cost)
-                        cost_text = f"{cost:.2f} €\n{cost_lev:.2f} лв"
-                    else:
-                        cost_text = "0.00 €\n0.00 лв"
-                    cost_item = QTableWidgetItem(cost_text)
-                    cost_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    cost_item.setFlags(cost_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.sales_table.setItem(row, 5, cost_item)
-                    
-                    # Price in dual currency (assuming database stores Euro)
-                    price_lev = self.euro_to_lev(price)
-                    price_text = f"{price:.2f} €\n{price_lev:.2f} лв"
-                    price_item = QTableWidgetItem(price_text)
-                    price_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    price_item.setFlags(price_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.sales_table.setItem(row, 6, price_item)
-                    
-                    weight_item = QTableWidgetItem(self.format_grams(weight) if weight else "")
-                    weight_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    weight_item.setFlags(weight_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.sales_table.setItem(row, 7, weight_item)
-                    
-                    quantity_item = QTableWidgetItem(str(quantity) if quantity else "1")
-                    quantity_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    quantity_item.setFlags(quantity_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.sales_table.setItem(row, 8, quantity_item)
-                    
-                    # Highlight row if quantity is 0 in sales (though this shouldn't normally happen)
-                    self.highlight_zero_quantity_row(self.sales_table, row, int(quantity) if quantity else 1)
-                    
-                    date_item = QTableWidgetItem(date_str)
-                    date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    date_item.setFlags(date_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.sales_table.setItem(row, 9, date_item)
-                    
-                    time_item = QTableWidgetItem(time_str)
-                    time_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    time_item.setFlags(time_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.sales_table.setItem(row, 10, time_item)
                     
+                        # Set table items - matching new inventory table structure
+                        # ALL SALES TABLE ITEMS ARE IMMUTABLE (READ-ONLY)
+                        barcode_item = QTableWidgetItem(str(barcode))
+                        barcode_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        barcode_item.setFlags(barcode_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        self.sales_table.setItem(row, 0, barcode_item)
+                    
+                        category_item = QTableWidgetItem(str(category) if category else "")
+                        category_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        category_item.setFlags(category_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        self.sales_table.setItem(row, 1, category_item)
+                    
+                        metal_item = QTableWidgetItem(str(metal) if metal else "")
+                        metal_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        metal_item.setFlags(metal_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        self.sales_table.setItem(row, 2, metal_item)
+                    
+                        stone_item = QTableWidgetItem(str(stone) if stone else "")
+                        stone_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        stone_item.setFlags(stone_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        self.sales_table.setItem(row, 3, stone_item)
+                    
+                        description_item = QTableWidgetItem(str(description) if description else "")
+                        description_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        description_item.setFlags(description_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        self.sales_table.setItem(row, 4, description_item)
+                    
+                        # Cost in dual currency (assuming database stores Euro)
+                        cost_item = QTableWidgetItem(dual_currency_text(cost or 0.0))
+                        cost_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        cost_item.setFlags(cost_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        self.sales_table.setItem(row, 5, cost_item)
+                    
+                        # Price in dual currency (assuming database stores Euro)
+                        price_item = QTableWidgetItem(dual_currency_text(price))
+                        price_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        price_item.setFlags(price_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        self.sales_table.setItem(row, 6, price_item)
+                    
+                        weight_item = QTableWidgetItem(self.format_grams(weight) if weight else "")
+                        weight_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        weight_item.setFlags(weight_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        self.sales_table.setItem(row, 7, weight_item)
+                    
+                        quantity_item = QTableWidgetItem(str(quantity) if quantity else "1")
+                        quantity_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        quantity_item.setFlags(quantity_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        self.sales_table.setItem(row, 8, quantity_item)
+                    
+                        # Highlight row if quantity is 0 in sales (though this shouldn't normally happen)
+                        self.highlight_zero_quantity_row(self.sales_table, row, int(quantity) if quantity else 1)
+                    
+                        date_item = QTableWidgetItem(date_str)
+                        date_item.setData(Qt.ItemDataRole.UserRole, date_key(dt) if date_str else 0)  # yyyymmdd for search_sales
+                        date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        date_item.setFlags(date_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        self.sales_table.setItem(row, 9, date_item)
+                    
+                        time_item = QTableWidgetItem(time_str)
+                        time_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        time_item.setFlags(time_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        self.sales_table.setItem(row, 10, time_item)
+                finally:
+                    self.sales_table.setUpdatesEnabled(True)
+                    self.sales_table.setSortingEnabled(True)
+
         except Exception as e:
             QMessageBox.critical(self, "Грешка", f"Грешка при зареждане на продажбите: {str(e)}")
             logger.error(f"Error loading sales: {e}", exc_info=True)
@@ -7708,43 +7995,11 @@ class MainWindow(QMainWindow):
             from reportlab.lib.pagesizes import A4
             from reportlab.lib import colors
             from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, TableStyle
             from reportlab.lib.units import inch
-            from reportlab.pdfbase import pdfmetrics
-            from reportlab.pdfbase.ttfonts import TTFont
-            import os
             
-            # Register fonts that support Cyrillic characters (same as existing export_to_pdf)
-            try:
-                font_paths = [
-                    "fonts/arial.ttf",  # Our project font
-                    "C:/Windows/Fonts/arial.ttf",  # Windows system font
-                    "C:/Windows/Fonts/calibri.ttf",  # Alternative Windows font
-                    "/System/Library/Fonts/Arial.ttf",  # macOS system font
-                    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"  # Linux font
-                ]
-                
-                font_registered = False
-                for font_path in font_paths:
-                    if os.path.exists(font_path):
-                        try:
-                            pdfmetrics.registerFont(TTFont('CyrillicFont', font_path))
-                            pdfmetrics.registerFont(TTFont('CyrillicFont-Bold', font_path))
-                            font_registered = True
-                            break
-                        except Exception:
-                            continue
-                
-                if not font_registered:
-                    cyrillic_font = 'Helvetica'
-                    cyrillic_font_bold = 'Helvetica-Bold'
-                else:
-                    cyrillic_font = 'CyrillicFont'
-                    cyrillic_font_bold = 'CyrillicFont-Bold'
-                    
-            except Exception:
-                cyrillic_font = 'Helvetica'
-                cyrillic_font_bold = 'Helvetica-Bold'
+            # Fonts that support Cyrillic characters, registered once per session
+            cyrillic_font, cyrillic_font_bold = register_cyrillic_fonts()
             
             # Create PDF document
             doc = SimpleDocTemplate(file_path, pagesize=A4, topMargin=0.5*inch)
@@ -7860,7 +8115,8 @@ class MainWindow(QMainWindow):
                 # Create table with proper column widths (removed description column)
                 col_widths = [1.1*inch, 1.2*inch, 1.0*inch, 1.0*inch, 0.9*inch, 0.8*inch, 0.6*inch, 1.0*inch]
                 
-                sales_table = Table(table_data, colWidths=col_widths)
+                # LongTable paginates long row lists faster; the header repeats on every page
+                sales_table = LongTable(table_data, colWidths=col_widths, repeatRows=1)
                 sales_table.setStyle(TableStyle([
                     ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
                     ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -7916,6 +8172,7 @@ class MainWindow(QMainWindow):
 
 
 
+    @pyqtSlot()
     def auto_resize_add_item_description(self):
         """Auto-resize description field in Add Item tab based on content"""
         try:
@@ -7926,10 +8183,14 @@ class MainWindow(QMainWindow):
             # Calculate required height (with some padding)
             required_height = max(self.desc_min_height, min(self.desc_max_height, int(doc_height) + 10))
             
-            # Set the height
+            # Most keystrokes don't change the line count - skip the relayout
+            if required_height == self._last_desc_h:
+                return
+            self._last_desc_h = required_height
             self.description_input.setFixedHeight(required_height)
         except Exception as e:
             # If anything goes wrong, just use minimum height
+            self._last_desc_h = self.desc_min_height
             self.description_input.setFixedHeight(self.desc_min_height)
 
     def euro_to_lev(self, euro_amount):
@@ -7942,29 +8203,25 @@ class MainWindow(QMainWindow):
     
     def format_currency_eur(self, amount):
         """Format amount as Euro currency with thousands separators"""
-        return f"{amount:,.2f} €".replace(",", " ")
+        return format_eur_amount(amount)
     
     def format_currency_lev(self, amount):
         """Format amount as Lev currency with thousands separators"""
-        return f"{amount:,.2f} лв".replace(",", " ")
+        return format_lev_amount(amount)
     
-    def update_lev_price(self):
+    @pyqtSlot(float)
+    def update_lev_price(self, euro_price=None):
         """Update Lev price when Euro price changes"""
-        try:
+        if euro_price is None:
             euro_price = self.price_input.value()
-            lev_price = self.euro_to_lev(euro_price)
-            self.price_lev_label.setText(self.format_currency_lev(lev_price))
-        except Exception as e:
-            self.price_lev_label.setText("0.00 лв")
+        self.price_lev_label.setText(format_lev_amount(round(euro_price * self.EUR_TO_LEV_RATE, 2)))
     
-    def update_lev_cost(self):
+    @pyqtSlot(float)
+    def update_lev_cost(self, euro_cost=None):
         """Update Lev cost when Euro cost changes"""
-        try:
+        if euro_cost is None:
             euro_cost = self.cost_input.value()
-            lev_cost = self.euro_to_lev(euro_cost)
-            self.cost_lev_label.setText(self.format_currency_lev(lev_cost))
-        except Exception as e:
-            self.cost_lev_label.setText("0.00 лв")
+        self.cost_lev_label.setText(format_lev_amount(round(euro_cost * self.EUR_TO_LEV_RATE, 2)))
 
     def save_item(self):
         """Save item to database"""
@@ -8319,8 +8576,9 @@ class MainWindow(QMainWindow):
                 # Set dates to default range like warehouse - search function will skip filtering
                 self.programmatic_date_change = True
                 try:
-                    self.sales_start_date.setDate(QDate.currentDate().addMonths(-1))
-                    self.sales_end_date.setDate(QDate.currentDate())
+                    today = QDate.currentDate()
+                    self.sales_start_date.setDate(today.addMonths(-1))
+                    self.sales_end_date.setDate(today)
                 finally:
                     self.programmatic_date_change = False
                 
@@ -8335,6 +8593,12 @@ class MainWindow(QMainWindow):
                 if hasattr(self, 'search_sales'):
                     self.search_sales()
     
+    def on_sales_date_changed(self, *_):
+        """Handle a sales date field change - custom period first, so load_sales uses the new range"""
+        self.auto_switch_to_custom_period()
+        self.load_sales()
+        self.schedule_search_sales()
+
     def auto_switch_to_custom_period(self):
         """Automatically switch to custom period when date is changed"""
         # Don't switch if we're in the middle of a programmatic change
@@ -8348,6 +8612,7 @@ class MainWindow(QMainWindow):
             self.sales_start_date.setEnabled(True)
             self.sales_end_date.setEnabled(True)
     
+    @pyqtSlot()
     def auto_switch_to_custom_inventory_period(self):
         """Automatically switch to custom period when inventory date is changed"""
         # Don't switch if we're in the middle of a programmatic change
@@ -8361,117 +8626,64 @@ class MainWindow(QMainWindow):
             self.start_date_input.setEnabled(True)
             self.end_date_input.setEnabled(True)
     
+    def make_spin_box(self, role, range_max, spin_class=BlurOnEnterDoubleSpinBox, decimals=None,
+                      suffix=None, value=None, max_width=None):
+        """Create a blur-on-Enter spin box watched by eventFilter (auto-clear on click)"""
+        spin_box = spin_class()
+        spin_box.setRange(0, range_max)
+        if decimals is not None:
+            spin_box.setDecimals(decimals)
+        if suffix:
+            spin_box.setSuffix(suffix)
+        if value is not None:
+            spin_box.setValue(value)
+        if max_width:
+            spin_box.setMaximumWidth(max_width)
+        self.watch_events(spin_box.lineEdit(), role, spin_box)
+        return spin_box
+    
+    def watch_events(self, obj, role, spin_box=None):
+        """Install the main window event filter on a widget and record how to handle it"""
+        self._event_filter_roles[obj] = (role, spin_box)
+        obj.installEventFilter(self)
+    
+    # Event types eventFilter acts on; everything else passes straight through
+    _FILTERED_EVENT_TYPES = (QEvent.Type.FocusIn, QEvent.Type.MouseButtonPress, QEvent.Type.KeyPress)
+    
     def eventFilter(self, obj, event):
         """Event filter to catch focus events on date pickers and input fields"""
         try:
-            # Check if it's a focus event on our sales date pickers
-            if (obj == self.sales_start_date or obj == self.sales_end_date) and hasattr(self, 'custom_radio'):
-                if event.type() == event.Type.FocusIn or event.type() == event.Type.MouseButtonPress:
-                    # User clicked into the date field, auto-switch to custom period
-                    self.auto_switch_to_custom_period()
-            
-            # Check if it's a focus event on our inventory date pickers
-            if (obj == self.start_date_input or obj == self.end_date_input) and hasattr(self, 'inv_custom_radio'):
-                if event.type() == event.Type.FocusIn or event.type() == event.Type.MouseButtonPress:
-                    # User clicked into the date field, auto-switch to custom period
-                    self.auto_switch_to_custom_inventory_period()
-            
-            # Auto-clear text for spinbox input fields in add item tab
-            if hasattr(self, 'price_input') and hasattr(self, 'cost_input') and hasattr(self, 'weight_input') and hasattr(self, 'stock_input'):
-                if (obj == self.price_input.lineEdit() or 
-                    obj == self.cost_input.lineEdit() or 
-                    obj == self.weight_input.lineEdit() or 
-                    obj == self.stock_input.lineEdit()):
-                    
-                    if event.type() == event.Type.FocusIn or event.type() == event.Type.MouseButtonPress:
-                        # Clear the field and position cursor when field gains focus or is clicked
-                        line_edit = obj
-                        # Determine which spinbox this line edit belongs to and clear its value
-                        from PyQt6.QtCore import QTimer
-                        
-                        def clear_field():
-                            if obj == self.price_input.lineEdit():
-                                self.price_input.setValue(0)
-                                self.price_input.lineEdit().clear()
-                            elif obj == self.cost_input.lineEdit():
-                                self.cost_input.setValue(0)
-                                self.cost_input.lineEdit().clear()
-                            elif obj == self.weight_input.lineEdit():
-                                self.weight_input.setValue(0)
-                                self.weight_input.lineEdit().clear()
-                            elif obj == self.stock_input.lineEdit():
-                                self.stock_input.setValue(0)
-                                self.stock_input.lineEdit().clear()
-                        
-                        # Use QTimer.singleShot to ensure clearing happens after the click event is processed
-                        QTimer.singleShot(0, clear_field)
-            
-            # Auto-clear text for spinbox input fields in warehouse price/weight search tab
-            if hasattr(self, 'min_price_input') and hasattr(self, 'max_price_input') and hasattr(self, 'min_weight_input') and hasattr(self, 'max_weight_input'):
-                if (obj == self.min_price_input.lineEdit() or 
-                    obj == self.max_price_input.lineEdit() or 
-                    obj == self.min_weight_input.lineEdit() or 
-                    obj == self.max_weight_input.lineEdit()):
-                    
-                    if event.type() == event.Type.FocusIn or event.type() == event.Type.MouseButtonPress:
-                        # Clear the field and position cursor when field gains focus or is clicked
-                        from PyQt6.QtCore import QTimer
-                        
-                        def clear_warehouse_field():
-                            if obj == self.min_price_input.lineEdit():
-                                self.min_price_input.setValue(0)
-                                self.min_price_input.lineEdit().clear()
-                            elif obj == self.max_price_input.lineEdit():
-                                self.max_price_input.setValue(0)
-                                self.max_price_input.lineEdit().clear()
-                            elif obj == self.min_weight_input.lineEdit():
-                                self.min_weight_input.setValue(0)
-                                self.min_weight_input.lineEdit().clear()
-                            elif obj == self.max_weight_input.lineEdit():
-                                self.max_weight_input.setValue(0)
-                                self.max_weight_input.lineEdit().clear()
-                        
-                        # Use QTimer.singleShot to ensure clearing happens after the click event is processed
-                        QTimer.singleShot(0, clear_warehouse_field)
-            
-            # Handle Enter key press for blur functionality
-            if event.type() == event.Type.KeyPress:
-                if event.key() == Qt.Key.Key_Return or event.key() == Qt.Key.Key_Enter:
-                    # Check if this is one of our numeric input fields
-                    input_fields = []
-                    if hasattr(self, 'price_input'):
-                        input_fields.append(self.price_input.lineEdit())
-                    if hasattr(self, 'cost_input'):
-                        input_fields.append(self.cost_input.lineEdit())
-                    if hasattr(self, 'weight_input'):
-                        input_fields.append(self.weight_input.lineEdit())
-                    if hasattr(self, 'stock_input'):
-                        input_fields.append(self.stock_input.lineEdit())
-                    if hasattr(self, 'min_price_input'):
-                        input_fields.append(self.min_price_input.lineEdit())
-                    if hasattr(self, 'max_price_input'):
-                        input_fields.append(self.max_price_input.lineEdit())
-                    if hasattr(self, 'min_weight_input'):
-                        input_fields.append(self.min_weight_input.lineEdit())
-                    if hasattr(self, 'max_weight_input'):
-                        input_fields.append(self.max_weight_input.lineEdit())
-                    
-                    if obj in input_fields:
-                        # Clear focus from the line edit
+            event_type = event.type()
+            if event_type in self._FILTERED_EVENT_TYPES:
+                role, spin_box = self._event_filter_roles.get(obj, (None, None))
+                
+                if event_type == QEvent.Type.KeyPress:
+                    # Blur numeric input fields on Enter
+                    if spin_box is not None and event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
                         obj.clearFocus()
-                        
                         # Use QTimer to clear selection after focus is processed
-                        def clear_selection():
-                            obj.deselect()
-                        
-                        QTimer.singleShot(0, clear_selection)
+                        QTimer.singleShot(0, obj.deselect)
                         return True  # Event handled
-                        
+                elif role == 'sales_date':
+                    # User clicked into the date field, auto-switch to custom period
+                    if hasattr(self, 'custom_radio'):
+                        self.auto_switch_to_custom_period()
+                elif role == 'inventory_date':
+                    if hasattr(self, 'inv_custom_radio'):
+                        self.auto_switch_to_custom_inventory_period()
+                elif spin_box is not None:
+                    # Clear the field after the click/focus event is processed
+                    QTimer.singleShot(0, functools.partial(self.clear_spin_field, spin_box))
         except Exception:
             pass  # Ignore any errors in event filtering
         
         # Always call the parent event filter
         return super().eventFilter(obj, event)
+    
+    def clear_spin_field(self, spin_box):
+        """Reset a spin box to zero and leave its text empty for typing"""
+        spin_box.setValue(0)
+        spin_box.lineEdit().clear()
 
 
 
@@ -8518,100 +8730,106 @@ class MainWindow(QMainWindow):
             self.shop_table.repaint()
             
             # Update table with new consistent structure
-            self.shop_table.setRowCount(len(items))
+            # Populate with sorting and repaints suspended; with sorting enabled
+            # each setItem could reorder rows mid-population
+            self.shop_table.setSortingEnabled(False)
+            self.shop_table.setUpdatesEnabled(False)
+            try:
+                self.shop_table.setRowCount(len(items))
             
-            for row, item in enumerate(items):
+                for row, item in enumerate(items):
                 
-                try:
-                    # Parse and format the date - prioritize updated_at timestamp
-                    date_added = None
                     try:
                         # The query returns: id, barcode, name, description, category, price, 
                         # cost, weight, metal_type, stone_type, stock_quantity, 
                         # created_at, updated_at, shop_quantity
-                        # So: created_at is item[11], updated_at is item[12], shop_quantity is item[13]
-                        if len(item) > 12 and item[12]:  # updated_at column (prioritize for latest changes)
-                            date_added = parse_database_datetime(item[12])
-                        elif len(item) > 11 and item[11]:  # created_at column (fallback)
-                            date_added = parse_database_datetime(item[11])
-                    except (IndexError, TypeError, ValueError):
-                        date_added = None
-                    
-                    if date_added:
-                        date_str = format_date_for_display(date_added)
-                        time_str = format_time_for_display(date_added)
-                    else:
-                        date_str = ""
-                        time_str = ""
-                    
-                    # Set table items matching new structure with NULL safety
-                    barcode_item = QTableWidgetItem(str(item[1]) if len(item) > 1 and item[1] is not None else "")
-                    barcode_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.shop_table.setItem(row, 0, barcode_item)  # Barcode
-                    
-                    category_item = QTableWidgetItem(str(item[4]) if len(item) > 4 and item[4] is not None else "")
-                    category_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.shop_table.setItem(row, 1, category_item)  # Category
-                    
-                    metal_item = QTableWidgetItem(str(item[8]) if len(item) > 8 and item[8] is not None else "")
-                    metal_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.shop_table.setItem(row, 2, metal_item)  # Metal
-                    
-                    stone_item = QTableWidgetItem(str(item[9]) if len(item) > 9 and item[9] is not None else "")
-                    stone_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.shop_table.setItem(row, 3, stone_item)  # Stone
-                    
-                    description_item = QTableWidgetItem(str(item[3]) if len(item) > 3 and item[3] is not None else "")
-                    description_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.shop_table.setItem(row, 4, description_item)  # Description
-                    
-                    # Handle cost (Euro in database)
-                    cost_eur = float(item[6]) if len(item) > 6 and item[6] is not None else 0.0
-                    cost_lev = self.euro_to_lev(cost_eur)
-                    cost_text = f"{cost_eur:.2f} €\n{cost_lev:.2f} лв"
-                    cost_item = QTableWidgetItem(cost_text)
-                    cost_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.shop_table.setItem(row, 5, cost_item)  # Cost
-                    
-                    # Handle price (Euro in database)
-                    price_eur = float(item[5]) if len(item) > 5 and item[5] is not None else 0.0
-                    price_lev = self.euro_to_lev(price_eur)
-                    price_text = f"{price_eur:.2f} €\n{price_lev:.2f} лв"
-                    price_item = QTableWidgetItem(price_text)
-                    price_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.shop_table.setItem(row, 6, price_item)  # Price
+                        (_, barcode, _, description, category, price_eur, cost_eur, weight,
+                         metal, stone, _, created_at, updated_at, shop_stock) = item
                     
-                    # Handle weight
-                    weight = float(item[7]) if len(item) > 7 and item[7] is not None else 0.0
-                    weight_item = QTableWidgetItem(self.format_grams(weight))
-                    weight_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.shop_table.setItem(row, 7, weight_item)  # Weight
-                    
-                    # Handle shop stock (shop_quantity is at index 13 from the fixed query)
-                    shop_stock = int(item[13]) if len(item) > 13 and item[13] is not None else 0
-                    stock_item = QTableWidgetItem(str(shop_stock))
-                    stock_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.shop_table.setItem(row, 8, stock_item)  # Shop Stock
-                    
-                    # Highlight row if quantity is 0 in shop
-                    self.highlight_zero_quantity_row(self.shop_table, row, shop_stock)
-                
-                    # Date and Time
-                    date_item = QTableWidgetItem(date_str)
-                    date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.shop_table.setItem(row, 9, date_item)  # Date
+                        # Parse and format the date - prioritize updated_at timestamp
+                        date_added = None
+                        try:
+                            if updated_at:  # updated_at column (prioritize for latest changes)
+                                date_added = parse_database_datetime(updated_at)
+                            elif created_at:  # created_at column (fallback)
+                                date_added = parse_database_datetime(created_at)
+                        except (TypeError, ValueError):
+                            date_added = None
+                    
+                        if date_added:
+                            date_str = format_date_for_display(date_added)
+                            time_str = format_time_for_display(date_added)
+                        else:
+                            date_str = ""
+                            time_str = ""
                     
-                    time_item = QTableWidgetItem(time_str)
-                    time_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.shop_table.setItem(row, 10, time_item)  # Time
+                        # Set table items matching new structure with NULL safety
+                        barcode_item = QTableWidgetItem("" if barcode is None else str(barcode))
+                        barcode_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.shop_table.setItem(row, 0, barcode_item)  # Barcode
+                    
+                        category_item = QTableWidgetItem("" if category is None else str(category))
+                        category_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.shop_table.setItem(row, 1, category_item)  # Category
+                    
+                        metal_item = QTableWidgetItem("" if metal is None else str(metal))
+                        metal_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.shop_table.setItem(row, 2, metal_item)  # Metal
+                    
+                        stone_item = QTableWidgetItem("" if stone is None else str(stone))
+                        stone_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.shop_table.setItem(row, 3, stone_item)  # Stone
+                    
+                        description_item = QTableWidgetItem("" if description is None else str(description))
+                        description_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.shop_table.setItem(row, 4, description_item)  # Description
+                    
+                        # Handle cost (Euro in database)
+                        cost_eur = 0.0 if cost_eur is None else float(cost_eur)
+                        cost_item = QTableWidgetItem(dual_currency_text(cost_eur))
+                        cost_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.shop_table.setItem(row, 5, cost_item)  # Cost
+                    
+                        # Handle price (Euro in database)
+                        price_eur = 0.0 if price_eur is None else float(price_eur)
+                        price_item = QTableWidgetItem(dual_currency_text(price_eur))
+                        price_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.shop_table.setItem(row, 6, price_item)  # Price
+                    
+                        # Handle weight
+                        weight = 0.0 if weight is None else float(weight)
+                        weight_item = QTableWidgetItem(self.format_grams(weight))
+                        weight_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.shop_table.setItem(row, 7, weight_item)  # Weight
+                    
+                        # Handle shop stock (shop_quantity column)
+                        shop_stock = 0 if shop_stock is None else int(shop_stock)
+                        stock_item = QTableWidgetItem(str(shop_stock))
+                        stock_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.shop_table.setItem(row, 8, stock_item)  # Shop Stock
+                    
+                        # Highlight row if quantity is 0 in shop
+                        self.highlight_zero_quantity_row(self.shop_table, row, shop_stock)
+                
+                        # Date and Time
+                        date_item = QTableWidgetItem(date_str)
+                        date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.shop_table.setItem(row, 9, date_item)  # Date
+                    
+                        time_item = QTableWidgetItem(time_str)
+                        time_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.shop_table.setItem(row, 10, time_item)  # Time
                     
-                except Exception as e:
-                    logger.error(f"Error loading shop item at row {row}: {e}")
-                    print(f"📄 Exception type: {type(e)}")
-                    import traceback
-                    print(f"📄 Full traceback:")
-                    traceback.print_exc()
-                    continue
+                    except Exception as e:
+                        logger.error(f"Error loading shop item at row {row}: {e}")
+                        print(f"📄 Exception type: {type(e)}")
+                        import traceback
+                        print(f"📄 Full traceback:")
+                        traceback.print_exc()
+                        continue
+            finally:
+                self.shop_table.setUpdatesEnabled(True)
+                self.shop_table.setSortingEnabled(True)
 
             # Update summary
             self.update_shop_summary(items)
@@ -8781,19 +8999,18 @@ class MainWindow(QMainWindow):
             stone = stone_item.text()
             description = description_item.text() if description_item else ""
             
-            # Parse dual currency format (Euro on first line)
-            cost_text = cost_item.text().split('\n')[0].replace(" €", "").replace(" ", "") if cost_item else "0"
-            price_text = price_item.text().split('\n')[0].replace(" €", "").replace(" ", "") if price_item else "0"
+            # Dual currency cells (Euro on first line), parsed below
+            cost_text = cost_item.text() if cost_item else ""
+            price_text = price_item.text() if price_item else ""
             weight_text = weight_item.text()
             shop_stock_text = shop_stock_item.text()
             
-            # Convert numeric values with error handling
-            try:
-                price = float(price_text) if price_text else 0.0
-                cost = float(cost_text) if cost_text else 0.0
-                shop_stock = int(shop_stock_text) if shop_stock_text else 0
-            except (ValueError, IndexError) as e:
-                QMessageBox.warning(self, "Грешка", f"Невалидни числови данни: {str(e)}")
+            # Convert numeric values; None marks a cell that does not hold a valid number
+            price = parse_number_or_none(price_text, parse_eur_cell, 0.0)
+            cost = parse_number_or_none(cost_text, parse_eur_cell, 0.0)
+            shop_stock = parse_number_or_none(shop_stock_text, int, 0)
+            if price is None or cost is None or shop_stock is None:
+                QMessageBox.warning(self, "Грешка", f"Невалидни числови данни: {price_text!r}, {cost_text!r}, {shop_stock_text!r}")
                 return
             
             # Parse weight back to grams
@@ -9009,8 +9226,7 @@ class MainWindow(QMainWindow):
                 shops = self.db.get_all_shops()
                 logger.info(f"Loading {len(shops)} shops into combo box")
                 
-                for shop in sorted(shops, key=lambda x: x[1]):  # Sort by shop name
-                    self.shop_combo.addItem(shop[1])
+                self.shop_combo.addItems(sorted(shop[1] for shop in shops))  # Sort by shop name
                 
                 # Restore selection if the shop still exists, otherwise select first available
                 if current_shop and self.shop_combo.count() > 0:
@@ -9060,8 +9276,7 @@ class MainWindow(QMainWindow):
                     # Clear and reload
                     self.sales_shop_combo.clear()
                     shops = self.db.get_all_shops()
-                    for shop in shops:
-                        self.sales_shop_combo.addItem(shop[1])
+                    self.sales_shop_combo.addItems([shop[1] for shop in shops])
                     
                     # Restore selection or select first available
                     if current_sales_shop and self.sales_shop_combo.count() > 0:
@@ -9323,6 +9538,7 @@ class MainWindow(QMainWindow):
                 if hasattr(self, 'db_stats_cards'):
                     integrity_status = self.check_database_integrity()
                     self.db_stats_cards["integrity_status"].value_label.setText(integrity_status)
+                    self._db_stats_dirty = False
                         
         except Exception as e:
             logger.error(f"Error updating database statistics: {e}")
@@ -9385,6 +9601,8 @@ class MainWindow(QMainWindow):
                 
                 actions_layout.addStretch()
                 self.backup_list.setCellWidget(row, 3, actions_widget)
+            
+            self._backup_list_dirty = False
                 
         except Exception as e:
             logger.error(f"Error loading backup list: {e}")
@@ -9403,6 +9621,9 @@ class MainWindow(QMainWindow):
             
             with open(get_persistent_path('data/backup_info.json'), 'w', encoding='utf-8') as f:
                 json.dump(backup_info, f, indent=2)
+            
+            # The "last backup" card shows this time
+            self.mark_database_stats_dirty()
                 
         except Exception as e:
             logger.error(f"Error saving backup time: {e}")
@@ -9501,7 +9722,7 @@ class MainWindow(QMainWindow):
                     logger.info(f"Deleted backup file: {file_path}")
                     
                     # Refresh the backup list
-                    self.load_backup_list()
+                    self.mark_backup_list_dirty()
                     
                     QMessageBox.information(self, "Успех", f"Резервното копие '{filename}' беше изтрито успешно.")
                 else:
@@ -9533,6 +9754,22 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'backup_watcher'):
                 self.backup_watcher.deleteLater()
                 logger.info("Backup file watcher cleaned up")
+            
+            # Let a running export finish writing its files
+            if self._export_job is not None:
+                self._export_job[0].quit()
+                self._export_job[0].wait()
+            
+            # Close the shared database connection (checkpoints the WAL file)
+            self.db.close()
+            
+            format_int_with_spaces.cache_clear()
+            format_grams_int.cache_clear()
+            parse_grams_text.cache_clear()
+            dual_currency_text.cache_clear()
+            format_eur_amount.cache_clear()
+            format_lev_amount.cache_clear()
+            parse_eur_cell.cache_clear()
         except Exception as e:
             logger.error(f"Error during application close: {e}")
         finally:
@@ -9789,37 +10026,39 @@ class MainWindow(QMainWindow):
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Disable foreign key constraints temporarily
-                cursor.execute("PRAGMA foreign_keys = OFF")
-                
-                # Get all table names (excluding system tables)
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT IN ('sqlite_sequence', 'sqlite_master')")
-                tables = [row[0] for row in cursor.fetchall()]
+                # Disable foreign key constraints while the tables are cleared and reseeded;
+                # the wipe, default shop and barcode sequence commit as one transaction
+                with self.db.foreign_keys_disabled(conn):
+                    # Get all table names (excluding system tables)
+                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT IN ('sqlite_sequence', 'sqlite_master')")
+                    tables = [row[0] for row in cursor.fetchall()]
                 
-                # Optimized: Clear all tables in one transaction
-                try:
-                    for table in tables:
-                        cursor.execute(f"DELETE FROM {table}")
-                        logger.info(f"Cleared table: {table}")
+                    # Optimized: Clear all tables in one transaction
+                    try:
+                        for table in tables:
+                            cursor.execute(f"DELETE FROM {table}")
+                            logger.info(f"Cleared table: {table}")
                     
-                    # Reset auto increment counters
-                    cursor.execute("DELETE FROM sqlite_sequence")
+                        # Reset auto increment counters
+                        cursor.execute("DELETE FROM sqlite_sequence")
                     
-                    logger.info("All database tables cleared successfully")
-                except Exception as e:
-                    logger.warning(f"Error clearing tables: {e}")
-                
-                # Re-enable foreign key constraints
-                cursor.execute("PRAGMA foreign_keys = ON")
-                
-                # Create default shop
-                cursor.execute("INSERT INTO shops (name) VALUES (?)", ("Магазин 1",))
+                        logger.info("All database tables cleared successfully")
+                    except Exception as e:
+                        logger.warning(f"Error clearing tables: {e}")
+                    
+                    # Create default shop
+                    cursor.execute("INSERT INTO shops (name) VALUES (?)", ("Магазин 1",))
+                    self.db.invalidate_shop_cache()
+                    
+                    # Reset barcode sequence
+                    try:
+                        cursor.execute("INSERT INTO barcode_sequence (id, next_val) VALUES (1, 1000000)")
+                    except:
+                        pass  # Table might not exist
                 
-                # Reset barcode sequence
-                try:
-                    cursor.execute("INSERT INTO barcode_sequence (id, next_val) VALUES (1, 1000000)")
-                except:
-                    pass  # Table might not exist
+                # The steps below go through Database methods whose own get_connection() blocks
+                # share this connection and commit as they finish, so they are not atomic with
+                # the wipe above; each runs in its own try block and failures are only logged
                 
                 # Create default user with password "0000"
                 try:
@@ -9942,12 +10181,10 @@ class MainWindow(QMainWindow):
                     shops = self.db.get_all_shops()
                     if hasattr(self, 'shop_combo'):
                         self.shop_combo.clear()
-                        for shop in shops:
-                            self.shop_combo.addItem(shop[1])
+                        self.shop_combo.addItems([shop[1] for shop in shops])
                     if hasattr(self, 'sales_shop_combo'):
                         self.sales_shop_combo.clear()
-                        for shop in shops:
-                            self.sales_shop_combo.addItem(shop[1])
+                        self.sales_shop_combo.addItems([shop[1] for shop in shops])
                     
                     logger.info("Basic UI reset completed successfully")
                 except Exception as ui_error:
@@ -10991,6 +11228,7 @@ class MainWindow(QMainWindow):
                         backup_path = self.db.create_backup()
                         if backup_path:
                             print(f"💾 Backup created before import: {backup_path}")
+                            self.mark_backup_list_dirty()
                         else:
                             QMessageBox.warning(
                                 self, "Предупреждение", 
@@ -11030,10 +11268,9 @@ class MainWindow(QMainWindow):
                         QMessageBox.information(self, "Успех", result_msg)
                         
                         # Reload all data after successful import
-                        self.load_data()
+                        self.reload_after_import()
                         self.load_sales()
                         self.load_shop_inventory()
-                        self.update_reports_and_database_stats()
                         
                     else:
                         QMessageBox.critical(
@@ -11046,6 +11283,13 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Грешка", f"Грешка при JSON импорт: {str(e)}")
     
+    def reload_after_import(self):
+        """Reload views and statistics after an import rewrote tables with raw SQL"""
+        # The imports DELETE and re-INSERT shops directly, bypassing the DB layer's cache
+        self.db.invalidate_shop_cache()
+        self.load_data()
+        self.update_reports_and_database_stats()
+    
     def safe_import_with_validation(self, file_path, import_data):
         """Safely import data with structure validation and error handling"""
         try:
@@ -11053,84 +11297,83 @@ class MainWindow(QMainWindow):
                 cursor = conn.cursor()
                 
                 # Disable foreign keys during import
-                cursor.execute("PRAGMA foreign_keys = OFF")
-                
-                imported_tables = []
-                skipped_tables = []
+                with self.db.foreign_keys_disabled(conn):
+                    imported_tables = []
+                    skipped_tables = []
                 
-                for table_name, table_data in import_data.items():
-                    if table_name.startswith('_') or table_name.startswith('sqlite_'):
-                        continue
-                    
-                    try:
-                        # Validate table structure
-                        if not self.validate_import_table_structure(cursor, table_name, table_data):
-                            skipped_tables.append(f"{table_name} (structure mismatch)")
+                    for table_name, table_data in import_data.items():
+                        if table_name.startswith('_') or table_name.startswith('sqlite_'):
                             continue
+                    
+                        try:
+                            # Validate table structure
+                            if not self.validate_import_table_structure(cursor, table_name, table_data):
+                                skipped_tables.append(f"{table_name} (structure mismatch)")
+                                continue
                         
-                        # Clear existing data
-                        cursor.execute(f"DELETE FROM {table_name}")
+                            # Clear existing data
+                            cursor.execute(f"DELETE FROM {table_name}")
                         
-                        # Import data
-                        if 'data' in table_data:
-                            columns = table_data['columns']
-                            rows = table_data['data']
-                        else:
-                            # Legacy format
-                            columns = table_data.get('columns', [])
-                            rows = table_data.get('rows', [])
+                            # Import data
+                            if 'data' in table_data:
+                                columns = table_data['columns']
+                                rows = table_data['data']
+                            else:
+                                # Legacy format
+                                columns = table_data.get('columns', [])
+                                rows = table_data.get('rows', [])
                         
-                        if rows:
-                            placeholders = ", ".join(["?" for _ in columns])
-                            imported_row_count = 0
+                            if rows:
+                                placeholders = ", ".join(["?" for _ in columns])
+                                imported_row_count = 0
                             
-                            for row_data in rows:
-                                try:
-                                    if isinstance(row_data, dict):
-                                        values = [row_data.get(col) for col in columns]
-                                    else:
-                                        values = list(row_data)
+                                for row_data in rows:
+                                    try:
+                                        if isinstance(row_data, dict):
+                                            values = [row_data.get(col) for col in columns]
+                                        else:
+                                            values = list(row_data)
                                     
-                                    # Handle None values and binary data
-                                    processed_values = []
-                                    for value in values:
-                                        if value == '' or value == 'None':
-                                            processed_values.append(None)
-                                        elif isinstance(value, dict) and value.get("_type") == "binary":
-                                            # Handle binary data with base64 decoding
-                                            if value.get("_encoding") == "base64":
-                                                import base64
-                                                binary_value = base64.b64decode(value["_data"])
-                                                processed_values.append(binary_value)
-                                            else:
+                                        # Handle None values and binary data
+                                        processed_values = []
+                                        for value in values:
+                                            if value == '' or value == 'None':
                                                 processed_values.append(None)
-                                        elif isinstance(value, dict) and "_type" in value:
-                                            # Handle other typed data
-                                            processed_values.append(value.get("_data"))
-                                        else:
-                                            processed_values.append(value)
+                                            elif isinstance(value, dict) and value.get("_type") == "binary":
+                                                # Handle binary data with base64 decoding
+                                                if value.get("_encoding") == "base64":
+                                                    import base64
+                                                    binary_value = base64.b64decode(value["_data"])
+                                                    processed_values.append(binary_value)
+                                                else:
+                                                    processed_values.append(None)
+                                            elif isinstance(value, dict) and "_type" in value:
+                                                # Handle other typed data
+                                                processed_values.append(value.get("_data"))
+                                            else:
+                                                processed_values.append(value)
                                     
-                                    cursor.execute(
-                                        f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})",
-                                        processed_values
-                                    )
-                                    imported_row_count += 1
+                                        cursor.execute(
+                                            f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})",
+                                            processed_values
+                                        )
+                                        imported_row_count += 1
                                     
-                                except Exception as row_error:
-                                    logger.warning(f"Skipped row in {table_name}: {row_error}")
-                                    continue
+                                    except Exception as row_error:
+                                        logger.warning(f"Skipped row in {table_name}: {row_error}")
+                                        continue
                             
-                            imported_tables.append(f"{table_name} ({imported_row_count} rows)")
-                        else:
-                            imported_tables.append(f"{table_name} (empty)")
+                                imported_tables.append(f"{table_name} ({imported_row_count} rows)")
+                            else:
+                                imported_tables.append(f"{table_name} (empty)")
                         
-                    except Exception as table_error:
-                        logger.error(f"Error importing table {table_name}: {table_error}")
-                        skipped_tables.append(f"{table_name} (error: {str(table_error)[:50]})")
+                        except Exception as table_error:
+                            logger.error(f"Error importing table {table_name}: {table_error}")
+                            skipped_tables.append(f"{table_name} (error: {str(table_error)[:50]})")
                 
-                # Re-enable foreign keys
-                cursor.execute("PRAGMA foreign_keys = ON")
-                conn.commit()
+                # The shops table may have been rewritten - even when the import is reported
+                # as failed and the caller skips the reload
+                self.db.invalidate_shop_cache()
                 
                 # Show detailed results
                 if imported_tables or skipped_tables:
@@ -11319,8 +11562,7 @@ class MainWindow(QMainWindow):
                             )
                         
                         # Reload data
-                        self.load_data()
-                        self.update_reports_and_database_stats()
+                        self.reload_after_import()
                 
         except Exception as e:
             QMessageBox.critical(self, "Грешка", f"Грешка при CSV импорт: {str(e)}")
@@ -11642,8 +11884,8 @@ class MainWindow(QMainWindow):
             self.save_last_backup_time()
             
             QMessageBox.information(self, "Успех", f"Резервното копие е създадено успешно в:\n{backup_path}")
-            self.load_backup_list()  # Refresh backup list
-            self.update_database_statistics()  # Update database stats
+            self.mark_backup_list_dirty()  # Refresh backup list
+            self.mark_database_stats_dirty()  # Update database stats
         except Exception as e:
             QMessageBox.critical(self, "Грешка", f"Неуспешно създаване на резервно копие: {str(e)}")
 
@@ -11762,8 +12004,7 @@ class MainWindow(QMainWindow):
                     conn.commit()
                 
                 QMessageBox.information(self, "Успех", "Данните са импортирани успешно")
-                self.load_data()  # Reload all data after import
-                self.update_reports_and_database_stats()  # Update all statistics
+                self.reload_after_import()  # Reload all data and statistics after import
         except Exception as e:
             QMessageBox.critical(self, "Грешка", f"Неуспешен импорт на данни: {str(e)}")
 
@@ -11814,6 +12055,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Грешка", f"Грешка при генериране на баркод: {str(e)}")
 
+    @pyqtSlot()
     def update_barcode_preview(self):
         """Update the barcode preview using Citizen CLP 631 compatible method"""
         try:
@@ -11825,6 +12067,20 @@ class MainWindow(QMainWindow):
             # Get the current barcode
             current_barcode = self.barcode_input.text()
             
+            # Reuse the rendered label if nothing that affects it changed
+            include_grams = self.include_grams_checkbox.isChecked()
+            preview_key = (
+                current_barcode, self.category_input.currentText(), self.price_input.value(),
+                self.weight_input.value() if include_grams else None, include_grams,
+                self.include_lev_price_checkbox.isChecked(), self.invert_prices_checkbox.isChecked(),
+                self.barcode_preview.width(), self.barcode_preview.height(),
+            )
+            cached_preview = self._label_preview_cache.get(preview_key)
+            if cached_preview is not None:
+                self.current_label, self.barcode_image, scaled_pixmap = cached_preview
+                self.barcode_preview.setPixmap(scaled_pixmap)
+                return
+            
             # Clear the preview first to force refresh
             self.barcode_preview.clear()
             
@@ -12044,6 +12300,11 @@ class MainWindow(QMainWindow):
             self.barcode_preview.setPixmap(scaled_pixmap)
             self.barcode_preview.update()  # Force widget update
             
+            # Keep the printable label with its preview - toggling options back is a lookup
+            if len(self._label_preview_cache) >= 32:
+                self._label_preview_cache.clear()
+            self._label_preview_cache[preview_key] = (label_img, self.barcode_image, scaled_pixmap)
+            
             # Clean up temporary file
             try:
                 os.remove(temp_file + ".png")
@@ -12366,7 +12627,7 @@ class MainWindow(QMainWindow):
         name_layout.addWidget(self.bc_name_entry)
         clear_name_btn = QPushButton("✕")
         clear_name_btn.setFont(QFont('Segoe UI', 10))
-        clear_name_btn.clicked.connect(lambda: self.bc_name_entry.clear())
+        clear_name_btn.clicked.connect(self.bc_name_entry.clear)
         name_layout.addWidget(clear_name_btn)
         left_layout.addWidget(name_label)
         left_layout.addLayout(name_layout)
@@ -12379,7 +12640,7 @@ class MainWindow(QMainWindow):
         price_layout.addWidget(self.bc_price_entry)
         clear_price_btn = QPushButton("✕")
         clear_price_btn.setFont(QFont('Segoe UI', 10))
-        clear_price_btn.clicked.connect(lambda: self.bc_price_entry.clear())
+        clear_price_btn.clicked.connect(self.bc_price_entry.clear)
         price_layout.addWidget(clear_price_btn)
         left_layout.addWidget(price_label)
         left_layout.addLayout(price_layout)
@@ -12402,7 +12663,7 @@ class MainWindow(QMainWindow):
         grams_layout.addWidget(self.bc_grams_entry)
         clear_grams_btn = QPushButton("✕")
         clear_grams_btn.setFont(QFont('Segoe UI', 10))
-        clear_grams_btn.clicked.connect(lambda: self.bc_grams_entry.clear())
+        clear_grams_btn.clicked.connect(self.bc_grams_entry.clear)
         grams_layout.addWidget(clear_grams_btn)
         left_layout.addWidget(grams_label)
         left_layout.addLayout(grams_layout)
@@ -12415,7 +12676,7 @@ class MainWindow(QMainWindow):
         qty_layout.addWidget(self.bc_qty_entry)
         clear_qty_btn = QPushButton("✕")
         clear_qty_btn.setFont(QFont('Segoe UI', 10))
-        clear_qty_btn.clicked.connect(lambda: self.bc_qty_entry.clear())
+        clear_qty_btn.clicked.connect(self.bc_qty_entry.clear)
         qty_layout.addWidget(clear_qty_btn)
         left_layout.addWidget(qty_label)
         left_layout.addLayout(qty_layout)
@@ -12434,7 +12695,7 @@ class MainWindow(QMainWindow):
 
         clear_image_btn = QPushButton("✕")
         clear_image_btn.setFont(QFont('Segoe UI', 10))
-        clear_image_btn.clicked.connect(lambda: [setattr(self, 'bc_image_path', ''), self.bc_image_label.clear()])
+        clear_image_btn.clicked.connect(self.clear_bc_image)
         left_layout.addWidget(clear_image_btn)
 
         # Buttons
@@ -12476,6 +12737,23 @@ class MainWindow(QMainWindow):
 
         return widget
 
+    def clear_bc_image(self):
+        """Clear the uploaded label image"""
+        self.bc_image_path = ""
+        self.bc_image_label.clear()
+
+    @pyqtSlot(str)
+    def on_custom_combo_text_changed(self, current_text):
+        """Route category/metal/stone combo changes to handle_custom_input"""
+        combo_box = self.sender()
+        custom_values_set = {
+            self.category_input: self.custom_categories,
+            self.metal_input: self.custom_metals,
+            self.stone_input: self.custom_stones,
+        }.get(combo_box)
+        if custom_values_set is not None:
+            self.handle_custom_input(combo_box, custom_values_set, current_text)
+
     def handle_custom_input(self, combo_box, custom_values_set, current_text):
         """Handle custom input for combo boxes with proper capitalization"""
         if current_text == "Друго":
@@ -13466,44 +13744,9 @@ class MainWindow(QMainWindow):
             from reportlab.lib import colors
             from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
             from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.pdfbase import pdfmetrics
-            from reportlab.pdfbase.ttfonts import TTFont
-            import os
             
-            # Register fonts that support Cyrillic characters
-            try:
-                # Try to use system fonts that support Cyrillic
-                font_paths = [
-                    "fonts/arial.ttf",  # Our project font
-                    "C:/Windows/Fonts/arial.ttf",  # Windows system font
-                    "C:/Windows/Fonts/calibri.ttf",  # Alternative Windows font
-                    "/System/Library/Fonts/Arial.ttf",  # macOS system font
-                    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"  # Linux font
-                ]
-                
-                font_registered = False
-                for font_path in font_paths:
-                    if os.path.exists(font_path):
-                        try:
-                            pdfmetrics.registerFont(TTFont('CyrillicFont', font_path))
-                            pdfmetrics.registerFont(TTFont('CyrillicFont-Bold', font_path))  # Use same font for bold
-                            font_registered = True
-                            break
-                        except Exception:
-                            continue
-                
-                if not font_registered:
-                    # Fallback to built-in font (may not display Cyrillic properly)
-                    cyrillic_font = 'Helvetica'
-                    cyrillic_font_bold = 'Helvetica-Bold'
-                else:
-                    cyrillic_font = 'CyrillicFont'
-                    cyrillic_font_bold = 'CyrillicFont-Bold'
-                    
-            except Exception:
-                # Fallback to built-in fonts
-                cyrillic_font = 'Helvetica'
-                cyrillic_font_bold = 'Helvetica-Bold'
+            # Fonts that support Cyrillic characters, registered once per session
+            cyrillic_font, cyrillic_font_bold = register_cyrillic_fonts()
             
             # Get file path with standardized Bulgarian filename
             exports_dir = self.get_exports_directory()
@@ -13610,7 +13853,7 @@ class MainWindow(QMainWindow):
                         f"{item_data['price'] * item_data['expected_qty']:.2f} €" if item_data['price'] and item_data['expected_qty'] else "0.00 €"
                     ])
                 
-                missing_table = Table(missing_data)
+                missing_table = LongTable(missing_data, repeatRows=1)  # Header repeats on every page
                 missing_table.setStyle(TableStyle([
                     # Header styling for missing items - standardized grey headers
                     ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
@@ -14181,7 +14424,7 @@ class MainWindow(QMainWindow):
                         status
                     ])
                 
-                items_table = Table(items_data)
+                items_table = LongTable(items_data, repeatRows=1)  # Header repeats on every page
                 items_table.setStyle(TableStyle([
                     ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
                     ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),